@@ -41,17 +41,20 @@ def build_cython_extensions() -> None:
 
     package_path = "pyiceberg"
 
-    extension = Extension(
-        # Your .pyx file will be available to cpython at this location.
-        name="pyiceberg.avro.decoder_fast",
-        sources=[
-            os.path.join(package_path, "avro", "decoder_fast.pyx"),
-        ],
-        extra_compile_args=extra_compile_args,
-        language="c",
-    )
+    extensions = [
+        Extension(
+            # Your .pyx file will be available to cpython at this location.
+            name=f"pyiceberg.avro.{module}",
+            sources=[
+                os.path.join(package_path, "avro", f"{module}.pyx"),
+            ],
+            extra_compile_args=extra_compile_args,
+            language="c",
+        )
+        for module in ("decoder_fast", "encoder_fast")
+    ]
 
-    ext_modules = cythonize([extension], include_path=list(package_path), language_level=3, annotate=True)
+    ext_modules = cythonize(extensions, include_path=list(package_path), language_level=3, annotate=True)
     dist = Distribution({"ext_modules": ext_modules})
     cmd = build_ext(dist)
     cmd.ensure_finalized()
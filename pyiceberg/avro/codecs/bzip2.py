@@ -16,6 +16,8 @@
 # under the License.
 from __future__ import annotations
 
+from typing import Optional
+
 from pyiceberg.avro.codecs.codec import Codec
 
 try:
@@ -23,8 +25,8 @@ try:
 
     class BZip2Codec(Codec):
         @staticmethod
-        def compress(data: bytes) -> tuple[bytes, int]:
-            compressed_data = bz2.compress(data)
+        def compress(data: bytes, level: Optional[int] = None) -> tuple[bytes, int]:
+            compressed_data = bz2.compress(data, 9 if level is None else level)
             return compressed_data, len(compressed_data)
 
         @staticmethod
@@ -35,7 +37,7 @@ except ImportError:
 
     class BZip2Codec(Codec):  # type: ignore
         @staticmethod
-        def compress(data: bytes) -> tuple[bytes, int]:
+        def compress(data: bytes, level: Optional[int] = None) -> tuple[bytes, int]:
             raise ImportError("Python bzip2 support not installed, please install the extension")
 
         @staticmethod
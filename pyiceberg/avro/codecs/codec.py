@@ -17,6 +17,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from typing import Optional
 
 
 class Codec(ABC):
@@ -24,7 +25,7 @@ class Codec(ABC):
 
     @staticmethod
     @abstractmethod
-    def compress(data: bytes) -> tuple[bytes, int]: ...
+    def compress(data: bytes, level: Optional[int] = None) -> tuple[bytes, int]: ...
 
     @staticmethod
     @abstractmethod
@@ -17,16 +17,17 @@
 from __future__ import annotations
 
 import zlib
+from typing import Optional
 
 from pyiceberg.avro.codecs.codec import Codec
 
 
 class DeflateCodec(Codec):
     @staticmethod
-    def compress(data: bytes) -> tuple[bytes, int]:
-        # The first two characters and last character are zlib
+    def compress(data: bytes, level: Optional[int] = None) -> tuple[bytes, int]:
+        # The first two and last four bytes are the zlib
         # wrappers around deflate data.
-        compressed_data = zlib.compress(data)[2:-1]
+        compressed_data = zlib.compress(data, -1 if level is None else level)[2:-4]
         return compressed_data, len(compressed_data)
 
     @staticmethod
@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import binascii
 import struct
+from typing import Optional
 
 from pyiceberg.avro.codecs.codec import Codec
 
@@ -42,7 +43,8 @@ try:
                 raise ValueError("Checksum failure")
 
         @staticmethod
-        def compress(data: bytes) -> tuple[bytes, int]:
+        def compress(data: bytes, level: Optional[int] = None) -> tuple[bytes, int]:
+            # Snappy does not have compression levels
             compressed_data = snappy.compress(data)
             # A 4-byte, big-endian CRC32 checksum
             compressed_data += STRUCT_CRC32.pack(binascii.crc32(data) & 0xFFFFFFFF)
@@ -51,9 +53,8 @@ try:
         @staticmethod
         def decompress(data: bytes) -> bytes:
             # Compressed data includes a 4-byte CRC32 checksum
-            data = data[0:-4]
-            uncompressed = snappy.decompress(data)
             checksum = data[-4:]
+            uncompressed = snappy.decompress(data[0:-4])
             SnappyCodec._check_crc32(uncompressed, checksum)
             return uncompressed
 
@@ -61,7 +62,7 @@ except ImportError:
 
     class SnappyCodec(Codec):  # type: ignore
         @staticmethod
-        def compress(data: bytes) -> tuple[bytes, int]:
+        def compress(data: bytes, level: Optional[int] = None) -> tuple[bytes, int]:
             raise ImportError("Snappy support not installed, please install using `pip install pyiceberg[snappy]`")
 
         @staticmethod
@@ -17,6 +17,7 @@
 from __future__ import annotations
 
 from io import BytesIO
+from typing import Optional
 
 from pyiceberg.avro.codecs.codec import Codec
 
@@ -25,8 +26,8 @@ try:
 
     class ZStandardCodec(Codec):
         @staticmethod
-        def compress(data: bytes) -> tuple[bytes, int]:
-            compressed_data = ZstdCompressor().compress(data)
+        def compress(data: bytes, level: Optional[int] = None) -> tuple[bytes, int]:
+            compressed_data = ZstdCompressor(level=3 if level is None else level).compress(data)
             return compressed_data, len(compressed_data)
 
         @staticmethod
@@ -39,13 +40,13 @@ try:
                     if not chunk:
                         break
                     uncompressed.extend(chunk)
-            return uncompressed
+            return bytes(uncompressed)
 
 except ImportError:
 
     class ZStandardCodec(Codec):  # type: ignore
         @staticmethod
-        def compress(data: bytes) -> tuple[bytes, int]:
+        def compress(data: bytes, level: Optional[int] = None) -> tuple[bytes, int]:
             raise ImportError("Zstandard support not installed, please install using `pip install pyiceberg[zstandard]`")
 
         @staticmethod
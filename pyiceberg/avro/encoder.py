@@ -14,6 +14,7 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+from typing import Mapping
 from uuid import UUID
 
 from pyiceberg.avro import STRUCT_DOUBLE, STRUCT_FLOAT
@@ -21,6 +22,17 @@ from pyiceberg.io import OutputStream
 from pyiceberg.typedef import UTF8
 
 
+def _zigzag_varint(integer: int) -> bytearray:
+    """Encode an integer using variable-length zig-zag coding."""
+    datum = (integer << 1) ^ (integer >> 63)
+    encoded = bytearray()
+    while (datum & ~0x7F) != 0:
+        encoded.append((datum & 0x7F) | 0x80)
+        datum >>= 7
+    encoded.append(datum)
+    return encoded
+
+
 class BinaryEncoder:
     """Encodes Python physical types into bytes."""
 
@@ -38,15 +50,11 @@ class BinaryEncoder:
         Args:
             boolean: The boolean to write.
         """
-        self.write(bytearray([bool(boolean)]))
+        self.write(b"\x01" if boolean else b"\x00")
 
     def write_int(self, integer: int) -> None:
         """Integer and long values are written using variable-length zig-zag coding."""
-        datum = (integer << 1) ^ (integer >> 63)
-        while (datum & ~0x7F) != 0:
-            self.write(bytearray([(datum & 0x7F) | 0x80]))
-            datum >>= 7
-        self.write(bytearray([datum]))
+        self.write(_zigzag_varint(integer))
 
     def write_float(self, f: float) -> None:
         """Write a float as 4 bytes."""
@@ -61,6 +69,23 @@ class BinaryEncoder:
         self.write_int(len(b))
         self.write(b)
 
+    def write_int_int_dict(self, d: Mapping[int, int]) -> None:
+        """Write the keys and values of a map of ints to ints, without the block count."""
+        encoded = bytearray()
+        for key, value in d.items():
+            encoded += _zigzag_varint(key)
+            encoded += _zigzag_varint(value)
+        self.write(encoded)
+
+    def write_int_bytes_dict(self, d: Mapping[int, bytes]) -> None:
+        """Write the keys and values of a map of ints to bytes, without the block count."""
+        encoded = bytearray()
+        for key, value in d.items():
+            encoded += _zigzag_varint(key)
+            encoded += _zigzag_varint(len(value))
+            encoded += value
+        self.write(encoded)
+
     def write_utf8(self, s: str) -> None:
         """Encode a string as a long followed by that many bytes of UTF-8 encoded character data."""
         self.write_bytes(s.encode(UTF8))
@@ -74,3 +99,36 @@ class BinaryEncoder:
         if len(uuid.bytes) != 16:
             raise ValueError(f"Expected UUID to have 16 bytes, got: len({uuid.bytes!r})")
         return self.write(uuid.bytes)
+
+
+class InMemoryBinaryEncoder(BinaryEncoder):
+    """Encodes Python physical types into a growable in-memory buffer."""
+
+    _buffer: bytearray
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+
+    def write(self, b: bytes) -> None:
+        self._buffer += b
+
+    def tell(self) -> int:
+        """Return the number of bytes that are written."""
+        return len(self._buffer)
+
+    def getvalue(self) -> bytes:
+        """Return the bytes that are written."""
+        return bytes(self._buffer)
+
+
+def new_encoder() -> InMemoryBinaryEncoder:
+    try:
+        from pyiceberg.avro.encoder_fast import CythonBinaryEncoder
+
+        return CythonBinaryEncoder()
+    except ModuleNotFoundError:
+        import warnings
+
+        warnings.warn("Falling back to pure Python Avro encoder, missing Cython implementation")
+
+        return InMemoryBinaryEncoder()
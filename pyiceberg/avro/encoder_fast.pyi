@@ -0,0 +1,60 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from typing import Mapping
+from uuid import UUID
+
+from pyiceberg.avro.encoder import InMemoryBinaryEncoder
+
+class CythonBinaryEncoder(InMemoryBinaryEncoder):
+    def __init__(self) -> None:
+        pass
+
+    def tell(self) -> int:
+        pass
+
+    def getvalue(self) -> bytes:
+        pass
+
+    def write(self, b: bytes) -> None:
+        pass
+
+    def write_boolean(self, boolean: bool) -> None:
+        pass
+
+    def write_int(self, integer: int) -> None:
+        pass
+
+    def write_float(self, f: float) -> None:
+        pass
+
+    def write_double(self, f: float) -> None:
+        pass
+
+    def write_bytes(self, b: bytes) -> None:
+        pass
+
+    def write_utf8(self, s: str) -> None:
+        pass
+
+    def write_uuid(self, uuid: UUID) -> None:
+        pass
+
+    def write_int_int_dict(self, d: Mapping[int, int]) -> None:
+        pass
+
+    def write_int_bytes_dict(self, d: Mapping[int, bytes]) -> None:
+        pass
@@ -0,0 +1,152 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import cython
+from pyiceberg.avro import STRUCT_DOUBLE, STRUCT_FLOAT
+from cpython.mem cimport PyMem_Malloc, PyMem_Realloc, PyMem_Free
+from libc.string cimport memcpy
+from libc.stdint cimport uint64_t, int64_t
+
+# The maximum number of bytes of a zig-zag encoded long
+cdef enum:
+    MAX_VARINT_SIZE = 10
+
+# The initial capacity of the buffer, which doubles whenever it is full
+cdef enum:
+    INITIAL_CAPACITY = 4096
+
+
+@cython.final
+cdef class CythonBinaryEncoder:
+    """Implement a BinaryEncoder that writes into a growable in-memory buffer."""
+
+    # This is the buffer that the data is written to.
+    cdef unsigned char *_data
+
+    # This is the number of bytes that are written to the buffer.
+    cdef uint64_t _size
+
+    # This is the number of bytes that are allocated for the buffer.
+    cdef uint64_t _capacity
+
+    def __cinit__(self) -> None:
+        self._data = <unsigned char *> PyMem_Malloc(INITIAL_CAPACITY * sizeof(char))
+        if not self._data:
+            raise MemoryError()
+        self._size = 0
+        self._capacity = INITIAL_CAPACITY
+
+    def __dealloc__(self):
+        PyMem_Free(self._data)
+
+    cdef inline void _reserve(self, uint64_t n) except *:
+        """Make sure that n more bytes fit into the buffer."""
+        cdef uint64_t capacity = self._capacity
+        cdef unsigned char *data
+        if self._size + n <= capacity:
+            return
+        while self._size + n > capacity:
+            capacity *= 2
+        data = <unsigned char *> PyMem_Realloc(self._data, capacity * sizeof(char))
+        if not data:
+            raise MemoryError()
+        self._data = data
+        self._capacity = capacity
+
+    cdef inline void _write_varint(self, int64_t integer):
+        """Write an integer using variable-length zig-zag coding, the buffer should have room for it."""
+        cdef uint64_t datum = (<uint64_t> integer << 1) ^ <uint64_t> (integer >> 63)
+        cdef unsigned char *current = self._data + self._size
+        while datum & ~(<uint64_t> 0x7F):
+            current[0] = (datum & 0x7F) | 0x80
+            current += 1
+            datum >>= 7
+        current[0] = datum
+        self._size = current + 1 - self._data
+
+    cdef inline void _write_buffer(self, const unsigned char[:] b) except *:
+        cdef uint64_t n = b.shape[0]
+        if n > 0:
+            self._reserve(n)
+            memcpy(self._data + self._size, &b[0], n)
+            self._size += n
+
+    cpdef uint64_t tell(self):
+        """Return the number of bytes that are written."""
+        return self._size
+
+    cpdef bytes getvalue(self):
+        """Return the bytes that are written."""
+        return self._data[0:self._size]
+
+    cpdef void write(self, b) except *:
+        """Write the bytes to the buffer."""
+        self._write_buffer(b)
+
+    cpdef void write_boolean(self, bint boolean) except *:
+        """Write a boolean as a single byte whose value is either 0 (false) or 1 (true)."""
+        self._reserve(1)
+        self._data[self._size] = 1 if boolean else 0
+        self._size += 1
+
+    cpdef void write_int(self, int64_t integer) except *:
+        """Integer and long values are written using variable-length zig-zag coding."""
+        self._reserve(MAX_VARINT_SIZE)
+        self._write_varint(integer)
+
+    cpdef void write_float(self, f: float) except *:
+        """Write a float as 4 bytes."""
+        self._write_buffer(STRUCT_FLOAT.pack(f))
+
+    cpdef void write_double(self, f: float) except *:
+        """Write a double as 8 bytes."""
+        self._write_buffer(STRUCT_DOUBLE.pack(f))
+
+    cpdef void write_bytes(self, b) except *:
+        """Bytes are encoded as a long followed by that many bytes of data."""
+        cdef const unsigned char[:] view = b
+        self._reserve(MAX_VARINT_SIZE)
+        self._write_varint(view.shape[0])
+        self._write_buffer(view)
+
+    cpdef void write_utf8(self, s) except *:
+        """Encode a string as a long followed by that many bytes of UTF-8 encoded character data."""
+        self.write_bytes(s.encode("utf-8"))
+
+    def write_uuid(self, uuid) -> None:
+        """Write UUID as a fixed[16]."""
+        if len(uuid.bytes) != 16:
+            raise ValueError(f"Expected UUID to have 16 bytes, got: len({uuid.bytes!r})")
+        self._write_buffer(uuid.bytes)
+
+    cpdef void write_int_int_dict(self, d: Dict[int, int]) except *:
+        """Write the keys and values of a map of ints to ints, without the block count."""
+        self._reserve(2 * MAX_VARINT_SIZE * len(d))
+        for key, value in d.items():
+            self._write_varint(key)
+            self._write_varint(value)
+
+    cpdef void write_int_bytes_dict(self, d: Dict[int, bytes]) except *:
+        """Write the keys and values of a map of ints to bytes, without the block count."""
+        cdef const unsigned char[:] view
+        for key, value in d.items():
+            view = value
+            self._reserve(2 * MAX_VARINT_SIZE + view.shape[0])
+            self._write_varint(key)
+            self._write_varint(view.shape[0])
+            if view.shape[0] > 0:
+                memcpy(self._data + self._size, &view[0], view.shape[0])
+                self._size += view.shape[0]
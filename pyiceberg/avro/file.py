@@ -19,7 +19,6 @@
 
 from __future__ import annotations
 
-import io
 import json
 import os
 from dataclasses import dataclass
@@ -29,20 +28,22 @@ from typing import (
     Callable,
     Dict,
     Generic,
+    Iterator,
     List,
     Optional,
+    Tuple,
     Type,
     TypeVar,
 )
 
 from pyiceberg.avro.codecs import KNOWN_CODECS
 from pyiceberg.avro.codecs.codec import Codec
-from pyiceberg.avro.decoder import BinaryDecoder, new_decoder
-from pyiceberg.avro.encoder import BinaryEncoder
+from pyiceberg.avro.decoder import BinaryDecoder, StreamingBinaryDecoder, new_decoder
+from pyiceberg.avro.encoder import BinaryEncoder, InMemoryBinaryEncoder, new_encoder
 from pyiceberg.avro.reader import Reader
 from pyiceberg.avro.resolver import construct_reader, construct_writer, resolve_reader, resolve_writer
 from pyiceberg.avro.writer import Writer
-from pyiceberg.io import InputFile, OutputFile, OutputStream
+from pyiceberg.io import InputFile, InputStream, OutputFile, OutputStream
 from pyiceberg.schema import Schema
 from pyiceberg.typedef import EMPTY_DICT, Record, StructProtocol
 from pyiceberg.types import (
@@ -134,6 +135,7 @@ class AvroFile(Generic[D]):
         "header",
         "schema",
         "reader",
+        "input_stream",
         "decoder",
         "block",
     )
@@ -145,6 +147,7 @@ class AvroFile(Generic[D]):
     schema: Schema
     reader: Reader
 
+    input_stream: InputStream
     decoder: BinaryDecoder
     block: Optional[Block[D]]
 
@@ -164,17 +167,24 @@ class AvroFile(Generic[D]):
     def __enter__(self) -> AvroFile[D]:
         """Generate a reader tree for the payload within an avro file.
 
+        The file is read sequentially, a block at a time, so only the block that
+        is being decoded is kept in memory.
+
         Return:
             A generator returning the AvroStructs.
         """
-        with self.input_file.open() as f:
-            self.decoder = new_decoder(f.read())
-        self.header = self._read_header()
-        self.schema = self.header.get_schema()
-        if not self.read_schema:
-            self.read_schema = self.schema
+        self.input_stream = self.input_file.open(seekable=False)
+        try:
+            self.decoder = StreamingBinaryDecoder(self.input_stream)
+            self.header = self._read_header()
+            self.schema = self.header.get_schema()
+            if not self.read_schema:
+                self.read_schema = self.schema
 
-        self.reader = resolve_reader(self.schema, self.read_schema, self.read_types, self.read_enums)
+            self.reader = resolve_reader(self.schema, self.read_schema, self.read_types, self.read_enums)
+        except BaseException:
+            self.input_stream.close()
+            raise
 
         return self
 
@@ -182,14 +192,20 @@ class AvroFile(Generic[D]):
         self, exctype: Optional[Type[BaseException]], excinst: Optional[BaseException], exctb: Optional[TracebackType]
     ) -> None:
         """Perform cleanup when exiting the scope of a 'with' statement."""
+        self.input_stream.close()
 
     def __iter__(self) -> AvroFile[D]:
         """Return an iterator for the AvroFile class."""
         return self
 
     def _read_block(self) -> int:
+        block_records, block_bytes = self._read_block_bytes(has_previous_block=self.block is not None)
+        self.block = Block(reader=self.reader, block_records=block_records, block_decoder=new_decoder(block_bytes))
+        return block_records
+
+    def _read_block_bytes(self, has_previous_block: bool) -> Tuple[int, bytes]:
         # If there is already a block, we'll have the sync bytes
-        if self.block:
+        if has_previous_block:
             sync_marker = self.decoder.read(SYNC_SIZE)
             if sync_marker != self.header.sync:
                 raise ValueError(f"Expected sync bytes {self.header.sync!r}, but got {sync_marker!r}")
@@ -199,8 +215,22 @@ class AvroFile(Generic[D]):
         if codec := self.header.compression_codec():
             block_bytes = codec.decompress(block_bytes)
 
-        self.block = Block(reader=self.reader, block_records=block_records, block_decoder=new_decoder(block_bytes))
-        return block_records
+        return block_records, block_bytes
+
+    def blocks(self) -> Iterator[Tuple[int, bytes]]:
+        """Return the number of records and the decompressed bytes of the remaining blocks.
+
+        This is an alternative to iterating over the file, for readers that decode
+        the records of a block themselves, for example with a projected reader.
+        """
+        has_previous_block = self.block is not None
+        while True:
+            try:
+                block = self._read_block_bytes(has_previous_block)
+            except EOFError:
+                return
+            has_previous_block = True
+            yield block
 
     def __next__(self) -> D:
         """Return the next item when iterating over the AvroFile class."""
@@ -228,6 +258,10 @@ class AvroOutputFile(Generic[D]):
     encoder: BinaryEncoder
     sync_bytes: bytes
     writer: Writer
+    block_encoder: InMemoryBinaryEncoder
+    block_records: int
+    compression_codec: str
+    compression_level: Optional[int]
 
     def __init__(
         self,
@@ -236,10 +270,17 @@ class AvroOutputFile(Generic[D]):
         schema_name: str,
         record_schema: Optional[Schema] = None,
         metadata: Dict[str, str] = EMPTY_DICT,
+        compression_codec: str = "null",
+        compression_level: Optional[int] = None,
     ) -> None:
+        if compression_codec not in KNOWN_CODECS:
+            raise ValueError(f"Unsupported codec: {compression_codec}")
+
         self.output_file = output_file
         self.file_schema = file_schema
         self.schema_name = schema_name
+        self.compression_codec = compression_codec
+        self.compression_level = compression_level
         self.sync_bytes = os.urandom(SYNC_SIZE)
         self.writer = (
             construct_writer(file_schema=self.file_schema)
@@ -247,6 +288,7 @@ class AvroOutputFile(Generic[D]):
             else resolve_writer(record_schema=record_schema, file_schema=self.file_schema)
         )
         self.metadata = metadata
+        self._reset_block()
 
     def __enter__(self) -> AvroOutputFile[D]:
         """
@@ -266,22 +308,50 @@ class AvroOutputFile(Generic[D]):
         self, exctype: Optional[Type[BaseException]], excinst: Optional[BaseException], exctb: Optional[TracebackType]
     ) -> None:
         """Perform cleanup when exiting the scope of a 'with' statement."""
+        if exctype is None:
+            self.flush_block()
         self.output_stream.close()
 
     def _write_header(self) -> None:
         json_schema = json.dumps(AvroSchemaConversion().iceberg_to_avro(self.file_schema, schema_name=self.schema_name))
-        meta = {**self.metadata, _SCHEMA_KEY: json_schema, _CODEC_KEY: "null"}
+        meta = {**self.metadata, _SCHEMA_KEY: json_schema, _CODEC_KEY: self.compression_codec}
         header = AvroFileHeader(magic=MAGIC, meta=meta, sync=self.sync_bytes)
         construct_writer(META_SCHEMA).write(self.encoder, header)
 
+    def _reset_block(self) -> None:
+        self.block_encoder = new_encoder()
+        self.block_records = 0
+
+    def append(self, obj: D) -> int:
+        """Encode the object into the pending block.
+
+        The block is written to the file on `flush_block`, or when the file is closed.
+
+        Returns:
+            The size of the pending block in bytes.
+        """
+        self.writer.write(self.block_encoder, obj)
+        self.block_records += 1
+        return self.block_encoder.tell()
+
+    def flush_block(self) -> None:
+        """Write the pending block to the file, when it contains any records."""
+        if self.block_records > 0:
+            block_content = self.block_encoder.getvalue()
+            if codec := KNOWN_CODECS[self.compression_codec]:
+                block_content, block_content_length = codec.compress(block_content, self.compression_level)
+            else:
+                block_content_length = len(block_content)
+
+            self.encoder.write_int(self.block_records)
+            self.encoder.write_int(block_content_length)
+            self.encoder.write(block_content)
+            self.encoder.write(self.sync_bytes)
+
+            self._reset_block()
+
     def write_block(self, objects: List[D]) -> None:
-        in_memory = io.BytesIO()
-        block_content_encoder = BinaryEncoder(output_stream=in_memory)
+        self.flush_block()
         for obj in objects:
-            self.writer.write(block_content_encoder, obj)
-        block_content = in_memory.getvalue()
-
-        self.encoder.write_int(len(objects))
-        self.encoder.write_int(len(block_content))
-        self.encoder.write(block_content)
-        self.encoder.write(self.sync_bytes)
+            self.append(obj)
+        self.flush_block()
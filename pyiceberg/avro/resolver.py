@@ -251,7 +251,7 @@ class EnumReader(Reader):
         return self.enum(self.reader.read(decoder))
 
     def skip(self, decoder: BinaryDecoder) -> None:
-        pass
+        self.reader.skip(decoder)
 
 
 class WriteSchemaResolver(PrimitiveWithPartnerVisitor[IcebergType, Writer]):
@@ -479,8 +479,12 @@ class SchemaPartnerAccessor(PartnerAccessor[IcebergType]):
 
         raise ResolveError(f"File/read schema are not aligned for schema, got {partner}")
 
+    # A partner of None means that the field is not part of the read schema, so it is skipped
+
     def field_partner(self, partner: Optional[IcebergType], field_id: int, field_name: str) -> Optional[IcebergType]:
-        if isinstance(partner, StructType):
+        if partner is None:
+            return None
+        elif isinstance(partner, StructType):
             field = partner.field(field_id)
         else:
             raise ResolveError(f"File/read schema are not aligned for struct, got {partner}")
@@ -488,19 +492,25 @@ class SchemaPartnerAccessor(PartnerAccessor[IcebergType]):
         return field.field_type if field else None
 
     def list_element_partner(self, partner_list: Optional[IcebergType]) -> Optional[IcebergType]:
-        if isinstance(partner_list, ListType):
+        if partner_list is None:
+            return None
+        elif isinstance(partner_list, ListType):
             return partner_list.element_type
 
         raise ResolveError(f"File/read schema are not aligned for list, got {partner_list}")
 
     def map_key_partner(self, partner_map: Optional[IcebergType]) -> Optional[IcebergType]:
-        if isinstance(partner_map, MapType):
+        if partner_map is None:
+            return None
+        elif isinstance(partner_map, MapType):
             return partner_map.key_type
 
         raise ResolveError(f"File/read schema are not aligned for map, got {partner_map}")
 
     def map_value_partner(self, partner_map: Optional[IcebergType]) -> Optional[IcebergType]:
-        if isinstance(partner_map, MapType):
+        if partner_map is None:
+            return None
+        elif isinstance(partner_map, MapType):
             return partner_map.value_type
 
         raise ResolveError(f"File/read schema are not aligned for map, got {partner_map}")
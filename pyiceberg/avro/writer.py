@@ -205,9 +205,16 @@ class MapWriter(Writer):
 
     def write(self, encoder: BinaryEncoder, val: Dict[Any, Any]) -> None:
         encoder.write_int(len(val))
-        for k, v in val.items():
-            self.key_writer.write(encoder, k)
-            self.value_writer.write(encoder, v)
+        if isinstance(self.key_writer, IntegerWriter) and isinstance(self.value_writer, IntegerWriter):
+            # The column metrics of the data files are maps of field-ids to ints or bytes,
+            # which are encoded in bulk since these are written for every data file
+            encoder.write_int_int_dict(val)
+        elif isinstance(self.key_writer, IntegerWriter) and isinstance(self.value_writer, BinaryWriter):
+            encoder.write_int_bytes_dict(val)
+        else:
+            for k, v in val.items():
+                self.key_writer.write(encoder, k)
+                self.value_writer.write(encoder, v)
         if len(val) > 0:
             encoder.write_int(0)
 
@@ -55,6 +55,7 @@ from pyiceberg.typedef import (
     Properties,
     RecursiveDict,
 )
+from pyiceberg.utils.concurrent import IO_POOL, ExecutorFactory, bounded_map
 from pyiceberg.utils.config import Config, merge_config
 
 if TYPE_CHECKING:
@@ -73,6 +74,7 @@ METADATA_LOCATION = "metadata_location"
 PREVIOUS_METADATA_LOCATION = "previous_metadata_location"
 MANIFEST = "manifest"
 MANIFEST_LIST = "manifest list"
+DATA_FILE = "data"
 PREVIOUS_METADATA = "previous metadata"
 METADATA = "metadata"
 URI = "uri"
@@ -222,6 +224,7 @@ def load_catalog(name: Optional[str] = None, **properties: Optional[str]) -> Cat
 def delete_files(io: FileIO, files_to_delete: Set[str], file_type: str) -> None:
     """Delete files.
 
+    The files are deleted concurrently on the IO pool, with a bounded number of deletes in flight.
     Log warnings if failing to delete any file.
 
     Args:
@@ -229,32 +232,46 @@ def delete_files(io: FileIO, files_to_delete: Set[str], file_type: str) -> None:
         files_to_delete: A set of file paths to be deleted.
         file_type: The type of the file.
     """
-    for file in files_to_delete:
+
+    def _delete_file(file: str) -> None:
         try:
             io.delete(file)
         except OSError as exc:
             logger.warning(msg=f"Failed to delete {file_type} file {file}", exc_info=exc)
 
+    for _ in bounded_map(ExecutorFactory.get_or_create(IO_POOL), _delete_file, files_to_delete):
+        pass
+
 
-def delete_data_files(io: FileIO, manifests_to_delete: List[ManifestFile]) -> None:
+def delete_data_files(
+    io: FileIO, manifests_to_delete: List[ManifestFile], retained_manifests: Optional[List[ManifestFile]] = None
+) -> None:
     """Delete data files linked to given manifests.
 
+    The manifests are read, and the files deleted, concurrently.
     Log warnings if failing to delete any file.
 
     Args:
         io: The FileIO used to delete the object.
         manifests_to_delete: A list of manifest contains paths of data files to be deleted.
+        retained_manifests: The manifests that are kept, the files that are live in them are not deleted.
     """
-    deleted_files: dict[str, bool] = {}
-    for manifest_file in manifests_to_delete:
-        for entry in manifest_file.fetch_manifest_entry(io, discard_deleted=False):
-            path = entry.data_file.file_path
-            if not deleted_files.get(path, False):
-                try:
-                    io.delete(path)
-                except OSError as exc:
-                    logger.warning(msg=f"Failed to delete data file {path}", exc_info=exc)
-                deleted_files[path] = True
+    executor = ExecutorFactory.get_or_create(IO_POOL)
+    files_to_delete = {
+        entry.data_file.file_path
+        for entries in executor.map(
+            lambda manifest: manifest.fetch_projected_manifest_entries(io, ["file_path"], discard_deleted=False),
+            manifests_to_delete,
+        )
+        for entry in entries
+    }
+    if files_to_delete and retained_manifests:
+        for entries in executor.map(
+            lambda manifest: manifest.fetch_projected_manifest_entries(io, ["file_path"]), retained_manifests
+        ):
+            files_to_delete.difference_update(entry.data_file.file_path for entry in entries)
+
+    delete_files(io, files_to_delete, DATA_FILE)
 
 
 @dataclass
@@ -16,6 +16,7 @@
 # under the License.
 import math
 from abc import ABC, abstractmethod
+from bisect import bisect_left
 from functools import singledispatch
 from typing import (
     Any,
@@ -1127,14 +1128,60 @@ class _MetricsEvaluator(BoundBooleanExpressionVisitor[bool], ABC):
         return False
 
     def _is_nan(self, val: Any) -> bool:
-        try:
-            return math.isnan(val)
-        except TypeError:
-            # In the case of None or other non-numeric types
-            return False
+        return _is_nan(val)
 
 
-class _InclusiveMetricsEvaluator(_MetricsEvaluator):
+def _is_nan(val: Any) -> bool:
+    try:
+        return math.isnan(val)
+    except TypeError:
+        # In the case of None or other non-numeric types
+        return False
+
+
+def _contains_nulls_only(file: DataFile, field_id: int) -> bool:
+    if (
+        (value_counts := file.value_counts)
+        and (null_counts := file.null_value_counts)
+        and (value_count := value_counts.get(field_id))
+        and (null_count := null_counts.get(field_id))
+    ):
+        return value_count == null_count
+    return False
+
+
+def _contains_nans_only(file: DataFile, field_id: int) -> bool:
+    if (
+        (nan_counts := file.nan_value_counts)
+        and (value_counts := file.value_counts)
+        and (nan_count := nan_counts.get(field_id))
+        and (value_count := value_counts.get(field_id))
+    ):
+        return nan_count == value_count
+    return False
+
+
+def _bound_decoder(field: NestedField) -> Callable[[bytes], Any]:
+    """Resolve the from_bytes implementation of the type of the field upfront."""
+    field_type = field.field_type
+    if not isinstance(field_type, PrimitiveType):
+        raise ValueError(f"Expected PrimitiveType: {field_type}")
+
+    decode: Callable[[PrimitiveType, bytes], Any] = from_bytes.dispatch(type(field_type))
+    return lambda value: decode(field_type, value)
+
+
+_FileEvaluator = Callable[[DataFile], bool]
+
+
+class _InclusiveMetricsEvaluator(BoundBooleanExpressionVisitor[_FileEvaluator]):
+    """Evaluate whether the rows of a data file may match the expression, based on its column metrics.
+
+    The expression is bound and compiled into a tree of closures once, with the field ids, the
+    decoders of the bounds and the literals resolved upfront. The compiled tree takes the data
+    file as an argument and keeps no state, so eval can be called concurrently.
+    """
+
     struct: StructType
     expr: BooleanExpression
 
@@ -1144,6 +1191,7 @@ class _InclusiveMetricsEvaluator(_MetricsEvaluator):
         self.struct = schema.as_struct()
         self.include_empty_files = include_empty_files
         self.expr = bind(schema, rewrite_not(expr), case_sensitive)
+        self._evaluator = visit(self.expr, self)
 
     def eval(self, file: DataFile) -> bool:
         """Test whether the file may contain records that match the expression."""
@@ -1156,281 +1204,313 @@ class _InclusiveMetricsEvaluator(_MetricsEvaluator):
             # be updated once we implemented and set correct record count.
             return ROWS_MIGHT_MATCH
 
-        self.value_counts = file.value_counts or EMPTY_DICT
-        self.null_counts = file.null_value_counts or EMPTY_DICT
-        self.nan_counts = file.nan_value_counts or EMPTY_DICT
-        self.lower_bounds = file.lower_bounds or EMPTY_DICT
-        self.upper_bounds = file.upper_bounds or EMPTY_DICT
+        return self._evaluator(file)
 
-        return visit(self.expr, self)
+    def visit_true(self) -> _FileEvaluator:
+        # all rows match
+        return lambda _: ROWS_MIGHT_MATCH
 
-    def _may_contain_null(self, field_id: int) -> bool:
-        return self.null_counts is None or (field_id in self.null_counts and self.null_counts.get(field_id) is not None)
+    def visit_false(self) -> _FileEvaluator:
+        # all rows fail
+        return lambda _: ROWS_CANNOT_MATCH
 
-    def _contains_nans_only(self, field_id: int) -> bool:
-        if (nan_count := self.nan_counts.get(field_id)) and (value_count := self.value_counts.get(field_id)):
-            return nan_count == value_count
-        return False
+    def visit_not(self, child_result: _FileEvaluator) -> _FileEvaluator:
+        raise ValueError(f"NOT should be rewritten: {child_result}")
 
-    def visit_is_null(self, term: BoundTerm[L]) -> bool:
+    def visit_and(self, left_result: _FileEvaluator, right_result: _FileEvaluator) -> _FileEvaluator:
+        return lambda file: left_result(file) and right_result(file)
+
+    def visit_or(self, left_result: _FileEvaluator, right_result: _FileEvaluator) -> _FileEvaluator:
+        return lambda file: left_result(file) or right_result(file)
+
+    def visit_is_null(self, term: BoundTerm[L]) -> _FileEvaluator:
         field_id = term.ref().field.field_id
 
-        if self.null_counts.get(field_id) == 0:
-            return ROWS_CANNOT_MATCH
+        def is_null(file: DataFile) -> bool:
+            if (null_counts := file.null_value_counts) and null_counts.get(field_id) == 0:
+                return ROWS_CANNOT_MATCH
 
-        return ROWS_MIGHT_MATCH
+            return ROWS_MIGHT_MATCH
 
-    def visit_not_null(self, term: BoundTerm[L]) -> bool:
+        return is_null
+
+    def visit_not_null(self, term: BoundTerm[L]) -> _FileEvaluator:
         # no need to check whether the field is required because binding evaluates that case
         # if the column has no non-null values, the expression cannot match
         field_id = term.ref().field.field_id
 
-        if self._contains_nulls_only(field_id):
-            return ROWS_CANNOT_MATCH
-
-        return ROWS_MIGHT_MATCH
+        def not_null(file: DataFile) -> bool:
+            if _contains_nulls_only(file, field_id):
+                return ROWS_CANNOT_MATCH
 
-    def visit_is_nan(self, term: BoundTerm[L]) -> bool:
-        field_id = term.ref().field.field_id
+            return ROWS_MIGHT_MATCH
 
-        if self.nan_counts.get(field_id) == 0:
-            return ROWS_CANNOT_MATCH
+        return not_null
 
-        # when there's no nanCounts information, but we already know the column only contains null,
-        # it's guaranteed that there's no NaN value
-        if self._contains_nulls_only(field_id):
-            return ROWS_CANNOT_MATCH
+    def visit_is_nan(self, term: BoundTerm[L]) -> _FileEvaluator:
+        field_id = term.ref().field.field_id
 
-        return ROWS_MIGHT_MATCH
+        def is_nan(file: DataFile) -> bool:
+            if (nan_counts := file.nan_value_counts) and nan_counts.get(field_id) == 0:
+                return ROWS_CANNOT_MATCH
 
-    def visit_not_nan(self, term: BoundTerm[L]) -> bool:
-        field_id = term.ref().field.field_id
+            # when there's no nanCounts information, but we already know the column only contains null,
+            # it's guaranteed that there's no NaN value
+            if _contains_nulls_only(file, field_id):
+                return ROWS_CANNOT_MATCH
 
-        if self._contains_nans_only(field_id):
-            return ROWS_CANNOT_MATCH
+            return ROWS_MIGHT_MATCH
 
-        return ROWS_MIGHT_MATCH
+        return is_nan
 
-    def visit_less_than(self, term: BoundTerm[L], literal: Literal[L]) -> bool:
-        field = term.ref().field
-        field_id = field.field_id
+    def visit_not_nan(self, term: BoundTerm[L]) -> _FileEvaluator:
+        field_id = term.ref().field.field_id
 
-        if self._contains_nulls_only(field_id) or self._contains_nans_only(field_id):
-            return ROWS_CANNOT_MATCH
+        def not_nan(file: DataFile) -> bool:
+            if _contains_nans_only(file, field_id):
+                return ROWS_CANNOT_MATCH
 
-        if not isinstance(field.field_type, PrimitiveType):
-            raise ValueError(f"Expected PrimitiveType: {field.field_type}")
+            return ROWS_MIGHT_MATCH
 
-        if lower_bound_bytes := self.lower_bounds.get(field_id):
-            lower_bound = from_bytes(field.field_type, lower_bound_bytes)
+        return not_nan
 
-            if self._is_nan(lower_bound):
-                # NaN indicates unreliable bounds. See the InclusiveMetricsEvaluator docs for more.
-                return ROWS_MIGHT_MATCH
+    def visit_less_than(self, term: BoundTerm[L], literal: Literal[L]) -> _FileEvaluator:
+        field_id = term.ref().field.field_id
+        decode = _bound_decoder(term.ref().field)
+        value = literal.value
 
-            if lower_bound >= literal.value:
+        def less_than(file: DataFile) -> bool:
+            if _contains_nulls_only(file, field_id) or _contains_nans_only(file, field_id):
                 return ROWS_CANNOT_MATCH
 
-        return ROWS_MIGHT_MATCH
+            if (lower_bounds := file.lower_bounds) and (lower_bound_bytes := lower_bounds.get(field_id)):
+                lower_bound = decode(lower_bound_bytes)
 
-    def visit_less_than_or_equal(self, term: BoundTerm[L], literal: Literal[L]) -> bool:
-        field = term.ref().field
-        field_id = field.field_id
+                if _is_nan(lower_bound):
+                    # NaN indicates unreliable bounds. See the InclusiveMetricsEvaluator docs for more.
+                    return ROWS_MIGHT_MATCH
 
-        if self._contains_nulls_only(field_id) or self._contains_nans_only(field_id):
-            return ROWS_CANNOT_MATCH
+                if lower_bound >= value:
+                    return ROWS_CANNOT_MATCH
 
-        if not isinstance(field.field_type, PrimitiveType):
-            raise ValueError(f"Expected PrimitiveType: {field.field_type}")
+            return ROWS_MIGHT_MATCH
 
-        if lower_bound_bytes := self.lower_bounds.get(field_id):
-            lower_bound = from_bytes(field.field_type, lower_bound_bytes)
-            if self._is_nan(lower_bound):
-                # NaN indicates unreliable bounds. See the InclusiveMetricsEvaluator docs for more.
-                return ROWS_MIGHT_MATCH
+        return less_than
 
-            if lower_bound > literal.value:
+    def visit_less_than_or_equal(self, term: BoundTerm[L], literal: Literal[L]) -> _FileEvaluator:
+        field_id = term.ref().field.field_id
+        decode = _bound_decoder(term.ref().field)
+        value = literal.value
+
+        def less_than_or_equal(file: DataFile) -> bool:
+            if _contains_nulls_only(file, field_id) or _contains_nans_only(file, field_id):
                 return ROWS_CANNOT_MATCH
 
-        return ROWS_MIGHT_MATCH
+            if (lower_bounds := file.lower_bounds) and (lower_bound_bytes := lower_bounds.get(field_id)):
+                lower_bound = decode(lower_bound_bytes)
+                if _is_nan(lower_bound):
+                    # NaN indicates unreliable bounds. See the InclusiveMetricsEvaluator docs for more.
+                    return ROWS_MIGHT_MATCH
 
-    def visit_greater_than(self, term: BoundTerm[L], literal: Literal[L]) -> bool:
-        field = term.ref().field
-        field_id = field.field_id
+                if lower_bound > value:
+                    return ROWS_CANNOT_MATCH
 
-        if self._contains_nulls_only(field_id) or self._contains_nans_only(field_id):
-            return ROWS_CANNOT_MATCH
+            return ROWS_MIGHT_MATCH
 
-        if not isinstance(field.field_type, PrimitiveType):
-            raise ValueError(f"Expected PrimitiveType: {field.field_type}")
+        return less_than_or_equal
 
-        if upper_bound_bytes := self.upper_bounds.get(field_id):
-            upper_bound = from_bytes(field.field_type, upper_bound_bytes)
-            if upper_bound <= literal.value:
-                if self._is_nan(upper_bound):
-                    # NaN indicates unreliable bounds. See the InclusiveMetricsEvaluator docs for more.
-                    return ROWS_MIGHT_MATCH
+    def visit_greater_than(self, term: BoundTerm[L], literal: Literal[L]) -> _FileEvaluator:
+        field_id = term.ref().field.field_id
+        decode = _bound_decoder(term.ref().field)
+        value = literal.value
 
+        def greater_than(file: DataFile) -> bool:
+            if _contains_nulls_only(file, field_id) or _contains_nans_only(file, field_id):
                 return ROWS_CANNOT_MATCH
 
-        return ROWS_MIGHT_MATCH
+            if (upper_bounds := file.upper_bounds) and (upper_bound_bytes := upper_bounds.get(field_id)):
+                upper_bound = decode(upper_bound_bytes)
+                if upper_bound <= value:
+                    if _is_nan(upper_bound):
+                        # NaN indicates unreliable bounds. See the InclusiveMetricsEvaluator docs for more.
+                        return ROWS_MIGHT_MATCH
 
-    def visit_greater_than_or_equal(self, term: BoundTerm[L], literal: Literal[L]) -> bool:
-        field = term.ref().field
-        field_id = field.field_id
+                    return ROWS_CANNOT_MATCH
 
-        if self._contains_nulls_only(field_id) or self._contains_nans_only(field_id):
-            return ROWS_CANNOT_MATCH
+            return ROWS_MIGHT_MATCH
 
-        if not isinstance(field.field_type, PrimitiveType):
-            raise ValueError(f"Expected PrimitiveType: {field.field_type}")
+        return greater_than
 
-        if upper_bound_bytes := self.upper_bounds.get(field_id):
-            upper_bound = from_bytes(field.field_type, upper_bound_bytes)
-            if upper_bound < literal.value:
-                if self._is_nan(upper_bound):
-                    # NaN indicates unreliable bounds. See the InclusiveMetricsEvaluator docs for more.
-                    return ROWS_MIGHT_MATCH
+    def visit_greater_than_or_equal(self, term: BoundTerm[L], literal: Literal[L]) -> _FileEvaluator:
+        field_id = term.ref().field.field_id
+        decode = _bound_decoder(term.ref().field)
+        value = literal.value
 
+        def greater_than_or_equal(file: DataFile) -> bool:
+            if _contains_nulls_only(file, field_id) or _contains_nans_only(file, field_id):
                 return ROWS_CANNOT_MATCH
 
-        return ROWS_MIGHT_MATCH
+            if (upper_bounds := file.upper_bounds) and (upper_bound_bytes := upper_bounds.get(field_id)):
+                upper_bound = decode(upper_bound_bytes)
+                if upper_bound < value:
+                    if _is_nan(upper_bound):
+                        # NaN indicates unreliable bounds. See the InclusiveMetricsEvaluator docs for more.
+                        return ROWS_MIGHT_MATCH
 
-    def visit_equal(self, term: BoundTerm[L], literal: Literal[L]) -> bool:
-        field = term.ref().field
-        field_id = field.field_id
+                    return ROWS_CANNOT_MATCH
 
-        if self._contains_nulls_only(field_id) or self._contains_nans_only(field_id):
-            return ROWS_CANNOT_MATCH
+            return ROWS_MIGHT_MATCH
 
-        if not isinstance(field.field_type, PrimitiveType):
-            raise ValueError(f"Expected PrimitiveType: {field.field_type}")
+        return greater_than_or_equal
 
-        if lower_bound_bytes := self.lower_bounds.get(field_id):
-            lower_bound = from_bytes(field.field_type, lower_bound_bytes)
-            if self._is_nan(lower_bound):
-                # NaN indicates unreliable bounds. See the InclusiveMetricsEvaluator docs for more.
-                return ROWS_MIGHT_MATCH
+    def visit_equal(self, term: BoundTerm[L], literal: Literal[L]) -> _FileEvaluator:
+        field_id = term.ref().field.field_id
+        decode = _bound_decoder(term.ref().field)
+        value = literal.value
 
-            if lower_bound > literal.value:
+        def equal(file: DataFile) -> bool:
+            if _contains_nulls_only(file, field_id) or _contains_nans_only(file, field_id):
                 return ROWS_CANNOT_MATCH
 
-        if upper_bound_bytes := self.upper_bounds.get(field_id):
-            upper_bound = from_bytes(field.field_type, upper_bound_bytes)
-            if self._is_nan(upper_bound):
-                # NaN indicates unreliable bounds. See the InclusiveMetricsEvaluator docs for more.
-                return ROWS_MIGHT_MATCH
+            if (lower_bounds := file.lower_bounds) and (lower_bound_bytes := lower_bounds.get(field_id)):
+                lower_bound = decode(lower_bound_bytes)
+                if _is_nan(lower_bound):
+                    # NaN indicates unreliable bounds. See the InclusiveMetricsEvaluator docs for more.
+                    return ROWS_MIGHT_MATCH
 
-            if upper_bound < literal.value:
-                return ROWS_CANNOT_MATCH
+                if lower_bound > value:
+                    return ROWS_CANNOT_MATCH
 
-        return ROWS_MIGHT_MATCH
+            if (upper_bounds := file.upper_bounds) and (upper_bound_bytes := upper_bounds.get(field_id)):
+                upper_bound = decode(upper_bound_bytes)
+                if _is_nan(upper_bound):
+                    # NaN indicates unreliable bounds. See the InclusiveMetricsEvaluator docs for more.
+                    return ROWS_MIGHT_MATCH
 
-    def visit_not_equal(self, term: BoundTerm[L], literal: Literal[L]) -> bool:
-        return ROWS_MIGHT_MATCH
+                if upper_bound < value:
+                    return ROWS_CANNOT_MATCH
 
-    def visit_in(self, term: BoundTerm[L], literals: Set[L]) -> bool:
-        field = term.ref().field
-        field_id = field.field_id
+            return ROWS_MIGHT_MATCH
 
-        if self._contains_nulls_only(field_id) or self._contains_nans_only(field_id):
-            return ROWS_CANNOT_MATCH
+        return equal
+
+    def visit_not_equal(self, term: BoundTerm[L], literal: Literal[L]) -> _FileEvaluator:
+        return lambda _: ROWS_MIGHT_MATCH
+
+    def visit_in(self, term: BoundTerm[L], literals: Set[L]) -> _FileEvaluator:
+        field_id = term.ref().field.field_id
 
         if len(literals) > IN_PREDICATE_LIMIT:
             # skip evaluating the predicate if the number of values is too big
-            return ROWS_MIGHT_MATCH
+            def too_many_values(file: DataFile) -> bool:
+                if _contains_nulls_only(file, field_id) or _contains_nans_only(file, field_id):
+                    return ROWS_CANNOT_MATCH
+                return ROWS_MIGHT_MATCH
 
-        if not isinstance(field.field_type, PrimitiveType):
-            raise ValueError(f"Expected PrimitiveType: {field.field_type}")
+            return too_many_values
 
-        if lower_bound_bytes := self.lower_bounds.get(field_id):
-            lower_bound = from_bytes(field.field_type, lower_bound_bytes)
-            if self._is_nan(lower_bound):
-                # NaN indicates unreliable bounds. See the InclusiveMetricsEvaluator docs for more.
-                return ROWS_MIGHT_MATCH
+        decode = _bound_decoder(term.ref().field)
+        sorted_literals = sorted(literals)
 
-            literals = {lit for lit in literals if lower_bound <= lit}
-            if len(literals) == 0:
+        def in_(file: DataFile) -> bool:
+            if _contains_nulls_only(file, field_id) or _contains_nans_only(file, field_id):
                 return ROWS_CANNOT_MATCH
 
-        if upper_bound_bytes := self.upper_bounds.get(field_id):
-            upper_bound = from_bytes(field.field_type, upper_bound_bytes)
-            # this is different from Java, here NaN is always larger
-            if self._is_nan(upper_bound):
-                return ROWS_MIGHT_MATCH
+            # the position of the first literal that is not below the lower bound
+            first = 0
 
-            literals = {lit for lit in literals if upper_bound >= lit}
-            if len(literals) == 0:
-                return ROWS_CANNOT_MATCH
+            if (lower_bounds := file.lower_bounds) and (lower_bound_bytes := lower_bounds.get(field_id)):
+                lower_bound = decode(lower_bound_bytes)
+                if _is_nan(lower_bound):
+                    # NaN indicates unreliable bounds. See the InclusiveMetricsEvaluator docs for more.
+                    return ROWS_MIGHT_MATCH
 
-        return ROWS_MIGHT_MATCH
+                first = bisect_left(sorted_literals, lower_bound)
+                if first == len(sorted_literals):
+                    return ROWS_CANNOT_MATCH
 
-    def visit_not_in(self, term: BoundTerm[L], literals: Set[L]) -> bool:
-        # because the bounds are not necessarily a min or max value, this cannot be answered using
-        # them. notIn(col, {X, ...}) with (X, Y) doesn't guarantee that X is a value in col.
-        return ROWS_MIGHT_MATCH
+            if (upper_bounds := file.upper_bounds) and (upper_bound_bytes := upper_bounds.get(field_id)):
+                upper_bound = decode(upper_bound_bytes)
+                # this is different from Java, here NaN is always larger
+                if _is_nan(upper_bound):
+                    return ROWS_MIGHT_MATCH
 
-    def visit_starts_with(self, term: BoundTerm[L], literal: Literal[L]) -> bool:
-        field = term.ref().field
-        field_id: int = field.field_id
+                if first == len(sorted_literals) or sorted_literals[first] > upper_bound:
+                    return ROWS_CANNOT_MATCH
 
-        if self._contains_nulls_only(field_id):
-            return ROWS_CANNOT_MATCH
+            return ROWS_MIGHT_MATCH
 
-        if not isinstance(field.field_type, PrimitiveType):
-            raise ValueError(f"Expected PrimitiveType: {field.field_type}")
+        return in_
 
+    def visit_not_in(self, term: BoundTerm[L], literals: Set[L]) -> _FileEvaluator:
+        # because the bounds are not necessarily a min or max value, this cannot be answered using
+        # them. notIn(col, {X, ...}) with (X, Y) doesn't guarantee that X is a value in col.
+        return lambda _: ROWS_MIGHT_MATCH
+
+    def visit_starts_with(self, term: BoundTerm[L], literal: Literal[L]) -> _FileEvaluator:
+        field_id: int = term.ref().field.field_id
+        decode = _bound_decoder(term.ref().field)
         prefix = str(literal.value)
         len_prefix = len(prefix)
 
-        if lower_bound_bytes := self.lower_bounds.get(field_id):
-            lower_bound = str(from_bytes(field.field_type, lower_bound_bytes))
-
-            # truncate lower bound so that its length is not greater than the length of prefix
-            if lower_bound and lower_bound[:len_prefix] > prefix:
+        def starts_with(file: DataFile) -> bool:
+            if _contains_nulls_only(file, field_id):
                 return ROWS_CANNOT_MATCH
 
-        if upper_bound_bytes := self.upper_bounds.get(field_id):
-            upper_bound = str(from_bytes(field.field_type, upper_bound_bytes))
+            if (lower_bounds := file.lower_bounds) and (lower_bound_bytes := lower_bounds.get(field_id)):
+                lower_bound = str(decode(lower_bound_bytes))
 
-            # truncate upper bound so that its length is not greater than the length of prefix
-            if upper_bound is not None and upper_bound[:len_prefix] < prefix:
-                return ROWS_CANNOT_MATCH
+                # truncate lower bound so that its length is not greater than the length of prefix
+                if lower_bound and lower_bound[:len_prefix] > prefix:
+                    return ROWS_CANNOT_MATCH
 
-        return ROWS_MIGHT_MATCH
+            if (upper_bounds := file.upper_bounds) and (upper_bound_bytes := upper_bounds.get(field_id)):
+                upper_bound = str(decode(upper_bound_bytes))
 
-    def visit_not_starts_with(self, term: BoundTerm[L], literal: Literal[L]) -> bool:
-        field = term.ref().field
-        field_id: int = field.field_id
+                # truncate upper bound so that its length is not greater than the length of prefix
+                if upper_bound is not None and upper_bound[:len_prefix] < prefix:
+                    return ROWS_CANNOT_MATCH
 
-        if self._may_contain_null(field_id):
             return ROWS_MIGHT_MATCH
 
-        if not isinstance(field.field_type, PrimitiveType):
-            raise ValueError(f"Expected PrimitiveType: {field.field_type}")
+        return starts_with
 
+    def visit_not_starts_with(self, term: BoundTerm[L], literal: Literal[L]) -> _FileEvaluator:
+        field_id: int = term.ref().field.field_id
+        decode = _bound_decoder(term.ref().field)
         prefix = str(literal.value)
         len_prefix = len(prefix)
 
-        # not_starts_with will match unless all values must start with the prefix. This happens when
-        # the lower and upper bounds both start with the prefix.
-        if (lower_bound_bytes := self.lower_bounds.get(field_id)) and (upper_bound_bytes := self.upper_bounds.get(field_id)):
-            lower_bound = str(from_bytes(field.field_type, lower_bound_bytes))
-            upper_bound = str(from_bytes(field.field_type, upper_bound_bytes))
-
-            # if lower is shorter than the prefix then lower doesn't start with the prefix
-            if len(lower_bound) < len_prefix:
+        def not_starts_with(file: DataFile) -> bool:
+            if (null_counts := file.null_value_counts) and null_counts.get(field_id) is not None:
                 return ROWS_MIGHT_MATCH
 
-            if lower_bound[:len_prefix] == prefix:
-                # if upper is shorter than the prefix then upper can't start with the prefix
-                if len(upper_bound) < len_prefix:
+            # not_starts_with will match unless all values must start with the prefix. This happens when
+            # the lower and upper bounds both start with the prefix.
+            if (
+                (lower_bounds := file.lower_bounds)
+                and (lower_bound_bytes := lower_bounds.get(field_id))
+                and (upper_bounds := file.upper_bounds)
+                and (upper_bound_bytes := upper_bounds.get(field_id))
+            ):
+                lower_bound = str(decode(lower_bound_bytes))
+                upper_bound = str(decode(upper_bound_bytes))
+
+                # if lower is shorter than the prefix then lower doesn't start with the prefix
+                if len(lower_bound) < len_prefix:
                     return ROWS_MIGHT_MATCH
 
-                if upper_bound[:len_prefix] == prefix:
-                    return ROWS_CANNOT_MATCH
+                if lower_bound[:len_prefix] == prefix:
+                    # if upper is shorter than the prefix then upper can't start with the prefix
+                    if len(upper_bound) < len_prefix:
+                        return ROWS_MIGHT_MATCH
 
-        return ROWS_MIGHT_MATCH
+                    if upper_bound[:len_prefix] == prefix:
+                        return ROWS_CANNOT_MATCH
+
+            return ROWS_MIGHT_MATCH
+
+        return not_starts_with
 
 
 def strict_projection(
@@ -31,6 +31,8 @@ import itertools
 import logging
 import os
 import re
+import sys
+import uuid
 from abc import ABC, abstractmethod
 from concurrent.futures import Future
 from dataclasses import dataclass
@@ -48,6 +50,7 @@ from typing import (
     Optional,
     Set,
     Tuple,
+    Type,
     TypeVar,
     Union,
     cast,
@@ -55,6 +58,7 @@ from typing import (
 from urllib.parse import urlparse
 
 import numpy as np
+import numpy.typing as npt
 import pyarrow as pa
 import pyarrow.compute as pc
 import pyarrow.dataset as ds
@@ -69,7 +73,7 @@ from pyarrow.fs import (
 )
 from sortedcontainers import SortedList
 
-from pyiceberg.conversions import to_bytes
+from pyiceberg.conversions import from_bytes, to_bytes
 from pyiceberg.exceptions import ResolveError
 from pyiceberg.expressions import (
     AlwaysTrue,
@@ -78,9 +82,11 @@ from pyiceberg.expressions import (
 )
 from pyiceberg.expressions.literals import Literal
 from pyiceberg.expressions.visitors import (
+    IN_PREDICATE_LIMIT,
     BoundBooleanExpressionVisitor,
     bind,
     extract_field_ids,
+    rewrite_not,
     translate_column_names,
 )
 from pyiceberg.expressions.visitors import visit as boolean_expression_visit
@@ -107,11 +113,13 @@ from pyiceberg.io import (
     OutputStream,
 )
 from pyiceberg.manifest import (
+    MANIFEST_ENTRY_PRUNING_DATA_FILE_TYPE,
+    POSITIONAL_DELETE_SCHEMA,
     DataFile,
     DataFileContent,
     FileFormat,
 )
-from pyiceberg.partitioning import PartitionField, PartitionSpec, partition_record_value
+from pyiceberg.partitioning import PartitionField, PartitionFieldValue, PartitionKey, PartitionSpec, partition_record_value
 from pyiceberg.schema import (
     PartnerAccessor,
     PreOrderSchemaVisitor,
@@ -152,7 +160,8 @@ from pyiceberg.types import (
     TimeType,
     UUIDType,
 )
-from pyiceberg.utils.concurrent import ExecutorFactory
+from pyiceberg.utils.cache import SharedCache
+from pyiceberg.utils.concurrent import CPU_POOL, IO_POOL, ExecutorFactory, bounded_map
 from pyiceberg.utils.datetime import millis_to_datetime
 from pyiceberg.utils.singleton import Singleton
 from pyiceberg.utils.truncate import truncate_upper_bound_binary_string, truncate_upper_bound_text_string
@@ -172,6 +181,18 @@ LIST_ELEMENT_NAME = "element"
 MAP_KEY_NAME = "key"
 MAP_VALUE_NAME = "value"
 DOC = "doc"
+# Deletes are applied by slicing around the deleted rows when there are at least this many rows per deleted row,
+# and no more than this many deleted rows, so the result is not split into many small chunks
+SPARSE_POSITIONAL_DELETES_RATIO = 1024
+MAX_SPARSE_POSITIONAL_DELETES = 32
+POSITIONAL_DELETE_CACHE_SIZE_BYTES = "positional-delete-cache-size-bytes"
+DEFAULT_POSITIONAL_DELETE_CACHE_SIZE_BYTES = 67108864  # 64 * 1024 * 1024
+EQUALITY_DELETE_CACHE_SIZE_BYTES = "equality-delete-cache-size-bytes"
+DEFAULT_EQUALITY_DELETE_CACHE_SIZE_BYTES = 67108864  # 64 * 1024 * 1024
+# The column with the position of each row in its data file, when the rows to delete are collected
+ROW_POSITION_COLUMN = "_row_position"
+PARQUET_FOOTER_CACHE_SIZE_BYTES = "parquet-footer-cache-size-bytes"
+DEFAULT_PARQUET_FOOTER_CACHE_SIZE_BYTES = 33554432  # 32 * 1024 * 1024
 
 T = TypeVar("T")
 
@@ -611,6 +632,402 @@ def expression_to_pyarrow(expr: BooleanExpression) -> pc.Expression:
     return boolean_expression_visit(expr, _ConvertToArrowExpression())
 
 
+# The single-value serialization of these types is little-endian with a fixed width
+_FIXED_WIDTH_BOUNDS: Dict[Type[PrimitiveType], int] = {
+    IntegerType: 4,
+    LongType: 8,
+    FloatType: 4,
+    DoubleType: 8,
+    DateType: 4,
+    TimeType: 8,
+    TimestampType: 8,
+    TimestamptzType: 8,
+}
+
+
+def _pruning_type(iceberg_type: IcebergType) -> pa.DataType:
+    """Return the Arrow type that values of the Iceberg type are compared as, when pruning data files."""
+    if not isinstance(iceberg_type, PrimitiveType) or isinstance(iceberg_type, UUIDType):
+        raise NotImplementedError(f"Cannot prune data files on a column of type {iceberg_type} with Arrow")
+    if isinstance(iceberg_type, FloatType):
+        # Python compares the floats with double precision
+        return pa.float64()
+    return schema_to_pyarrow(iceberg_type)
+
+
+def _pruning_scalar(value: Any, iceberg_type: IcebergType) -> pa.Scalar:
+    return pa.scalar(value, type=_pruning_type(iceberg_type))
+
+
+def _prefix(iceberg_type: IcebergType, literal: Literal[Any]) -> str:
+    if not isinstance(iceberg_type, StringType):
+        raise NotImplementedError(f"Cannot prune data files on the prefix of a column of type {iceberg_type} with Arrow")
+    return str(literal.value)
+
+
+def _constant(value: bool, length: int) -> pa.Array:
+    return pa.array(np.full(length, value, dtype=np.bool_))
+
+
+def _is_true(mask: pa.Array) -> pa.Array:
+    return pc.fill_null(mask, False)
+
+
+def _decode_bounds(bounds: List[Optional[bytes]], iceberg_type: PrimitiveType) -> pa.Array:
+    """Decode the serialized lower or upper bounds of a column into an Arrow array."""
+    arrow_type = _pruning_type(iceberg_type)
+    width = _FIXED_WIDTH_BOUNDS.get(type(iceberg_type))
+    if width is not None and sys.byteorder == "little" and all(bound is None or len(bound) == width for bound in bounds):
+        # The concatenated bounds are the data buffer of the array
+        padding = bytes(width)
+        validity = pa.array([bound is not None for bound in bounds], type=pa.bool_())
+        data = pa.py_buffer(b"".join(padding if bound is None else bound for bound in bounds))
+        array = pa.Array.from_buffers(schema_to_pyarrow(iceberg_type), len(bounds), [validity.buffers()[1], data])
+        return array.cast(arrow_type)
+    elif isinstance(iceberg_type, StringType):
+        return pa.array(bounds, type=pa.binary()).cast(pa.string())
+    else:
+        return pa.array([None if bound is None else from_bytes(iceberg_type, bound) for bound in bounds], type=arrow_type)
+
+
+class _ArrowPartitionEvaluator(BoundBooleanExpressionVisitor[pa.Array]):
+    """Evaluate a bound partition filter on the partitions of data files at once, with the semantics of _ExpressionEvaluator.
+
+    Each of the visits returns a boolean array without nulls, that is true for the partitions that match.
+    """
+
+    partitions: List[List[Any]]
+    length: int
+    positions: Dict[int, int]
+    columns: Dict[int, pa.Array]
+
+    def __init__(self, partition_type: StructType, partitions: List[List[Any]], length: int) -> None:
+        self.partitions = partitions
+        self.length = length
+        self.positions = {field.field_id: pos for pos, field in enumerate(partition_type.fields)}
+        self.columns = {}
+
+    def _column(self, term: BoundTerm[Any]) -> pa.Array:
+        field = term.ref().field
+        if (column := self.columns.get(field.field_id)) is None:
+            column = pa.array(self.partitions[self.positions[field.field_id]], type=_pruning_type(field.field_type))
+            self.columns[field.field_id] = column
+        return column
+
+    def _is_nan(self, term: BoundTerm[Any]) -> pa.Array:
+        if isinstance(term.ref().field.field_type, (FloatType, DoubleType)):
+            return _is_true(pc.is_nan(self._column(term)))
+        return _constant(False, self.length)
+
+    def visit_in(self, term: BoundTerm[Any], literals: Set[Any]) -> pa.Array:
+        value_set = pa.array(literals, type=_pruning_type(term.ref().field.field_type))
+        return _is_true(pc.is_in(self._column(term), value_set=value_set))
+
+    def visit_not_in(self, term: BoundTerm[Any], literals: Set[Any]) -> pa.Array:
+        return pc.invert(self.visit_in(term, literals))
+
+    def visit_is_nan(self, term: BoundTerm[Any]) -> pa.Array:
+        return self._is_nan(term)
+
+    def visit_not_nan(self, term: BoundTerm[Any]) -> pa.Array:
+        return pc.invert(self._is_nan(term))
+
+    def visit_is_null(self, term: BoundTerm[Any]) -> pa.Array:
+        return pc.is_null(self._column(term))
+
+    def visit_not_null(self, term: BoundTerm[Any]) -> pa.Array:
+        return pc.is_valid(self._column(term))
+
+    def visit_equal(self, term: BoundTerm[Any], literal: Literal[Any]) -> pa.Array:
+        return _is_true(pc.equal(self._column(term), _pruning_scalar(literal.value, term.ref().field.field_type)))
+
+    def visit_not_equal(self, term: BoundTerm[Any], literal: Literal[Any]) -> pa.Array:
+        return pc.invert(self.visit_equal(term, literal))
+
+    def visit_greater_than_or_equal(self, term: BoundTerm[Any], literal: Literal[Any]) -> pa.Array:
+        return _is_true(pc.greater_equal(self._column(term), _pruning_scalar(literal.value, term.ref().field.field_type)))
+
+    def visit_greater_than(self, term: BoundTerm[Any], literal: Literal[Any]) -> pa.Array:
+        return _is_true(pc.greater(self._column(term), _pruning_scalar(literal.value, term.ref().field.field_type)))
+
+    def visit_less_than(self, term: BoundTerm[Any], literal: Literal[Any]) -> pa.Array:
+        return _is_true(pc.less(self._column(term), _pruning_scalar(literal.value, term.ref().field.field_type)))
+
+    def visit_less_than_or_equal(self, term: BoundTerm[Any], literal: Literal[Any]) -> pa.Array:
+        return _is_true(pc.less_equal(self._column(term), _pruning_scalar(literal.value, term.ref().field.field_type)))
+
+    def visit_starts_with(self, term: BoundTerm[Any], literal: Literal[Any]) -> pa.Array:
+        prefix = _prefix(term.ref().field.field_type, literal)
+        return _is_true(pc.starts_with(self._column(term), pattern=prefix))
+
+    def visit_not_starts_with(self, term: BoundTerm[Any], literal: Literal[Any]) -> pa.Array:
+        return pc.invert(self.visit_starts_with(term, literal))
+
+    def visit_true(self) -> pa.Array:
+        return _constant(True, self.length)
+
+    def visit_false(self) -> pa.Array:
+        return _constant(False, self.length)
+
+    def visit_not(self, child_result: pa.Array) -> pa.Array:
+        return pc.invert(child_result)
+
+    def visit_and(self, left_result: pa.Array, right_result: pa.Array) -> pa.Array:
+        return pc.and_(left_result, right_result)
+
+    def visit_or(self, left_result: pa.Array, right_result: pa.Array) -> pa.Array:
+        return pc.or_(left_result, right_result)
+
+
+class _ArrowInclusiveMetricsEvaluator(BoundBooleanExpressionVisitor[pa.Array]):
+    """Evaluate a bound row filter on the metrics of data files at once, with the semantics of _InclusiveMetricsEvaluator.
+
+    Each of the visits returns a boolean array without nulls, that is true for the data files that might
+    contain matching rows. The metrics of a column are only converted to Arrow when the filter references it.
+    """
+
+    data_files: Dict[str, List[Any]]
+    length: int
+    counts: Dict[Tuple[str, int], pa.Array]
+    bounds: Dict[Tuple[str, int], Tuple[pa.Array, pa.Array]]
+
+    def __init__(self, data_files: Dict[str, List[Any]], length: int) -> None:
+        self.data_files = data_files
+        self.length = length
+        self.counts = {}
+        self.bounds = {}
+
+    def _counts(self, name: str, field_id: int) -> pa.Array:
+        if (counts := self.counts.get((name, field_id))) is None:
+            counts = pa.array(
+                [counts.get(field_id) if counts else None for counts in self.data_files[name]],
+                type=pa.int64(),
+            )
+            self.counts[(name, field_id)] = counts
+        return counts
+
+    def _bounds(self, name: str, term: BoundTerm[Any]) -> Tuple[pa.Array, pa.Array]:
+        """Return the decoded bounds, and whether they are NaN, which indicates that the bounds are unreliable."""
+        field = term.ref().field
+        if (bounds := self.bounds.get((name, field.field_id))) is None:
+            # Like empty bound maps, empty bounds are ignored
+            values = _decode_bounds(
+                [bounds.get(field.field_id) or None if bounds else None for bounds in self.data_files[name]],
+                field.field_type,  # type: ignore
+            )
+            is_nan = (
+                _is_true(pc.is_nan(values))
+                if isinstance(field.field_type, (FloatType, DoubleType))
+                else _constant(False, self.length)
+            )
+            bounds = (values, is_nan)
+            self.bounds[(name, field.field_id)] = bounds
+        return bounds
+
+    def _contains_only(self, name: str, field_id: int) -> pa.Array:
+        value_counts = self._counts("value_counts", field_id)
+        counts = self._counts(name, field_id)
+        return _is_true(pc.and_(pc.and_(pc.not_equal(value_counts, 0), pc.not_equal(counts, 0)), pc.equal(value_counts, counts)))
+
+    def _contains_nulls_or_nans_only(self, field_id: int) -> pa.Array:
+        return pc.or_(self._contains_only("null_value_counts", field_id), self._contains_only("nan_value_counts", field_id))
+
+    def _compare_lower_bound(self, term: BoundTerm[Any], compare: Callable[[pa.Array], pa.Array]) -> pa.Array:
+        """Return where the lower bound is not NaN, and the comparison is true."""
+        lower_bounds, lower_is_nan = self._bounds("lower_bounds", term)
+        return pc.and_(pc.invert(lower_is_nan), _is_true(compare(lower_bounds)))
+
+    def _compare_upper_bound(self, term: BoundTerm[Any], compare: Callable[[pa.Array], pa.Array]) -> pa.Array:
+        """Return where the upper bound is not NaN, and the comparison is true."""
+        upper_bounds, upper_is_nan = self._bounds("upper_bounds", term)
+        return pc.and_(pc.invert(upper_is_nan), _is_true(compare(upper_bounds)))
+
+    def visit_true(self) -> pa.Array:
+        return _constant(True, self.length)
+
+    def visit_false(self) -> pa.Array:
+        return _constant(False, self.length)
+
+    def visit_not(self, child_result: pa.Array) -> pa.Array:
+        raise ValueError(f"NOT should be rewritten: {child_result}")
+
+    def visit_and(self, left_result: pa.Array, right_result: pa.Array) -> pa.Array:
+        return pc.and_(left_result, right_result)
+
+    def visit_or(self, left_result: pa.Array, right_result: pa.Array) -> pa.Array:
+        return pc.or_(left_result, right_result)
+
+    def visit_is_null(self, term: BoundTerm[Any]) -> pa.Array:
+        null_counts = self._counts("null_value_counts", term.ref().field.field_id)
+        return pc.invert(_is_true(pc.equal(null_counts, 0)))
+
+    def visit_not_null(self, term: BoundTerm[Any]) -> pa.Array:
+        return pc.invert(self._contains_only("null_value_counts", term.ref().field.field_id))
+
+    def visit_is_nan(self, term: BoundTerm[Any]) -> pa.Array:
+        field_id = term.ref().field.field_id
+        nan_counts = self._counts("nan_value_counts", field_id)
+        return pc.invert(pc.or_(_is_true(pc.equal(nan_counts, 0)), self._contains_only("null_value_counts", field_id)))
+
+    def visit_not_nan(self, term: BoundTerm[Any]) -> pa.Array:
+        return pc.invert(self._contains_only("nan_value_counts", term.ref().field.field_id))
+
+    def visit_less_than(self, term: BoundTerm[Any], literal: Literal[Any]) -> pa.Array:
+        value = _pruning_scalar(literal.value, term.ref().field.field_type)
+        cannot_match = self._compare_lower_bound(term, lambda lower_bounds: pc.greater_equal(lower_bounds, value))
+        return pc.invert(pc.or_(self._contains_nulls_or_nans_only(term.ref().field.field_id), cannot_match))
+
+    def visit_less_than_or_equal(self, term: BoundTerm[Any], literal: Literal[Any]) -> pa.Array:
+        value = _pruning_scalar(literal.value, term.ref().field.field_type)
+        cannot_match = self._compare_lower_bound(term, lambda lower_bounds: pc.greater(lower_bounds, value))
+        return pc.invert(pc.or_(self._contains_nulls_or_nans_only(term.ref().field.field_id), cannot_match))
+
+    def visit_greater_than(self, term: BoundTerm[Any], literal: Literal[Any]) -> pa.Array:
+        value = _pruning_scalar(literal.value, term.ref().field.field_type)
+        cannot_match = self._compare_upper_bound(term, lambda upper_bounds: pc.less_equal(upper_bounds, value))
+        return pc.invert(pc.or_(self._contains_nulls_or_nans_only(term.ref().field.field_id), cannot_match))
+
+    def visit_greater_than_or_equal(self, term: BoundTerm[Any], literal: Literal[Any]) -> pa.Array:
+        value = _pruning_scalar(literal.value, term.ref().field.field_type)
+        cannot_match = self._compare_upper_bound(term, lambda upper_bounds: pc.less(upper_bounds, value))
+        return pc.invert(pc.or_(self._contains_nulls_or_nans_only(term.ref().field.field_id), cannot_match))
+
+    def visit_equal(self, term: BoundTerm[Any], literal: Literal[Any]) -> pa.Array:
+        value = _pruning_scalar(literal.value, term.ref().field.field_type)
+        _, lower_is_nan = self._bounds("lower_bounds", term)
+        # The upper bound is only checked when the lower bound is not NaN
+        cannot_match = pc.or_(
+            self._compare_lower_bound(term, lambda lower_bounds: pc.greater(lower_bounds, value)),
+            pc.and_(
+                pc.invert(lower_is_nan),
+                self._compare_upper_bound(term, lambda upper_bounds: pc.less(upper_bounds, value)),
+            ),
+        )
+        return pc.invert(pc.or_(self._contains_nulls_or_nans_only(term.ref().field.field_id), cannot_match))
+
+    def visit_not_equal(self, term: BoundTerm[Any], literal: Literal[Any]) -> pa.Array:
+        return _constant(True, self.length)
+
+    def visit_in(self, term: BoundTerm[Any], literals: Set[Any]) -> pa.Array:
+        field = term.ref().field
+        contains_nulls_or_nans_only = self._contains_nulls_or_nans_only(field.field_id)
+        if len(literals) > IN_PREDICATE_LIMIT:
+            # skip evaluating the predicate if the number of values is too big
+            return pc.invert(contains_nulls_or_nans_only)
+
+        values = [_pruning_scalar(value, field.field_type) for value in sorted(literals)]
+        lower_bounds, lower_is_nan = self._bounds("lower_bounds", term)
+        upper_bounds, upper_is_nan = self._bounds("upper_bounds", term)
+
+        # whether one of the values is between the bounds, where a missing bound does not limit the values
+        in_bounds = _constant(False, self.length)
+        for value in values:
+            in_bounds = pc.or_(
+                in_bounds,
+                pc.and_(
+                    pc.fill_null(pc.less_equal(lower_bounds, value), True),
+                    pc.fill_null(pc.greater_equal(upper_bounds, value), True),
+                ),
+            )
+
+        # all values are below the lower bound, or no value is between the bounds while the upper bound is not NaN
+        cannot_match = pc.and_(
+            pc.invert(lower_is_nan),
+            pc.or_(
+                _is_true(pc.greater(lower_bounds, values[-1])),
+                pc.and_(pc.invert(upper_is_nan), pc.invert(in_bounds)),
+            ),
+        )
+        return pc.invert(pc.or_(contains_nulls_or_nans_only, cannot_match))
+
+    def visit_not_in(self, term: BoundTerm[Any], literals: Set[Any]) -> pa.Array:
+        return _constant(True, self.length)
+
+    def visit_starts_with(self, term: BoundTerm[Any], literal: Literal[Any]) -> pa.Array:
+        prefix = _prefix(term.ref().field.field_type, literal)
+        cannot_match = pc.or_(
+            self._compare_lower_bound(
+                term, lambda lower_bounds: pc.greater(pc.utf8_slice_codeunits(lower_bounds, 0, len(prefix)), prefix)
+            ),
+            self._compare_upper_bound(
+                term, lambda upper_bounds: pc.less(pc.utf8_slice_codeunits(upper_bounds, 0, len(prefix)), prefix)
+            ),
+        )
+        return pc.invert(pc.or_(self._contains_only("null_value_counts", term.ref().field.field_id), cannot_match))
+
+    def visit_not_starts_with(self, term: BoundTerm[Any], literal: Literal[Any]) -> pa.Array:
+        prefix = _prefix(term.ref().field.field_type, literal)
+        null_counts = self._counts("null_value_counts", term.ref().field.field_id)
+        # not_starts_with will match unless all values must start with the prefix. This happens when
+        # the lower and upper bounds both start with the prefix, and there are no nulls.
+        cannot_match = pc.and_(
+            pc.is_null(null_counts),
+            pc.and_(
+                self._compare_lower_bound(term, lambda lower_bounds: pc.starts_with(lower_bounds, pattern=prefix)),
+                self._compare_upper_bound(term, lambda upper_bounds: pc.starts_with(upper_bounds, pattern=prefix)),
+            ),
+        )
+        return pc.invert(cannot_match)
+
+
+def columnar_manifest_pruner(
+    schema: Schema,
+    spec: PartitionSpec,
+    partition_filter: BooleanExpression,
+    row_filter: BooleanExpression,
+    case_sensitive: bool = True,
+    include_empty_files: bool = False,
+) -> Optional[Callable[[Dict[str, List[Any]]], List[int]]]:
+    """Return a function that selects the data files that might contain matching rows, using Arrow compute.
+
+    The partition filter and the row filter are evaluated on the partitions and the column metrics of all
+    the data files of a manifest at once. This is equivalent to evaluating each of the data files with
+    `expression_evaluator` and `_InclusiveMetricsEvaluator`, which `ManifestFile.fetch_selected_manifest_entries`
+    uses to only decode the entries of the selected data files.
+
+    Args:
+        schema (Schema): The schema of the table.
+        spec (PartitionSpec): The partition spec of the manifests.
+        partition_filter (BooleanExpression): The filter on the partition, for example the inclusive
+            projection of the row filter.
+        row_filter (BooleanExpression): The filter on the rows.
+        case_sensitive (bool): Whether the column names are case-sensitive.
+        include_empty_files (bool): Whether to select data files without records.
+
+    Returns:
+        A function that returns the positions of the selected data files, or None when the filters
+        reference types that cannot be compared in Arrow.
+    """
+    partition_type = spec.partition_type(schema)
+    bound_partition_filter = bind(Schema(*partition_type.fields), partition_filter, case_sensitive)
+    bound_row_filter = bind(schema, rewrite_not(row_filter), case_sensitive)
+
+    def select(data_files: Dict[str, List[Any]]) -> List[int]:
+        record_counts = pa.array(data_files["record_count"], type=pa.int64())
+        partitions = _ArrowPartitionEvaluator(partition_type, data_files["partition"], len(record_counts))
+        metrics = _ArrowInclusiveMetricsEvaluator(data_files, len(record_counts))
+
+        might_match = boolean_expression_visit(bound_row_filter, metrics)
+        if not include_empty_files:
+            might_match = pc.and_(might_match, pc.not_equal(record_counts, 0))
+        # Older versions set the record count to -1 when importing avro tables
+        might_match = pc.or_(might_match, pc.less(record_counts, 0))
+
+        selected = pc.and_(boolean_expression_visit(bound_partition_filter, partitions), might_match)
+        return np.flatnonzero(selected.to_numpy(zero_copy_only=False)).tolist()
+
+    try:
+        # Check upfront that the filters can be evaluated on the types of the columns
+        select({
+            **{field.name: [] for field in MANIFEST_ENTRY_PRUNING_DATA_FILE_TYPE.fields},
+            "partition": [[] for _ in partition_type.fields],
+        })
+    except (NotImplementedError, pa.ArrowException):
+        return None
+
+    return select
+
+
 @lru_cache
 def _get_file_format(file_format: FileFormat, **kwargs: Dict[str, Any]) -> ds.FileFormat:
     if file_format == FileFormat.PARQUET:
@@ -624,24 +1041,236 @@ def _construct_fragment(fs: FileSystem, data_file: DataFile, file_format_kwargs:
     return _get_file_format(data_file.file_format, **file_format_kwargs).make_fragment(path, fs)
 
 
+def _positional_deletes_size(deletes: Dict[str, pa.ChunkedArray]) -> int:
+    return sum(sys.getsizeof(file) + positions.nbytes for file, positions in deletes.items())
+
+
+class PositionalDeleteCache(SharedCache[str, Dict[str, pa.ChunkedArray]]):
+    """The process-wide cache of the positions of positional delete files, grouped by data file.
+
+    Delete files are never changed once they are written, so the grouped positions are
+    cached by the path of the delete file, and shared by all the scans that read it. The
+    cache is bounded by the size of the positions, which is configured with
+    `positional-delete-cache-size-bytes` (0 disables the cache).
+    """
+
+    config_key = POSITIONAL_DELETE_CACHE_SIZE_BYTES
+    default_max_weight = DEFAULT_POSITIONAL_DELETE_CACHE_SIZE_BYTES
+    weigher = _positional_deletes_size
+
+
 def _read_deletes(fs: FileSystem, data_file: DataFile) -> Dict[str, pa.ChunkedArray]:
-    delete_fragment = _construct_fragment(
-        fs, data_file, file_format_kwargs={"dictionary_columns": ("file_path",), "pre_buffer": True, "buffer_size": ONE_MEGABYTE}
-    )
-    table = ds.Scanner.from_fragment(fragment=delete_fragment).to_table()
-    table = table.unify_dictionaries()
+    def _load() -> Dict[str, pa.ChunkedArray]:
+        delete_fragment = _construct_fragment(
+            fs,
+            data_file,
+            file_format_kwargs={"dictionary_columns": ("file_path",), "pre_buffer": True, "buffer_size": ONE_MEGABYTE},
+        )
+        return _group_positional_deletes(ds.Scanner.from_fragment(fragment=delete_fragment).to_table())
+
+    return PositionalDeleteCache.get_or_create().get_or_load(data_file.file_path, _load)
+
+
+def _equality_deletes_size(table: pa.Table) -> int:
+    return table.nbytes
+
+
+class EqualityDeleteCache(SharedCache[str, pa.Table]):
+    """The process-wide cache of the rows of equality delete files.
+
+    Like the positional deletes, the equality columns of a delete file are cached by the path of
+    the delete file, and shared by all the scans that read it. The cache is bounded by the size of
+    the rows, which is configured with `equality-delete-cache-size-bytes` (0 disables the cache).
+    """
+
+    config_key = EQUALITY_DELETE_CACHE_SIZE_BYTES
+    default_max_weight = DEFAULT_EQUALITY_DELETE_CACHE_SIZE_BYTES
+    weigher = _equality_deletes_size
+
+
+def _read_equality_deletes(fs: FileSystem, data_file: DataFile) -> pa.Table:
+    """Read the equality columns of an equality delete file, named by their field-id."""
+
+    def _load() -> pa.Table:
+        if not data_file.equality_ids:
+            raise ValueError(f"Equality delete file without equality field-ids: {data_file.file_path}")
+
+        delete_fragment = _construct_fragment(fs, data_file, file_format_kwargs={"pre_buffer": True, "buffer_size": ONE_MEGABYTE})
+        physical_schema = delete_fragment.physical_schema
+        schema_raw = physical_schema.metadata.get(ICEBERG_SCHEMA) if physical_schema.metadata else None
+        file_schema = Schema.model_validate_json(schema_raw) if schema_raw is not None else pyarrow_to_schema(physical_schema)
+        columns = [_top_level_column_name(file_schema, field_id) for field_id in data_file.equality_ids]
+        if None in columns:
+            raise ValueError(f"Equality delete file without the equality columns {data_file.equality_ids}: {data_file.file_path}")
+
+        table = ds.Scanner.from_fragment(fragment=delete_fragment, schema=physical_schema, columns=columns).to_table()
+        return table.rename_columns([str(field_id) for field_id in data_file.equality_ids])
+
+    return EqualityDeleteCache.get_or_create().get_or_load(data_file.file_path, _load)
+
+
+def _top_level_column_name(schema: Schema, field_id: int) -> Optional[str]:
+    """Return the name of the top-level column with the field-id, or None when the schema does not have the field.
+
+    Raises:
+        NotImplementedError: When the field is nested.
+    """
+    for field in schema.fields:
+        if field.field_id == field_id:
+            return field.name
+    if schema.find_column_name(field_id) is not None:
+        raise NotImplementedError(f"Equality deletes on nested fields are not supported: {schema.find_column_name(field_id)}")
+    return None
+
+
+def _apply_equality_deletes(
+    table: pa.Table, file_schema: Schema, equality_deletes: List[Tuple[Tuple[int, ...], pa.Table]]
+) -> pa.Table:
+    """Remove the rows of a data file that are equal to a row of an equality delete file, on its equality columns.
+
+    The delete files with the same equality columns are removed with a single hash anti-join. Nulls
+    are equal to each other, which the join does not support, so each column is dictionary encoded
+    together with the deleted values, with nulls as a value, and the join is done on the indices.
+
+    Args:
+        table (pa.Table): The rows of the data file, in the projection of the file schema.
+        file_schema (Schema): The projected schema of the data file.
+        equality_deletes: The equality field-ids of the delete files, and their rows.
+    """
+    deletes_per_equality_ids: Dict[Tuple[int, ...], List[pa.Table]] = {}
+    for equality_ids, deletes in equality_deletes:
+        deletes_per_equality_ids.setdefault(equality_ids, []).append(deletes)
+
+    for equality_ids, delete_tables in deletes_per_equality_ids.items():
+        if len(table) == 0:
+            break
+
+        keys = [str(field_id) for field_id in equality_ids]
+        data_keys = {}
+        delete_keys = {}
+        for field_id, key in zip(equality_ids, keys):
+            delete_values = pa.chunked_array(
+                [chunk for delete_table in delete_tables for chunk in delete_table.column(key).chunks],
+                type=delete_tables[0].schema.field(key).type,
+            )
+            if (column_name := _top_level_column_name(file_schema, field_id)) is not None:
+                data_values = table.column(column_name)
+                delete_values = delete_values.cast(data_values.type)
+            else:
+                # The column is added after the data file was written, so all its values are null
+                data_values = pa.chunked_array([pa.nulls(len(table), type=delete_values.type)])
+
+            indices = pc.dictionary_encode(
+                pa.chunked_array(data_values.chunks + delete_values.chunks, type=data_values.type).combine_chunks(),
+                null_encoding="encode",
+            ).indices
+            data_keys[key] = indices.slice(0, len(table))
+            delete_keys[key] = indices.slice(len(table))
+
+        data_keys["_pos"] = pa.array(np.arange(len(table), dtype=np.int64))
+        remaining = pa.table(data_keys).join(pa.table(delete_keys), keys=keys, join_type="left anti")
+        if len(remaining) < len(table):
+            table = table.take(np.sort(remaining.column("_pos").to_numpy()))
+
+    return table
+
+
+def _group_positional_deletes(table: pa.Table) -> Dict[str, pa.ChunkedArray]:
+    """Group the positions of a positional delete file by the data file that they refer to, in a single pass.
+
+    The rows are ordered by the dictionary index of the file path, which is a no-op for delete files
+    that are sorted by file path as the spec requires, and each data file gets a slice of the
+    reordered positions.
+    """
+    if table.num_rows == 0:
+        return {}
+
+    file_paths = table.unify_dictionaries().column("file_path").combine_chunks()
+    positions = table.column("pos").combine_chunks()
+    file_indices = file_paths.indices.to_numpy(zero_copy_only=False)
+    if np.any(file_indices[1:] < file_indices[:-1]):
+        order = np.argsort(file_indices, kind="stable")
+        file_indices = file_indices[order]
+        positions = positions.take(pa.array(order))
+
+    # The rows where the file path changes
+    boundaries = (np.flatnonzero(np.diff(file_indices)) + 1).tolist()
+    files = file_paths.dictionary.to_pylist()
     return {
-        file.as_py(): table.filter(pc.field("file_path") == file).column("pos")
-        for file in table.column("file_path").chunks[0].dictionary
+        files[file_indices[start]]: pa.chunked_array([positions.slice(start, end - start)])
+        for start, end in zip([0, *boundaries], [*boundaries, len(file_indices)])
     }
 
 
-def _combine_positional_deletes(positional_deletes: List[pa.ChunkedArray], rows: int) -> pa.Array:
-    if len(positional_deletes) == 1:
-        all_chunks = positional_deletes[0]
-    else:
-        all_chunks = pa.chunked_array(itertools.chain(*[arr.chunks for arr in positional_deletes]))
-    return np.setdiff1d(np.arange(rows), all_chunks, assume_unique=False)
+def _combine_positional_deletes(positional_deletes: List[pa.ChunkedArray]) -> npt.NDArray[np.int64]:
+    """Return the sorted and unique positions that are deleted from a data file."""
+    return np.unique(
+        np.concatenate([chunk.to_numpy() for positions in positional_deletes for chunk in positions.chunks]).astype(np.int64)
+    )
+
+
+def _rows_to_read(deleted_positions: npt.NDArray[np.int64], limit: int) -> int:
+    """Return the number of rows from the start of a data file that contain the first limit rows that are not deleted."""
+    rows = limit
+    while (required_rows := limit + int(np.searchsorted(deleted_positions, rows))) != rows:
+        rows = required_rows
+    return rows
+
+
+def _apply_positional_deletes(table: pa.Table, deleted_positions: npt.NDArray[np.int64]) -> pa.Table:
+    """Remove the rows at the deleted positions from the table, which holds the first rows of a data file.
+
+    When only a few rows are deleted, the table is sliced around them, which does not copy the
+    rows, and adds a chunk for each deleted row. Otherwise, a mask of the deleted rows is built and
+    applied as a filter.
+    """
+    deleted_positions = deleted_positions[: np.searchsorted(deleted_positions, len(table))]
+    if len(deleted_positions) == 0:
+        return table
+
+    if (
+        len(deleted_positions) <= MAX_SPARSE_POSITIONAL_DELETES
+        and len(deleted_positions) * SPARSE_POSITIONAL_DELETES_RATIO <= len(table)
+    ):
+        starts = [0, *(deleted_positions + 1).tolist()]
+        ends = [*deleted_positions.tolist(), len(table)]
+        return pa.concat_tables([table.slice(start, end - start) for start, end in zip(starts, ends) if end > start])
+
+    mask = np.ones(len(table), dtype=bool)
+    mask[deleted_positions] = False
+    return table.filter(pa.array(mask))
+
+
+def _prune_row_groups(
+    fragment: ds.ParquetFileFragment, schema: pa.Schema, pyarrow_filter: pc.Expression, deleted_positions: npt.NDArray[np.int64]
+) -> Tuple[ds.ParquetFileFragment, npt.NDArray[np.int64]]:
+    """Select the row groups that might contain rows that match the filter, based on their statistics.
+
+    Returns:
+        The fragment with only the selected row groups, and the deleted positions within the rows of the
+        selected row groups.
+    """
+    fragment.ensure_complete_metadata()
+    selected_ids = sorted(row_group.id for row_group in fragment.subset(filter=pyarrow_filter, schema=schema).row_groups)
+    if len(selected_ids) == fragment.num_row_groups:
+        return fragment, deleted_positions
+
+    metadata = fragment.metadata
+    row_counts = np.array([metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)], dtype=np.int64)
+    file_starts = np.cumsum(row_counts) - row_counts
+    selected_counts = row_counts[selected_ids]
+    # The distance that the rows of each of the selected row groups move, when the other row groups are skipped
+    shifts = np.zeros(len(row_counts), dtype=np.int64)
+    shifts[selected_ids] = file_starts[selected_ids] - (np.cumsum(selected_counts) - selected_counts)
+    is_selected = np.zeros(len(row_counts), dtype=bool)
+    is_selected[selected_ids] = True
+
+    row_groups = np.searchsorted(file_starts, deleted_positions, side="right") - 1
+    in_selected = is_selected[row_groups]
+    return (
+        fragment.subset(row_group_ids=selected_ids),
+        deleted_positions[in_selected] - shifts[row_groups[in_selected]],
+    )
 
 
 def pyarrow_to_schema(schema: pa.Schema, name_mapping: Optional[NameMapping] = None) -> Schema:
@@ -938,6 +1567,91 @@ class _ConvertToIcebergWithoutIDs(_ConvertToIceberg):
         return -1
 
 
+def _parquet_footer_size(entry: Tuple[FileSystem, ds.ParquetFileFragment]) -> int:
+    return entry[1].metadata.serialized_size
+
+
+class ParquetFooterCache(SharedCache[Tuple[str, int], Tuple[FileSystem, ds.ParquetFileFragment]]):
+    """The process-wide cache of the footers of Parquet data files.
+
+    Data files are never changed once they are written, so their footers are cached by
+    their path and size. They are kept as Arrow fragments that already loaded the footer,
+    so a scan of a cached file only reads the column chunks. The cache is bounded by the
+    size of the footers, which is configured with `parquet-footer-cache-size-bytes`
+    (0 disables the cache).
+    """
+
+    config_key = PARQUET_FOOTER_CACHE_SIZE_BYTES
+    default_max_weight = DEFAULT_PARQUET_FOOTER_CACHE_SIZE_BYTES
+    weigher = _parquet_footer_size
+
+
+def _parquet_fragment(fs: FileSystem, data_file: DataFile) -> ds.ParquetFileFragment:
+    """Return the fragment of a Parquet data file with its footer loaded, through the footer cache."""
+    _, _, path = PyArrowFileIO.parse_location(data_file.file_path)
+    cache = ParquetFooterCache.get_or_create()
+    key = (path, data_file.file_size_in_bytes)
+    # The fragment reads through the file system that it was created with, so it is only
+    # reused by scans with an equal file system, which includes equal credentials
+    if (entry := cache.get(key)) is not None and entry[0].equals(fs):
+        return entry[1]
+
+    fragment = ds.ParquetFileFormat(pre_buffer=True, buffer_size=(ONE_MEGABYTE * 8)).make_fragment(path, fs)
+    fragment.ensure_complete_metadata()
+    if entry is not None:
+        cache.invalidate(key)
+    cache.put(key, (fs, fragment))
+    return fragment
+
+
+@dataclass(frozen=True)
+class _FileProjection:
+    file_schema: Schema
+    pyarrow_filter: Optional[pc.Expression]
+    file_project_schema: Schema
+
+
+def _file_projection(
+    physical_schema: pa.Schema,
+    bound_row_filter: BooleanExpression,
+    projected_field_ids: Set[int],
+    case_sensitive: bool,
+    name_mapping: Optional[NameMapping],
+    file_projections: Dict[Any, _FileProjection],
+) -> _FileProjection:
+    """Resolve the Iceberg schema, the filter and the projected schema of a data file.
+
+    They only depend on the schema of the file, so they are memoized in file_projections by the
+    embedded Iceberg schema, or by the Arrow schema for files without one. The files of a scan
+    usually share a handful of schemas.
+    """
+    schema_raw = None
+    if metadata := physical_schema.metadata:
+        schema_raw = metadata.get(ICEBERG_SCHEMA)
+    key = (
+        schema_raw if schema_raw is not None else physical_schema.serialize().to_pybytes(),
+        frozenset(projected_field_ids),
+    )
+    if (projection := file_projections.get(key)) is not None:
+        return projection
+
+    file_schema = (
+        Schema.model_validate_json(schema_raw) if schema_raw is not None else pyarrow_to_schema(physical_schema, name_mapping)
+    )
+
+    pyarrow_filter = None
+    if bound_row_filter is not AlwaysTrue():
+        translated_row_filter = translate_column_names(bound_row_filter, file_schema, case_sensitive=case_sensitive)
+        bound_file_filter = bind(file_schema, translated_row_filter, case_sensitive=case_sensitive)
+        pyarrow_filter = expression_to_pyarrow(bound_file_filter)
+
+    file_project_schema = sanitize_column_names(prune_columns(file_schema, projected_field_ids, select_full_types=False))
+
+    projection = _FileProjection(file_schema, pyarrow_filter, file_project_schema)
+    file_projections[key] = projection
+    return projection
+
+
 def _task_to_table(
     fs: FileSystem,
     task: FileScanTask,
@@ -948,77 +1662,79 @@ def _task_to_table(
     case_sensitive: bool,
     limit: Optional[int] = None,
     name_mapping: Optional[NameMapping] = None,
+    file_projections: Optional[Dict[Any, _FileProjection]] = None,
+    equality_deletes: Optional[List[Tuple[Tuple[int, ...], pa.Table]]] = None,
 ) -> Optional[pa.Table]:
-    _, _, path = PyArrowFileIO.parse_location(task.file.file_path)
-    arrow_format = ds.ParquetFileFormat(pre_buffer=True, buffer_size=(ONE_MEGABYTE * 8))
-    with fs.open_input_file(path) as fin:
-        fragment = arrow_format.make_fragment(fin)
-        physical_schema = fragment.physical_schema
-        schema_raw = None
-        if metadata := physical_schema.metadata:
-            schema_raw = metadata.get(ICEBERG_SCHEMA)
-        file_schema = (
-            Schema.model_validate_json(schema_raw) if schema_raw is not None else pyarrow_to_schema(physical_schema, name_mapping)
-        )
-
-        pyarrow_filter = None
-        if bound_row_filter is not AlwaysTrue():
-            translated_row_filter = translate_column_names(bound_row_filter, file_schema, case_sensitive=case_sensitive)
-            bound_file_filter = bind(file_schema, translated_row_filter, case_sensitive=case_sensitive)
-            pyarrow_filter = expression_to_pyarrow(bound_file_filter)
-
-        file_project_schema = sanitize_column_names(prune_columns(file_schema, projected_field_ids, select_full_types=False))
+    fragment = _parquet_fragment(fs, task.file)
+    physical_schema = fragment.physical_schema
+    if equality_deletes:
+        # The equality columns are read to apply the deletes, and dropped by the projection afterwards
+        projected_field_ids = projected_field_ids.union(*(equality_ids for equality_ids, _ in equality_deletes))
+    projection = _file_projection(
+        physical_schema,
+        bound_row_filter,
+        projected_field_ids,
+        case_sensitive,
+        name_mapping,
+        file_projections if file_projections is not None else {},
+    )
+    pyarrow_filter = projection.pyarrow_filter
+    file_project_schema = projection.file_project_schema
+
+    deleted_positions = _combine_positional_deletes(positional_deletes) if positional_deletes else None
+    if deleted_positions is not None and pyarrow_filter is not None:
+        # The filter cannot be pushed down to Arrow, so skip the row groups that cannot match ourselves
+        fragment, deleted_positions = _prune_row_groups(fragment, physical_schema, pyarrow_filter, deleted_positions)
+
+    fragment_scanner = ds.Scanner.from_fragment(
+        fragment=fragment,
+        schema=physical_schema,
+        # This will push down the query to Arrow.
+        # But in case there are positional deletes, we have to apply them first
+        filter=pyarrow_filter if deleted_positions is None else None,
+        columns=[col.name for col in file_project_schema.columns],
+    )
 
-        if file_schema is None:
-            raise ValueError(f"Missing Iceberg schema in Metadata for file: {path}")
+    if deleted_positions is not None:
+        if limit and pyarrow_filter is None and not equality_deletes:
+            # Only the rows up to the limit-th row that is not deleted have to be read
+            arrow_table = _apply_positional_deletes(
+                fragment_scanner.head(_rows_to_read(deleted_positions, limit)), deleted_positions
+            )
+        else:
+            arrow_table = _apply_positional_deletes(fragment_scanner.to_table(), deleted_positions)
+            # Apply the user filter
+            if pyarrow_filter is not None:
+                # In case of the filter, we don't exactly know how many rows
+                # we need to fetch upfront, can be optimized in the future:
+                # https://github.com/apache/arrow/issues/35301
+                arrow_table = arrow_table.filter(pyarrow_filter)
+    else:
+        # If there are no deletes, we can just take the head
+        # and the user-filter is already applied
+        if limit and not equality_deletes:
+            arrow_table = fragment_scanner.head(limit)
+        else:
+            arrow_table = fragment_scanner.to_table()
 
-        fragment_scanner = ds.Scanner.from_fragment(
-            fragment=fragment,
-            schema=physical_schema,
-            # This will push down the query to Arrow.
-            # But in case there are positional deletes, we have to apply them first
-            filter=pyarrow_filter if not positional_deletes else None,
-            columns=[col.name for col in file_project_schema.columns],
-        )
+    if equality_deletes:
+        # The deletes are applied after the filter, which only keeps rows, so the order does not matter
+        arrow_table = _apply_equality_deletes(arrow_table, file_project_schema, equality_deletes)
 
-        if positional_deletes:
-            # Create the mask of indices that we're interested in
-            indices = _combine_positional_deletes(positional_deletes, fragment.count_rows())
-
-            if limit:
-                if pyarrow_filter is not None:
-                    # In case of the filter, we don't exactly know how many rows
-                    # we need to fetch upfront, can be optimized in the future:
-                    # https://github.com/apache/arrow/issues/35301
-                    arrow_table = fragment_scanner.take(indices)
-                    arrow_table = arrow_table.filter(pyarrow_filter)
-                    arrow_table = arrow_table.slice(0, limit)
-                else:
-                    arrow_table = fragment_scanner.take(indices[0:limit])
-            else:
-                arrow_table = fragment_scanner.take(indices)
-                # Apply the user filter
-                if pyarrow_filter is not None:
-                    arrow_table = arrow_table.filter(pyarrow_filter)
-        else:
-            # If there are no deletes, we can just take the head
-            # and the user-filter is already applied
-            if limit:
-                arrow_table = fragment_scanner.head(limit)
-            else:
-                arrow_table = fragment_scanner.to_table()
+    if limit:
+        arrow_table = arrow_table.slice(0, limit)
 
-        if len(arrow_table) < 1:
-            return None
+    if len(arrow_table) < 1:
+        return None
 
-        return to_requested_schema(projected_schema, file_project_schema, arrow_table)
+    return to_requested_schema(projected_schema, file_project_schema, arrow_table)
 
 
-def _read_all_delete_files(fs: FileSystem, tasks: Iterable[FileScanTask]) -> Dict[str, List[ChunkedArray]]:
+def _read_delete_files(fs: FileSystem, delete_files: Iterable[DataFile]) -> Dict[str, List[ChunkedArray]]:
     deletes_per_file: Dict[str, List[ChunkedArray]] = {}
-    unique_deletes = set(itertools.chain.from_iterable([task.delete_files for task in tasks]))
+    unique_deletes = {delete_file for delete_file in delete_files if delete_file.content == DataFileContent.POSITION_DELETES}
     if len(unique_deletes) > 0:
-        executor = ExecutorFactory.get_or_create()
+        executor = ExecutorFactory.get_or_create(IO_POOL)
         deletes_per_files: Iterator[Dict[str, ChunkedArray]] = executor.map(
             lambda args: _read_deletes(*args), [(fs, delete) for delete in unique_deletes]
         )
@@ -1032,6 +1748,59 @@ def _read_all_delete_files(fs: FileSystem, tasks: Iterable[FileScanTask]) -> Dic
     return deletes_per_file
 
 
+def _read_all_delete_files(fs: FileSystem, tasks: Iterable[FileScanTask]) -> Dict[str, List[ChunkedArray]]:
+    return _read_delete_files(fs, itertools.chain.from_iterable([task.delete_files for task in tasks]))
+
+
+def _read_equality_delete_files(fs: FileSystem, delete_files: Iterable[DataFile]) -> Dict[str, pa.Table]:
+    """Read the equality delete files concurrently, by their path."""
+    unique_deletes = {delete_file for delete_file in delete_files if delete_file.content == DataFileContent.EQUALITY_DELETES}
+    if len(unique_deletes) == 0:
+        return {}
+    executor = ExecutorFactory.get_or_create(IO_POOL)
+    return {
+        delete_file.file_path: deletes
+        for delete_file, deletes in zip(
+            unique_deletes, executor.map(lambda delete_file: _read_equality_deletes(fs, delete_file), unique_deletes)
+        )
+    }
+
+
+def _task_equality_deletes(
+    task: FileScanTask, equality_deletes_per_file: Dict[str, pa.Table]
+) -> Optional[List[Tuple[Tuple[int, ...], pa.Table]]]:
+    return [
+        (tuple(delete_file.equality_ids or ()), equality_deletes_per_file[delete_file.file_path])
+        for delete_file in task.delete_files
+        if delete_file.content == DataFileContent.EQUALITY_DELETES
+    ] or None
+
+
+def _fs_from_table(table: Table) -> FileSystem:
+    scheme, netloc, _ = PyArrowFileIO.parse_location(table.location())
+    if isinstance(table.io, PyArrowFileIO):
+        return table.io.fs_by_scheme(scheme, netloc)
+    else:
+        try:
+            from pyiceberg.io.fsspec import FsspecFileIO
+
+            if isinstance(table.io, FsspecFileIO):
+                from pyarrow.fs import PyFileSystem
+
+                return PyFileSystem(FSSpecHandler(table.io.get_fs(scheme)))
+            else:
+                raise ValueError(f"Expected PyArrowFileIO or FsspecFileIO, got: {table.io}")
+        except ModuleNotFoundError as e:
+            # When FsSpec is not installed
+            raise ValueError(f"Expected PyArrowFileIO or FsspecFileIO, got: {table.io}") from e
+
+
+def _projected_field_ids(projected_schema: Schema, bound_row_filter: BooleanExpression) -> Set[int]:
+    return {id for id in projected_schema.field_ids if not isinstance(projected_schema.find_type(id), (MapType, ListType))}.union(
+        extract_field_ids(bound_row_filter)
+    )
+
+
 def project_table(
     tasks: Iterable[FileScanTask],
     table: Table,
@@ -1053,31 +1822,21 @@ def project_table(
     Raises:
         ResolveError: When an incompatible query is done.
     """
-    scheme, netloc, _ = PyArrowFileIO.parse_location(table.location())
-    if isinstance(table.io, PyArrowFileIO):
-        fs = table.io.fs_by_scheme(scheme, netloc)
-    else:
-        try:
-            from pyiceberg.io.fsspec import FsspecFileIO
-
-            if isinstance(table.io, FsspecFileIO):
-                from pyarrow.fs import PyFileSystem
-
-                fs = PyFileSystem(FSSpecHandler(table.io.get_fs(scheme)))
-            else:
-                raise ValueError(f"Expected PyArrowFileIO or FsspecFileIO, got: {table.io}")
-        except ModuleNotFoundError as e:
-            # When FsSpec is not installed
-            raise ValueError(f"Expected PyArrowFileIO or FsspecFileIO, got: {table.io}") from e
+    # the tasks are traversed twice, first to collect the delete files
+    tasks = list(tasks)
+    fs = _fs_from_table(table)
 
     bound_row_filter = bind(table.schema(), row_filter, case_sensitive=case_sensitive)
 
-    projected_field_ids = {
-        id for id in projected_schema.field_ids if not isinstance(projected_schema.find_type(id), (MapType, ListType))
-    }.union(extract_field_ids(bound_row_filter))
+    projected_field_ids = _projected_field_ids(projected_schema, bound_row_filter)
 
     deletes_per_file = _read_all_delete_files(fs, tasks)
-    executor = ExecutorFactory.get_or_create()
+    equality_deletes_per_file = _read_equality_delete_files(
+        fs, itertools.chain.from_iterable([task.delete_files for task in tasks])
+    )
+    name_mapping = table.name_mapping()
+    file_projections: Dict[Any, _FileProjection] = {}
+    executor = ExecutorFactory.get_or_create(IO_POOL)
     futures = [
         executor.submit(
             _task_to_table,
@@ -1089,7 +1848,9 @@ def project_table(
             deletes_per_file.get(task.file.file_path),
             case_sensitive,
             limit,
-            table.name_mapping(),
+            name_mapping,
+            file_projections,
+            _task_equality_deletes(task, equality_deletes_per_file),
         )
         for task in tasks
     ]
@@ -1122,6 +1883,170 @@ def project_table(
     return result
 
 
+def project_batches(
+    tasks: Iterable[FileScanTask],
+    table: Table,
+    row_filter: BooleanExpression,
+    projected_schema: Schema,
+    case_sensitive: bool = True,
+    limit: Optional[int] = None,
+    read_ahead: Optional[int] = None,
+) -> Iterator[pa.RecordBatch]:
+    """Stream the record batches of the tasks, in the order of the tasks.
+
+    At most `read_ahead` files are read concurrently, so the memory footprint is
+    bounded by the files in flight and the delete caches, instead of the size of the
+    table. The tasks are consumed lazily, and the delete files of each task are read
+    when the task is submitted. A delete file that applies to several data files is
+    read from the positional or equality delete cache, unless it was evicted meanwhile.
+
+    Args:
+        tasks (Iterable[FileScanTask]): The tasks to read.
+        table (Table): The table that's being queried.
+        row_filter (BooleanExpression): The expression for filtering rows.
+        projected_schema (Schema): The output schema.
+        case_sensitive (bool): Case sensitivity when looking up column names.
+        limit (Optional[int]): Limit the number of records.
+        read_ahead (Optional[int]): The number of files that are read ahead, defaults to the number of workers.
+
+    Raises:
+        ResolveError: When an incompatible query is done.
+    """
+    fs = _fs_from_table(table)
+
+    bound_row_filter = bind(table.schema(), row_filter, case_sensitive=case_sensitive)
+
+    projected_field_ids = _projected_field_ids(projected_schema, bound_row_filter)
+    target_schema = schema_to_pyarrow(projected_schema)
+    name_mapping = table.name_mapping()
+
+    file_projections: Dict[Any, _FileProjection] = {}
+
+    def _task_arguments() -> Iterator[Tuple[Any, ...]]:
+        # consumed lazily, and the delete files are read for each task through the delete caches,
+        # so the deletes of the data files that were already read are not kept until the end of the stream
+        for task in tasks:
+            yield (
+                fs,
+                task,
+                bound_row_filter,
+                projected_schema,
+                projected_field_ids,
+                _read_delete_files(fs, task.delete_files).get(task.file.file_path),
+                case_sensitive,
+                limit,
+                name_mapping,
+                file_projections,
+                _task_equality_deletes(task, _read_equality_delete_files(fs, task.delete_files)),
+            )
+
+    total_row_count = 0
+    arrow_tables = bounded_map(
+        ExecutorFactory.get_or_create(IO_POOL), lambda args: _task_to_table(*args), _task_arguments(), max_in_flight=read_ahead
+    )
+    try:
+        for arrow_table in arrow_tables:
+            if arrow_table:
+                if limit is not None:
+                    arrow_table = arrow_table.slice(0, limit - total_row_count)
+                total_row_count += len(arrow_table)
+                yield from arrow_table.cast(target_schema).to_batches()
+
+            # stop early if limit is satisfied
+            if limit is not None and total_row_count >= limit:
+                break
+    finally:
+        # cancels the pending reads
+        arrow_tables.close()
+
+
+def _task_to_matching_positions(
+    fs: FileSystem,
+    task: FileScanTask,
+    bound_row_filter: BooleanExpression,
+    positional_deletes: Optional[List[ChunkedArray]],
+    case_sensitive: bool,
+    name_mapping: Optional[NameMapping],
+    file_projections: Dict[Any, _FileProjection],
+    equality_deletes: Optional[List[Tuple[Tuple[int, ...], pa.Table]]],
+) -> npt.NDArray[np.int64]:
+    """Return the sorted positions of the rows of the data file that match the filter, and that are not deleted yet.
+
+    Only the columns of the filter, and of the equality deletes, are read.
+    """
+    fragment = _parquet_fragment(fs, task.file)
+    physical_schema = fragment.physical_schema
+    projected_field_ids = extract_field_ids(bound_row_filter)
+    if equality_deletes:
+        projected_field_ids = projected_field_ids.union(*(equality_ids for equality_ids, _ in equality_deletes))
+    projection = _file_projection(
+        physical_schema, bound_row_filter, projected_field_ids, case_sensitive, name_mapping, file_projections
+    )
+
+    arrow_table = ds.Scanner.from_fragment(
+        fragment=fragment,
+        schema=physical_schema,
+        columns=[col.name for col in projection.file_project_schema.columns],
+    ).to_table()
+    arrow_table = arrow_table.append_column(ROW_POSITION_COLUMN, pa.array(np.arange(len(arrow_table), dtype=np.int64)))
+
+    if positional_deletes:
+        arrow_table = _apply_positional_deletes(arrow_table, _combine_positional_deletes(positional_deletes))
+    if equality_deletes:
+        arrow_table = _apply_equality_deletes(arrow_table, projection.file_project_schema, equality_deletes)
+    if projection.pyarrow_filter is not None:
+        # Rows for which the filter is null are not matched
+        arrow_table = arrow_table.filter(projection.pyarrow_filter)
+
+    return arrow_table.column(ROW_POSITION_COLUMN).to_numpy().astype(np.int64)
+
+
+def matching_positions(
+    tasks: Iterable[FileScanTask],
+    table: Table,
+    row_filter: BooleanExpression,
+    case_sensitive: bool = True,
+) -> List[Tuple[DataFile, npt.NDArray[np.int64]]]:
+    """Find the positions of the rows that match the filter, in the data files of the tasks.
+
+    The rows that are already deleted by the delete files of the tasks are skipped.
+
+    Args:
+        tasks (Iterable[FileScanTask]): The tasks of the data files to search.
+        table (Table): The table that's being queried.
+        row_filter (BooleanExpression): The expression that the rows have to match.
+        case_sensitive (bool): Case sensitivity when looking up column names.
+
+    Returns:
+        The data files with at least one matching row, and the sorted positions of those rows.
+    """
+    tasks = list(tasks)
+    fs = _fs_from_table(table)
+    bound_row_filter = bind(table.schema(), row_filter, case_sensitive=case_sensitive)
+
+    deletes_per_file = _read_all_delete_files(fs, tasks)
+    equality_deletes_per_file = _read_equality_delete_files(
+        fs, itertools.chain.from_iterable([task.delete_files for task in tasks])
+    )
+    name_mapping = table.name_mapping()
+    file_projections: Dict[Any, _FileProjection] = {}
+    executor = ExecutorFactory.get_or_create(IO_POOL)
+    positions = executor.map(
+        lambda task: _task_to_matching_positions(
+            fs,
+            task,
+            bound_row_filter,
+            deletes_per_file.get(task.file.file_path),
+            case_sensitive,
+            name_mapping,
+            file_projections,
+            _task_equality_deletes(task, equality_deletes_per_file),
+        ),
+        tasks,
+    )
+    return [(task.file, task_positions) for task, task_positions in zip(tasks, positions) if len(task_positions) > 0]
+
+
 def to_requested_schema(requested_schema: Schema, file_schema: Schema, table: pa.Table) -> pa.Table:
     struct_array = visit_with_partner(requested_schema, table, ArrowProjectionVisitor(file_schema), ArrowAccessor(file_schema))
 
@@ -1772,22 +2697,31 @@ def write_file(io: FileIO, table_metadata: TableMetadata, tasks: Iterator[WriteT
     )
 
     def write_parquet(task: WriteTask) -> DataFile:
-        file_path = f'{table_metadata.location}/data/{task.generate_data_file_filename("parquet")}'
+        file_name = task.generate_data_file_filename("parquet")
+        if task.partition_key is not None:
+            file_path = f"{table_metadata.location}/data/{task.partition_key.to_path()}/{file_name}"
+        else:
+            file_path = f"{table_metadata.location}/data/{file_name}"
         fo = io.new_output(file_path)
         with fo.create(overwrite=True) as fos:
             with pq.ParquetWriter(fos, schema=arrow_file_schema, **parquet_writer_kwargs) as writer:
                 writer.write(pa.Table.from_batches(task.record_batches), row_group_size=row_group_size)
 
-        statistics = data_file_statistics_from_parquet_metadata(
-            parquet_metadata=writer.writer.metadata,
-            stats_columns=compute_statistics_plan(schema, table_metadata.properties),
-            parquet_column_mapping=parquet_path_to_id_mapping(schema),
+        statistics = (
+            ExecutorFactory.get_or_create(CPU_POOL)
+            .submit(
+                data_file_statistics_from_parquet_metadata,
+                parquet_metadata=writer.writer.metadata,
+                stats_columns=compute_statistics_plan(schema, table_metadata.properties),
+                parquet_column_mapping=parquet_path_to_id_mapping(schema),
+            )
+            .result()
         )
         data_file = DataFile(
             content=DataFileContent.DATA,
             file_path=file_path,
             file_format=FileFormat.PARQUET,
-            partition=Record(),
+            partition=task.partition_key.partition if task.partition_key is not None else Record(),
             file_size_in_bytes=len(fo),
             # After this has been fixed:
             # https://github.com/apache/iceberg-python/issues/271
@@ -1802,12 +2736,106 @@ def write_file(io: FileIO, table_metadata: TableMetadata, tasks: Iterator[WriteT
 
         return data_file
 
-    executor = ExecutorFactory.get_or_create()
+    executor = ExecutorFactory.get_or_create(IO_POOL)
     data_files = executor.map(write_parquet, tasks)
 
     return iter(data_files)
 
 
+def write_positional_deletes(
+    io: FileIO,
+    table_metadata: TableMetadata,
+    positions: Iterable[Tuple[DataFile, npt.NDArray[np.int64]]],
+    write_uuid: Optional[uuid.UUID] = None,
+) -> Iterator[DataFile]:
+    """Write the deleted positions of the data files into positional delete files.
+
+    A delete file is written for each partition of the data files, with the rows sorted by the
+    path of the data file and the position, as the spec requires. The bounds of the file paths
+    are kept in full, so that scans can tell which data files a delete file applies to.
+
+    Args:
+        io (FileIO): The FileIO to write the delete files with.
+        table_metadata (TableMetadata): The metadata of the table.
+        positions: The data files, and their sorted positions to delete.
+        write_uuid (Optional[uuid.UUID]): The unique identifier of the write, used in the file names.
+
+    Returns:
+        An iterator over the positional delete files.
+    """
+    write_uuid = write_uuid or uuid.uuid4()
+    schema = table_metadata.schema()
+    specs = table_metadata.specs()
+    arrow_file_schema = schema_to_pyarrow(POSITIONAL_DELETE_SCHEMA)
+    parquet_writer_kwargs = _get_parquet_writer_kwargs(table_metadata.properties)
+    stats_columns = compute_statistics_plan(POSITIONAL_DELETE_SCHEMA, {TableProperties.DEFAULT_WRITE_METRICS_MODE: "full"})
+    parquet_column_mapping = parquet_path_to_id_mapping(POSITIONAL_DELETE_SCHEMA)
+
+    partitions: Dict[Tuple[int, Tuple[Any, ...]], List[Tuple[DataFile, npt.NDArray[np.int64]]]] = {}
+    for data_file, data_file_positions in positions:
+        if len(data_file_positions) > 0:
+            spec_id = data_file.spec_id if data_file.spec_id is not None else table_metadata.default_spec_id
+            partitions.setdefault((spec_id, tuple(data_file.partition.record_fields())), []).append((
+                data_file,
+                data_file_positions,
+            ))
+
+    def write_deletes(task_id: int, spec_id: int, partition_positions: List[Tuple[DataFile, npt.NDArray[np.int64]]]) -> DataFile:
+        partition_positions = sorted(partition_positions, key=lambda file_positions: file_positions[0].file_path)
+        partition = partition_positions[0][0].partition
+        spec = specs[spec_id]
+
+        file_name = f"00000-{task_id}-{write_uuid}-deletes.parquet"
+        if spec.is_unpartitioned():
+            file_path = f"{table_metadata.location}/data/{file_name}"
+        else:
+            file_path = f"{table_metadata.location}/data/{spec.partition_to_path(partition, schema)}/{file_name}"
+
+        file_paths = pa.array([data_file.file_path for data_file, _ in partition_positions], type=pa.string())
+        counts = [len(data_file_positions) for _, data_file_positions in partition_positions]
+        arrow_table = pa.Table.from_arrays(
+            [
+                file_paths.take(pa.array(np.repeat(np.arange(len(counts)), counts))),
+                pa.array(np.concatenate([data_file_positions for _, data_file_positions in partition_positions])),
+            ],
+            schema=arrow_file_schema,
+        )
+
+        fo = io.new_output(file_path)
+        with fo.create(overwrite=True) as fos:
+            with pq.ParquetWriter(fos, schema=arrow_file_schema, **parquet_writer_kwargs) as writer:
+                writer.write(arrow_table)
+
+        statistics = data_file_statistics_from_parquet_metadata(
+            parquet_metadata=writer.writer.metadata,
+            stats_columns=stats_columns,
+            parquet_column_mapping=parquet_column_mapping,
+        )
+        return DataFile(
+            content=DataFileContent.POSITION_DELETES,
+            file_path=file_path,
+            file_format=FileFormat.PARQUET,
+            partition=partition,
+            file_size_in_bytes=len(fo),
+            sort_order_id=None,
+            spec_id=spec_id,
+            equality_ids=None,
+            key_metadata=None,
+            **statistics.to_serialized_dict(),
+        )
+
+    executor = ExecutorFactory.get_or_create(IO_POOL)
+    return iter(
+        executor.map(
+            lambda args: write_deletes(*args),
+            [
+                (task_id, spec_id, partition_positions)
+                for task_id, ((spec_id, _), partition_positions) in enumerate(partitions.items())
+            ],
+        )
+    )
+
+
 def bin_pack_arrow_table(tbl: pa.Table, target_file_size: int) -> Iterator[List[pa.RecordBatch]]:
     from pyiceberg.utils.bin_packing import PackingIterator
 
@@ -1824,6 +2852,76 @@ def bin_pack_arrow_table(tbl: pa.Table, target_file_size: int) -> Iterator[List[
     return bin_packed_record_batches
 
 
+@dataclass(frozen=True)
+class TablePartition:
+    partition_key: PartitionKey
+    arrow_table_partition: pa.Table
+
+
+def _source_column(arrow_table: pa.Table, schema: Schema, source_id: int) -> pa.ChunkedArray:
+    """Look up the column of a (possibly nested) source field by its position in the schema."""
+    accessor = schema.accessor_for_field(source_id)
+    column = arrow_table.column(accessor.position)
+    while accessor.inner is not None:
+        accessor = accessor.inner
+        column = pc.struct_field(column, [accessor.position])
+    return column
+
+
+def _partition_key_column(partition_field: PartitionField, schema: Schema, arrow_table: pa.Table) -> pa.ChunkedArray:
+    """Return the partition values of the partition field for each of the rows."""
+    column = _source_column(arrow_table, schema, partition_field.source_id)
+    return partition_field.transform.pyarrow_transform(schema.find_type(partition_field.source_id))(column)
+
+
+def determine_partitions(spec: PartitionSpec, schema: Schema, arrow_table: pa.Table) -> List[TablePartition]:
+    """Split the Arrow table into a table per partition of the spec.
+
+    The rows are sorted on their partition values, after which every partition
+    is a contiguous (zero-copy) slice of the sorted table.
+
+    Args:
+        spec (PartitionSpec): The partition spec to split the table on.
+        schema (Schema): The schema of the table.
+        arrow_table (pa.Table): The table with the data, in the same column order as the schema.
+
+    Returns:
+        A TablePartition for each distinct partition value in the table.
+    """
+    partition_columns = {
+        f"_partition_{pos}": _partition_key_column(partition_field, schema, arrow_table)
+        for pos, partition_field in enumerate(spec.fields)
+    }
+    sort_indices = pc.sort_indices(pa.table(partition_columns), sort_keys=[(name, "ascending") for name in partition_columns])
+    sorted_table = arrow_table.take(sort_indices)
+
+    # After sorting, each group starts at its lowest row number and spans count rows
+    groups = (
+        pa.table(partition_columns)
+        .take(sort_indices)
+        .append_column("_row", pa.array(np.arange(len(sort_indices), dtype=np.int64)))
+        .group_by(list(partition_columns))
+        .aggregate([("_row", "min"), ("_row", "count")])
+    )
+
+    source_columns = [_source_column(sorted_table, schema, partition_field.source_id) for partition_field in spec.fields]
+    table_partitions = []
+    for offset, length in sorted(zip(groups["_row_min"].to_pylist(), groups["_row_count"].to_pylist())):
+        partition_key = PartitionKey(
+            raw_partition_field_values=[
+                PartitionFieldValue(field=partition_field, value=source_column[offset].as_py())
+                for partition_field, source_column in zip(spec.fields, source_columns)
+            ],
+            partition_spec=spec,
+            schema=schema,
+        )
+        table_partitions.append(
+            TablePartition(partition_key=partition_key, arrow_table_partition=sorted_table.slice(offset, length))
+        )
+
+    return table_partitions
+
+
 def parquet_files_to_data_files(io: FileIO, table_metadata: TableMetadata, file_paths: Iterator[str]) -> Iterator[DataFile]:
     for file_path in file_paths:
         input_file = io.new_input(file_path)
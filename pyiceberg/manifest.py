@@ -16,28 +16,36 @@
 # under the License.
 from __future__ import annotations
 
+import json
 import math
 from abc import ABC, abstractmethod
 from enum import Enum
-from functools import singledispatch
+from functools import lru_cache, partial, singledispatch
 from types import TracebackType
 from typing import (
     Any,
+    Callable,
+    Collection,
     Dict,
+    Iterable,
     Iterator,
     List,
     Literal,
     Optional,
+    Tuple,
     Type,
 )
 
-from pyiceberg.avro.file import AvroFile, AvroOutputFile
+from pyiceberg.avro.decoder import new_decoder
+from pyiceberg.avro.file import _SCHEMA_KEY, AvroFile, AvroOutputFile
+from pyiceberg.avro.reader import Reader
+from pyiceberg.avro.resolver import resolve_reader
 from pyiceberg.conversions import to_bytes
 from pyiceberg.exceptions import ValidationError
 from pyiceberg.io import FileIO, InputFile, OutputFile
 from pyiceberg.partitioning import PartitionSpec
 from pyiceberg.schema import Schema
-from pyiceberg.typedef import EMPTY_DICT, Record
+from pyiceberg.typedef import EMPTY_DICT, Record, StructProtocol
 from pyiceberg.types import (
     BinaryType,
     BooleanType,
@@ -55,10 +63,16 @@ from pyiceberg.types import (
     TimestamptzType,
     TimeType,
 )
+from pyiceberg.utils.cache import SharedCache
+from pyiceberg.utils.concurrent import CPU_POOL, ExecutorFactory, bounded_map
+from pyiceberg.utils.schema_conversion import AvroSchemaConversion
 
 UNASSIGNED_SEQ = -1
 DEFAULT_BLOCK_SIZE = 67108864  # 64 * 1024 * 1024
+DEFAULT_MANIFEST_BLOCK_SIZE_BYTES = 65536  # 64 * 1024
 DEFAULT_READ_VERSION: Literal[2] = 2
+MANIFEST_CACHE_SIZE_BYTES = "manifest-cache-size-bytes"
+DEFAULT_MANIFEST_CACHE_SIZE_BYTES = 134217728  # 128 * 1024 * 1024
 
 INITIAL_SEQUENCE_NUMBER = 0
 
@@ -407,6 +421,17 @@ MANIFEST_ENTRY_SCHEMAS = {
 
 MANIFEST_ENTRY_SCHEMAS_STRUCT = {format_version: schema.as_struct() for format_version, schema in MANIFEST_ENTRY_SCHEMAS.items()}
 
+# The fields of a manifest entry that are needed to decide whether the data file has to be read:
+# the status, and the partition, record count and column metrics of the data file
+MANIFEST_ENTRY_PRUNING_DATA_FILE_TYPE = StructType(*[
+    field for field in DATA_FILE_TYPE[DEFAULT_READ_VERSION].fields if field.field_id in {102, 103, 109, 110, 125, 128, 137}
+])
+MANIFEST_ENTRY_PRUNING_SCHEMA = Schema(
+    NestedField(0, "status", IntegerType(), required=True),
+    NestedField(2, "data_file", MANIFEST_ENTRY_PRUNING_DATA_FILE_TYPE, required=True),
+)
+
+
 
 def manifest_entry_schema_with_data_file(format_version: Literal[1, 2], data_file: StructType) -> Schema:
     return Schema(*[
@@ -427,6 +452,10 @@ class ManifestEntry(Record):
         super().__init__(*data, **{"struct": MANIFEST_ENTRY_SCHEMAS_STRUCT[DEFAULT_READ_VERSION], **named_data})
 
 
+_MANIFEST_ENTRY_READ_TYPES: Dict[int, Callable[..., StructProtocol]] = {-1: ManifestEntry, 2: DataFile}
+_MANIFEST_ENTRY_READ_ENUMS: Dict[int, Callable[..., Enum]] = {0: ManifestEntryStatus, 101: FileFormat, 134: DataFileContent}
+
+
 PARTITION_FIELD_SUMMARY_TYPE = StructType(
     NestedField(509, "contains_null", BooleanType(), required=True),
     NestedField(518, "contains_nan", BooleanType(), required=False),
@@ -532,7 +561,8 @@ MANIFEST_LIST_FILE_STRUCTS = {format_version: schema.as_struct() for format_vers
 
 
 POSITIONAL_DELETE_SCHEMA = Schema(
-    NestedField(2147483546, "file_path", StringType()), NestedField(2147483545, "pos", IntegerType())
+    NestedField(2147483546, "file_path", StringType(), required=True),
+    NestedField(2147483545, "pos", LongType(), required=True),
 )
 
 
@@ -579,6 +609,9 @@ class ManifestFile(Record):
     def has_existing_files(self) -> bool:
         return self.existing_files_count is None or self.existing_files_count > 0
 
+    def has_deleted_files(self) -> bool:
+        return self.deleted_files_count is None or self.deleted_files_count > 0
+
     def fetch_manifest_entry(self, io: FileIO, discard_deleted: bool = True) -> List[ManifestEntry]:
         """
         Read the manifest entries from the manifest file.
@@ -590,18 +623,226 @@ class ManifestFile(Record):
         Returns:
             An Iterator of manifest entries.
         """
-        input_file = io.new_input(self.manifest_path)
+        entries = ManifestCache.get_or_create().get_or_load(self._cache_key(), lambda: tuple(self._read_manifest_entries(io)))
+        return [entry for entry in entries if not discard_deleted or entry.status != ManifestEntryStatus.DELETED]
+
+    def fetch_selected_manifest_entries(
+        self, io: FileIO, select: Callable[[Dict[str, List[Any]]], Iterable[int]], discard_deleted: bool = True
+    ) -> List[ManifestEntry]:
+        """
+        Read the manifest entries of the data files that are selected based on their partition and metrics.
+
+        The fields of the data files in MANIFEST_ENTRY_PRUNING_SCHEMA are decoded into a list per field
+        for all the entries, and passed to select. Only the selected entries are decoded into
+        ManifestEntries, the other ones are skipped. When the entries of the manifest are already
+        cached, the columns are taken from the cached data files instead.
+
+        Args:
+            io: The FileIO to fetch the file.
+            select: Returns the positions of the selected data files, given the values of the fields of the
+                data files by name. The partition is given as a list of values per partition field.
+            discard_deleted: Filter on live entries.
+
+        Returns:
+            The selected manifest entries.
+        """
+        if (cached_entries := ManifestCache.get_or_create().get(self._cache_key())) is not None:
+            entries = [entry for entry in cached_entries if not discard_deleted or entry.status != ManifestEntryStatus.DELETED]
+            return [entries[pos] for pos in select(_data_file_columns([entry.data_file for entry in entries]))] if entries else []
+
+        entry_columns, data_file_columns, partition_columns = _ColumnarStruct(), _ColumnarStruct(), _ColumnarStruct()
+        selected_entries = []
+        with AvroFile[Record](io.new_input(self.manifest_path)) as manifest:
+            pruning_reader = resolve_reader(
+                manifest.schema,
+                MANIFEST_ENTRY_PRUNING_SCHEMA,
+                read_types={-1: entry_columns, 2: data_file_columns, 102: partition_columns},
+            )
+            entry_reader = resolve_reader(
+                manifest.schema,
+                MANIFEST_ENTRY_SCHEMAS[DEFAULT_READ_VERSION],
+                _MANIFEST_ENTRY_READ_TYPES,
+                _MANIFEST_ENTRY_READ_ENUMS,
+            )
+
+            # The blocks are pruned and decoded one at a time, so only a single block is kept in memory
+            for block_records, block_bytes in manifest.blocks():
+                if block_records == 0:
+                    continue
+                for columnar_struct in (entry_columns, data_file_columns, partition_columns):
+                    columnar_struct.clear()
+
+                block_decoder = new_decoder(block_bytes)
+                offsets = []
+                for _ in range(block_records):
+                    offsets.append(block_decoder.tell())
+                    pruning_reader.read(block_decoder)
+
+                columns = {
+                    field.name: values
+                    for field, values in zip(MANIFEST_ENTRY_PRUNING_DATA_FILE_TYPE.fields, data_file_columns.columns)
+                }
+                columns["partition"] = partition_columns.columns
+                statuses = entry_columns.columns[0]
+
+                decoder = new_decoder(block_bytes)
+                for offset in sorted(
+                    offsets[pos] for pos in select(columns) if not discard_deleted or statuses[pos] != ManifestEntryStatus.DELETED
+                ):
+                    decoder.skip(offset - decoder.tell())
+                    selected_entries.append(_inherit_from_manifest(entry_reader.read(decoder), self))
+
+        return selected_entries
+
+    def fetch_projected_manifest_entries(
+        self,
+        io: FileIO,
+        data_file_fields: Collection[str],
+        discard_deleted: bool = True,
+    ) -> List[ManifestEntry]:
+        """
+        Read the manifest entries, decoding only the selected fields of the data files.
+
+        The other fields of the data files are skipped while decoding, and are not set on the
+        returned data files. The file_path is always read. When the entries of the manifest are
+        already cached, the cached entries are returned instead, with all their fields.
+
+        Args:
+            io: The FileIO to fetch the file.
+            data_file_fields: The names of the fields of the data files to read.
+            discard_deleted: Filter on live entries.
+
+        Returns:
+            The manifest entries with the projected data files.
+        """
+        if (cached_entries := ManifestCache.get_or_create().get(self._cache_key())) is not None:
+            return [entry for entry in cached_entries if not discard_deleted or entry.status != ManifestEntryStatus.DELETED]
+
+        data_file_type = DATA_FILE_TYPE[DEFAULT_READ_VERSION]
+        if unknown_fields := set(data_file_fields).difference(field.name for field in data_file_type.fields):
+            raise ValueError(f"Unknown data file fields: {', '.join(sorted(unknown_fields))}")
+
+        selected_fields = {"file_path", *data_file_fields}
+        projected_data_file_type = StructType(*[field for field in data_file_type.fields if field.name in selected_fields])
+
+        entries = []
         with AvroFile[ManifestEntry](
-            input_file,
-            MANIFEST_ENTRY_SCHEMAS[DEFAULT_READ_VERSION],
-            read_types={-1: ManifestEntry, 2: DataFile},
-            read_enums={0: ManifestEntryStatus, 101: FileFormat, 134: DataFileContent},
+            io.new_input(self.manifest_path),
+            manifest_entry_schema_with_data_file(DEFAULT_READ_VERSION, projected_data_file_type),
+            read_types=_MANIFEST_ENTRY_READ_TYPES,
+            read_enums=_MANIFEST_ENTRY_READ_ENUMS,
         ) as reader:
-            return [
-                _inherit_from_manifest(entry, self)
-                for entry in reader
-                if not discard_deleted or entry.status != ManifestEntryStatus.DELETED
-            ]
+            for entry in reader:
+                if discard_deleted and entry.status == ManifestEntryStatus.DELETED:
+                    continue
+                entries.append(_inherit_from_manifest(entry, self))
+
+        return entries
+
+    def _cache_key(self) -> Tuple[Any, ...]:
+        # The inherited fields are part of the key, since they are only assigned when the manifest is committed
+        return "manifest", self.manifest_path, self.sequence_number, self.added_snapshot_id, self.partition_spec_id
+
+    def _read_manifest_entries(self, io: FileIO) -> List[ManifestEntry]:
+        # The blocks are read from the stream in the calling thread, and decoded in the cpu pool while the next ones are read
+        entries: List[ManifestEntry] = []
+        with AvroFile[ManifestEntry](io.new_input(self.manifest_path)) as manifest:
+            decode_block = partial(_decode_manifest_block, self, manifest.header.meta[_SCHEMA_KEY])
+            for block_entries in bounded_map(ExecutorFactory.get_or_create(CPU_POOL), decode_block, manifest.blocks()):
+                entries.extend(block_entries)
+        return entries
+
+
+@lru_cache
+def _manifest_entry_reader(avro_schema: str) -> Reader:
+    """Return the reader of the manifest entries for the Avro schema of a manifest, which is shared by most manifests."""
+    return resolve_reader(
+        AvroSchemaConversion().avro_to_iceberg(json.loads(avro_schema)),
+        MANIFEST_ENTRY_SCHEMAS[DEFAULT_READ_VERSION],
+        _MANIFEST_ENTRY_READ_TYPES,
+        _MANIFEST_ENTRY_READ_ENUMS,
+    )
+
+
+def _decode_manifest_block(manifest: ManifestFile, avro_schema: str, block: Tuple[int, bytes]) -> List[ManifestEntry]:
+    """Decode the entries of a block of the manifest.
+
+    This is a module-level function, so it can be submitted to the cpu pool when it is a process pool.
+    """
+    block_records, block_bytes = block
+    reader = _manifest_entry_reader(avro_schema)
+    decoder = new_decoder(block_bytes)
+    return [_inherit_from_manifest(reader.read(decoder), manifest) for _ in range(block_records)]
+
+
+class _ColumnarStruct(StructProtocol):
+    """Collects the values of the structs that are read from Avro in a list per field, instead of a record per struct.
+
+    It is passed as its own read type, so the reader assigns all the structs to the same instance.
+    """
+
+    __slots__ = ("columns",)
+    columns: List[List[Any]]
+
+    def __init__(self) -> None:
+        self.columns = []
+
+    def clear(self) -> None:
+        """Remove the values that are collected so far."""
+        self.columns = []
+
+    def __call__(self, struct: StructType) -> _ColumnarStruct:
+        if len(self.columns) != len(struct.fields):
+            self.columns = [[] for _ in struct.fields]
+        return self
+
+    def __getitem__(self, pos: int) -> List[Any]:
+        """Return the values of the field at the position."""
+        return self.columns[pos]
+
+    def __setitem__(self, pos: int, value: Any) -> None:
+        """Add a value of the field at the position."""
+        self.columns[pos].append(value)
+
+
+def _data_file_columns(data_files: List[DataFile]) -> Dict[str, List[Any]]:
+    """Return the fields of MANIFEST_ENTRY_PRUNING_DATA_FILE_TYPE of the data files as a list per field."""
+    columns = {
+        field.name: [getattr(data_file, field.name) for data_file in data_files]
+        for field in MANIFEST_ENTRY_PRUNING_DATA_FILE_TYPE.fields
+    }
+    columns["partition"] = [list(values) for values in zip(*[data_file.partition.record_fields() for data_file in data_files])]
+    return columns
+
+
+class ManifestCache(SharedCache[Tuple[Any, ...], Tuple[Any, ...]]):
+    """The process-wide cache of decoded manifest lists and manifests.
+
+    Manifest lists and manifests are never changed once they are written, so they are
+    cached by their path. The cache is bounded by the estimated memory of the decoded
+    files, which is configured with `manifest-cache-size-bytes` (0 disables the cache).
+    The cached objects are shared, and should not be modified.
+    """
+
+    config_key = MANIFEST_CACHE_SIZE_BYTES
+    default_max_weight = DEFAULT_MANIFEST_CACHE_SIZE_BYTES
+
+
+def fetch_manifest_list(io: FileIO, manifest_list: str) -> List[ManifestFile]:
+    """
+    Read the manifests from the manifest list, through the manifest cache.
+
+    Args:
+        io: The FileIO to fetch the file.
+        manifest_list: The location of the manifest list.
+
+    Returns:
+        The ManifestFiles that are part of the list.
+    """
+    manifests = ManifestCache.get_or_create().get_or_load(
+        ("manifest-list", manifest_list), lambda: tuple(read_manifest_list(io.new_input(manifest_list)))
+    )
+    return list(manifests)
 
 
 def read_manifest_list(input_file: InputFile) -> Iterator[ManifestFile]:
@@ -678,9 +919,22 @@ class ManifestWriter(ABC):
     _deleted_rows: int
     _min_data_sequence_number: Optional[int]
     _partitions: List[Record]
+    _block_size_bytes: int
+    _block_rows: Optional[int]
+    _compression_codec: str
+    _compression_level: Optional[int]
 
     def __init__(
-        self, spec: PartitionSpec, schema: Schema, output_file: OutputFile, snapshot_id: int, meta: Dict[str, str] = EMPTY_DICT
+        self,
+        spec: PartitionSpec,
+        schema: Schema,
+        output_file: OutputFile,
+        snapshot_id: int,
+        meta: Dict[str, str] = EMPTY_DICT,
+        block_size_bytes: int = DEFAULT_MANIFEST_BLOCK_SIZE_BYTES,
+        block_rows: Optional[int] = None,
+        compression_codec: str = "null",
+        compression_level: Optional[int] = None,
     ) -> None:
         self.closed = False
         self._spec = spec
@@ -688,6 +942,10 @@ class ManifestWriter(ABC):
         self._output_file = output_file
         self._snapshot_id = snapshot_id
         self._meta = meta
+        self._block_size_bytes = block_size_bytes
+        self._block_rows = block_rows
+        self._compression_codec = compression_codec
+        self._compression_level = compression_level
 
         self._added_files = 0
         self._added_rows = 0
@@ -734,6 +992,8 @@ class ManifestWriter(ABC):
             record_schema=self._with_partition(DEFAULT_READ_VERSION),
             schema_name="manifest_entry",
             metadata=self._meta,
+            compression_codec=self._compression_codec,
+            compression_level=self._compression_level,
         )
 
     @abstractmethod
@@ -743,6 +1003,7 @@ class ManifestWriter(ABC):
         """Return the manifest file."""
         # once the manifest file is generated, no more entries can be added
         self.closed = True
+        self._writer.flush_block()
         min_sequence_number = self._min_data_sequence_number or UNASSIGNED_SEQ
         return ManifestFile(
             manifest_path=self._output_file.location,
@@ -784,12 +1045,27 @@ class ManifestWriter(ABC):
         ):
             self._min_data_sequence_number = entry.data_sequence_number
 
-        self._writer.write_block([self.prepare_entry(entry)])
+        # the entries are buffered, and written in blocks of multiple entries
+        block_size = self._writer.append(self.prepare_entry(entry))
+        if block_size >= self._block_size_bytes or (
+            self._block_rows is not None and self._writer.block_records >= self._block_rows
+        ):
+            self._writer.flush_block()
         return self
 
 
 class ManifestWriterV1(ManifestWriter):
-    def __init__(self, spec: PartitionSpec, schema: Schema, output_file: OutputFile, snapshot_id: int):
+    def __init__(
+        self,
+        spec: PartitionSpec,
+        schema: Schema,
+        output_file: OutputFile,
+        snapshot_id: int,
+        block_size_bytes: int = DEFAULT_MANIFEST_BLOCK_SIZE_BYTES,
+        block_rows: Optional[int] = None,
+        compression_codec: str = "null",
+        compression_level: Optional[int] = None,
+    ):
         super().__init__(
             spec,
             schema,
@@ -801,6 +1077,10 @@ class ManifestWriterV1(ManifestWriter):
                 "partition-spec-id": str(spec.spec_id),
                 "format-version": "1",
             },
+            block_size_bytes=block_size_bytes,
+            block_rows=block_rows,
+            compression_codec=compression_codec,
+            compression_level=compression_level,
         )
 
     def content(self) -> ManifestContent:
@@ -815,7 +1095,21 @@ class ManifestWriterV1(ManifestWriter):
 
 
 class ManifestWriterV2(ManifestWriter):
-    def __init__(self, spec: PartitionSpec, schema: Schema, output_file: OutputFile, snapshot_id: int):
+    _content: ManifestContent
+
+    def __init__(
+        self,
+        spec: PartitionSpec,
+        schema: Schema,
+        output_file: OutputFile,
+        snapshot_id: int,
+        block_size_bytes: int = DEFAULT_MANIFEST_BLOCK_SIZE_BYTES,
+        block_rows: Optional[int] = None,
+        compression_codec: str = "null",
+        compression_level: Optional[int] = None,
+        content: ManifestContent = ManifestContent.DATA,
+    ):
+        self._content = content
         super().__init__(
             spec,
             schema,
@@ -826,12 +1120,16 @@ class ManifestWriterV2(ManifestWriter):
                 "partition-spec": spec.model_dump_json(),
                 "partition-spec-id": str(spec.spec_id),
                 "format-version": "2",
-                "content": "data",
+                "content": "deletes" if content == ManifestContent.DELETES else "data",
             },
+            block_size_bytes=block_size_bytes,
+            block_rows=block_rows,
+            compression_codec=compression_codec,
+            compression_level=compression_level,
         )
 
     def content(self) -> ManifestContent:
-        return ManifestContent.DATA
+        return self._content
 
     @property
     def version(self) -> Literal[1, 2]:
@@ -847,12 +1145,27 @@ class ManifestWriterV2(ManifestWriter):
 
 
 def write_manifest(
-    format_version: Literal[1, 2], spec: PartitionSpec, schema: Schema, output_file: OutputFile, snapshot_id: int
+    format_version: Literal[1, 2],
+    spec: PartitionSpec,
+    schema: Schema,
+    output_file: OutputFile,
+    snapshot_id: int,
+    block_size_bytes: int = DEFAULT_MANIFEST_BLOCK_SIZE_BYTES,
+    block_rows: Optional[int] = None,
+    compression_codec: str = "null",
+    compression_level: Optional[int] = None,
+    content: ManifestContent = ManifestContent.DATA,
 ) -> ManifestWriter:
     if format_version == 1:
-        return ManifestWriterV1(spec, schema, output_file, snapshot_id)
+        if content != ManifestContent.DATA:
+            raise ValueError("Cannot write delete manifests for a v1 table")
+        return ManifestWriterV1(
+            spec, schema, output_file, snapshot_id, block_size_bytes, block_rows, compression_codec, compression_level
+        )
     elif format_version == 2:
-        return ManifestWriterV2(spec, schema, output_file, snapshot_id)
+        return ManifestWriterV2(
+            spec, schema, output_file, snapshot_id, block_size_bytes, block_rows, compression_codec, compression_level, content
+        )
     else:
         raise ValueError(f"Cannot write manifest for table version: {format_version}")
 
@@ -864,12 +1177,23 @@ class ManifestListWriter(ABC):
     _manifest_files: List[ManifestFile]
     _commit_snapshot_id: int
     _writer: AvroOutputFile[ManifestFile]
+    _compression_codec: str
+    _compression_level: Optional[int]
 
-    def __init__(self, format_version: Literal[1, 2], output_file: OutputFile, meta: Dict[str, Any]):
+    def __init__(
+        self,
+        format_version: Literal[1, 2],
+        output_file: OutputFile,
+        meta: Dict[str, Any],
+        compression_codec: str = "null",
+        compression_level: Optional[int] = None,
+    ):
         self._format_version = format_version
         self._output_file = output_file
         self._meta = meta
         self._manifest_files = []
+        self._compression_codec = compression_codec
+        self._compression_level = compression_level
 
     def __enter__(self) -> ManifestListWriter:
         """Open the writer for writing."""
@@ -879,6 +1203,8 @@ class ManifestListWriter(ABC):
             file_schema=MANIFEST_LIST_FILE_SCHEMAS[self._format_version],
             schema_name="manifest_file",
             metadata=self._meta,
+            compression_codec=self._compression_codec,
+            compression_level=self._compression_level,
         )
         self._writer.__enter__()
         return self
@@ -902,11 +1228,20 @@ class ManifestListWriter(ABC):
 
 
 class ManifestListWriterV1(ManifestListWriter):
-    def __init__(self, output_file: OutputFile, snapshot_id: int, parent_snapshot_id: Optional[int]):
+    def __init__(
+        self,
+        output_file: OutputFile,
+        snapshot_id: int,
+        parent_snapshot_id: Optional[int],
+        compression_codec: str = "null",
+        compression_level: Optional[int] = None,
+    ):
         super().__init__(
             format_version=1,
             output_file=output_file,
             meta={"snapshot-id": str(snapshot_id), "parent-snapshot-id": str(parent_snapshot_id), "format-version": "1"},
+            compression_codec=compression_codec,
+            compression_level=compression_level,
         )
 
     def prepare_manifest(self, manifest_file: ManifestFile) -> ManifestFile:
@@ -919,7 +1254,15 @@ class ManifestListWriterV2(ManifestListWriter):
     _commit_snapshot_id: int
     _sequence_number: int
 
-    def __init__(self, output_file: OutputFile, snapshot_id: int, parent_snapshot_id: Optional[int], sequence_number: int):
+    def __init__(
+        self,
+        output_file: OutputFile,
+        snapshot_id: int,
+        parent_snapshot_id: Optional[int],
+        sequence_number: int,
+        compression_codec: str = "null",
+        compression_level: Optional[int] = None,
+    ):
         super().__init__(
             format_version=2,
             output_file=output_file,
@@ -929,6 +1272,8 @@ class ManifestListWriterV2(ManifestListWriter):
                 "sequence-number": str(sequence_number),
                 "format-version": "2",
             },
+            compression_codec=compression_codec,
+            compression_level=compression_level,
         )
         self._commit_snapshot_id = snapshot_id
         self._sequence_number = sequence_number
@@ -962,12 +1307,16 @@ def write_manifest_list(
     snapshot_id: int,
     parent_snapshot_id: Optional[int],
     sequence_number: Optional[int],
+    compression_codec: str = "null",
+    compression_level: Optional[int] = None,
 ) -> ManifestListWriter:
     if format_version == 1:
-        return ManifestListWriterV1(output_file, snapshot_id, parent_snapshot_id)
+        return ManifestListWriterV1(output_file, snapshot_id, parent_snapshot_id, compression_codec, compression_level)
     elif format_version == 2:
         if sequence_number is None:
             raise ValueError(f"Sequence-number is required for V2 tables: {sequence_number}")
-        return ManifestListWriterV2(output_file, snapshot_id, parent_snapshot_id, sequence_number)
+        return ManifestListWriterV2(
+            output_file, snapshot_id, parent_snapshot_id, sequence_number, compression_codec, compression_level
+        )
     else:
         raise ValueError(f"Cannot write manifest list for table version: {format_version}")
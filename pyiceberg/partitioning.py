@@ -29,6 +29,7 @@ from typing import (
     Optional,
     Tuple,
     TypeVar,
+    Union,
 )
 from urllib.parse import quote
 
@@ -384,10 +385,7 @@ class PartitionKey:
     def partition(self) -> Record:  # partition key transformed with iceberg internal representation as input
         iceberg_typed_key_values = {}
         for raw_partition_field_value in self.raw_partition_field_values:
-            partition_fields = self.partition_spec.source_id_to_fields_map[raw_partition_field_value.field.source_id]
-            if len(partition_fields) != 1:
-                raise ValueError("partition_fields must contain exactly one field.")
-            partition_field = partition_fields[0]
+            partition_field = raw_partition_field_value.field
             iceberg_typed_key_values[partition_field.name] = partition_record_value(
                 partition_field=partition_field,
                 value=raw_partition_field_value.value,
@@ -432,7 +430,10 @@ def _(type: IcebergType, value: Optional[date]) -> Optional[int]:
 
 
 @_to_partition_representation.register(UUIDType)
-def _(type: IcebergType, value: Optional[uuid.UUID]) -> Optional[str]:
+def _(type: IcebergType, value: Optional[Union[uuid.UUID, bytes]]) -> Optional[str]:
+    if isinstance(value, bytes):
+        # PyArrow represents UUIDs as fixed[16]
+        value = uuid.UUID(bytes=value)
     return str(value) if value is not None else None
 
 
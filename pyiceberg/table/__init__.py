@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import datetime
 import itertools
+import time
 import uuid
 import warnings
 from abc import ABC, abstractmethod
@@ -33,6 +34,7 @@ from typing import (
     Dict,
     Generic,
     Iterable,
+    Iterator,
     List,
     Literal,
     Optional,
@@ -49,17 +51,22 @@ from typing_extensions import Annotated
 import pyiceberg.expressions.parser as parser
 from pyiceberg.exceptions import CommitFailedException, ResolveError, ValidationError
 from pyiceberg.expressions import (
+    AlwaysFalse,
     AlwaysTrue,
     And,
     BooleanExpression,
     EqualTo,
+    In,
     Reference,
 )
 from pyiceberg.expressions.visitors import (
     _InclusiveMetricsEvaluator,
+    _StrictMetricsEvaluator,
+    bind,
     expression_evaluator,
     inclusive_projection,
     manifest_evaluator,
+    strict_projection,
 )
 from pyiceberg.io import FileIO, load_file_io
 from pyiceberg.manifest import (
@@ -70,6 +77,7 @@ from pyiceberg.manifest import (
     ManifestEntry,
     ManifestEntryStatus,
     ManifestFile,
+    ManifestWriter,
     write_manifest,
     write_manifest_list,
 )
@@ -77,6 +85,7 @@ from pyiceberg.partitioning import (
     INITIAL_PARTITION_SPEC_ID,
     PARTITION_FIELD_ID_START,
     PartitionField,
+    PartitionKey,
     PartitionSpec,
     _PartitionNameGenerator,
     _visit_partition_field,
@@ -102,8 +111,11 @@ from pyiceberg.table.name_mapping import (
     parse_mapping_from_json,
     update_mapping,
 )
-from pyiceberg.table.refs import MAIN_BRANCH, SnapshotRef
+from pyiceberg.table.refs import MAIN_BRANCH, SnapshotRef, SnapshotRefType
 from pyiceberg.table.snapshots import (
+    ENTRIES_PROCESSED,
+    MANIFESTS_CREATED,
+    MANIFESTS_REPLACED,
     Operation,
     Snapshot,
     SnapshotLogEntry,
@@ -131,7 +143,8 @@ from pyiceberg.types import (
     StructType,
     transform_dict_value_to_str,
 )
-from pyiceberg.utils.concurrent import ExecutorFactory
+from pyiceberg.utils.bin_packing import ListPacker, PackingIterator
+from pyiceberg.utils.concurrent import COMMIT_POOL, IO_POOL, ExecutorFactory, bounded_map
 from pyiceberg.utils.datetime import datetime_to_millis
 
 if TYPE_CHECKING:
@@ -145,7 +158,11 @@ if TYPE_CHECKING:
 
 
 ALWAYS_TRUE = AlwaysTrue()
+ALWAYS_FALSE = AlwaysFalse()
 TABLE_ROOT_ID = -1
+SCAN_MAX_CONCURRENT_MANIFEST_READS = "max-concurrent-manifest-reads"
+SCAN_COLUMNAR_PRUNING_MIN_FILES = "columnar-pruning-min-files"
+SCAN_COLUMNAR_PRUNING_MIN_FILES_DEFAULT = 1000
 
 _JAVA_LONG_MAX = 9223372036854775807
 
@@ -220,6 +237,12 @@ class TableProperties:
 
     PARQUET_BLOOM_FILTER_COLUMN_ENABLED_PREFIX = "write.parquet.bloom-filter-enabled.column"
 
+    WRITE_AVRO_COMPRESSION = "write.avro.compression-codec"
+    WRITE_AVRO_COMPRESSION_DEFAULT = "gzip"
+
+    WRITE_AVRO_COMPRESSION_LEVEL = "write.avro.compression-level"
+    WRITE_AVRO_COMPRESSION_LEVEL_DEFAULT = None
+
     WRITE_TARGET_FILE_SIZE_BYTES = "write.target-file-size-bytes"
     WRITE_TARGET_FILE_SIZE_BYTES_DEFAULT = 512 * 1024 * 1024  # 512 MB
 
@@ -235,6 +258,41 @@ class TableProperties:
     FORMAT_VERSION = "format-version"
     DEFAULT_FORMAT_VERSION = 2
 
+    COMMIT_NUM_RETRIES = "commit.retry.num-retries"
+    COMMIT_NUM_RETRIES_DEFAULT = 4
+
+    COMMIT_MIN_RETRY_WAIT_MS = "commit.retry.min-wait-ms"
+    COMMIT_MIN_RETRY_WAIT_MS_DEFAULT = 100
+
+    COMMIT_MAX_RETRY_WAIT_MS = "commit.retry.max-wait-ms"
+    COMMIT_MAX_RETRY_WAIT_MS_DEFAULT = 60 * 1000  # 1 minute
+
+    COMMIT_TOTAL_RETRY_TIME_MS = "commit.retry.total-timeout-ms"
+    COMMIT_TOTAL_RETRY_TIME_MS_DEFAULT = 30 * 60 * 1000  # 30 minutes
+
+    MANIFEST_TARGET_SIZE_BYTES = "commit.manifest.target-size-bytes"
+    MANIFEST_TARGET_SIZE_BYTES_DEFAULT = 8 * 1024 * 1024  # 8 MB
+
+    MANIFEST_MIN_MERGE_COUNT = "commit.manifest.min-count-to-merge"
+    MANIFEST_MIN_MERGE_COUNT_DEFAULT = 100
+
+    MANIFEST_MERGE_ENABLED = "commit.manifest-merge.enabled"
+    MANIFEST_MERGE_ENABLED_DEFAULT = False
+
+    DELETE_MODE = "write.delete.mode"
+    DELETE_MODE_COPY_ON_WRITE = "copy-on-write"
+    DELETE_MODE_MERGE_ON_READ = "merge-on-read"
+    DELETE_MODE_DEFAULT = DELETE_MODE_COPY_ON_WRITE
+
+    MAX_SNAPSHOT_AGE_MS = "history.expire.max-snapshot-age-ms"
+    MAX_SNAPSHOT_AGE_MS_DEFAULT = 5 * 24 * 60 * 60 * 1000  # 5 days
+
+    MIN_SNAPSHOTS_TO_KEEP = "history.expire.min-snapshots-to-keep"
+    MIN_SNAPSHOTS_TO_KEEP_DEFAULT = 1
+
+    MAX_REF_AGE_MS = "history.expire.max-ref-age-ms"
+    MAX_REF_AGE_MS_DEFAULT = None  # forever
+
 
 class PropertyUtil:
     @staticmethod
@@ -247,6 +305,14 @@ class PropertyUtil:
         else:
             return default
 
+    @staticmethod
+    def property_as_bool(properties: Dict[str, str], property_name: str, default: bool) -> bool:
+        if value := properties.get(property_name):
+            if value.lower() not in ("true", "false"):
+                raise ValueError(f"Could not parse table property {property_name} to a boolean: {value}")
+            return value.lower() == "true"
+        return default
+
 
 class Transaction:
     _table: Table
@@ -254,6 +320,7 @@ class Transaction:
     _autocommit: bool
     _updates: Tuple[TableUpdate, ...]
     _requirements: Tuple[TableRequirement, ...]
+    _changes: List[Tuple[Optional[UpdateTableMetadata[Any]], Tuple[TableUpdate, ...], Tuple[TableRequirement, ...]]]
 
     def __init__(self, table: Table, autocommit: bool = False):
         """Open a transaction to stage and commit changes to a table.
@@ -267,6 +334,7 @@ class Transaction:
         self._autocommit = autocommit
         self._updates = ()
         self._requirements = ()
+        self._changes = []
 
     def __enter__(self) -> Transaction:
         """Start a transaction to update the table."""
@@ -276,22 +344,57 @@ class Transaction:
         """Close and commit the transaction."""
         self.commit_transaction()
 
-    def _apply(self, updates: Tuple[TableUpdate, ...], requirements: Tuple[TableRequirement, ...] = ()) -> Transaction:
+    def _apply(
+        self,
+        updates: Tuple[TableUpdate, ...],
+        requirements: Tuple[TableRequirement, ...] = (),
+        change: Optional[UpdateTableMetadata[Any]] = None,
+    ) -> Transaction:
         """Check if the requirements are met, and applies the updates to the metadata."""
+        self._stage(updates, requirements, change)
+
+        if self._autocommit:
+            self.commit_transaction()
+
+        return self
+
+    def _stage(
+        self,
+        updates: Tuple[TableUpdate, ...],
+        requirements: Tuple[TableRequirement, ...],
+        change: Optional[UpdateTableMetadata[Any]],
+    ) -> None:
         for requirement in requirements:
             requirement.validate(self.table_metadata)
 
         self._updates += updates
         self._requirements += requirements
+        self._changes.append((change, updates, requirements))
 
         self.table_metadata = update_table_metadata(self.table_metadata, updates)
 
-        if self._autocommit:
-            self.commit_transaction()
-            self._updates = ()
-            self._requirements = ()
+    def _rebase(self) -> None:
+        """Refresh the table, and stage the changes of the transaction again on top of the refreshed metadata.
 
-        return self
+        Snapshots are produced again against the new current snapshot, reusing the data files and the
+        manifests that are already written. The other changes are staged as they are, after checking
+        their requirements against the refreshed metadata.
+        """
+        changes = self._changes
+        self.table_metadata = self._table.refresh().metadata
+        self._updates = ()
+        self._requirements = ()
+        self._changes = []
+
+        for change, updates, requirements in changes:
+            if isinstance(change, _MergingSnapshotProducer):
+                change._rebase()  # pylint: disable=W0212
+                self._stage(*change._commit(), change)  # pylint: disable=W0212
+            elif isinstance(change, ExpireSnapshots):
+                # The snapshots to expire are determined again from the refreshed metadata
+                self._stage(*change._commit(), change)  # pylint: disable=W0212
+            else:
+                self._stage(updates, requirements, change)
 
     def upgrade_table_version(self, format_version: Literal[1, 2]) -> Transaction:
         """Set the table to a certain version.
@@ -355,6 +458,154 @@ class Transaction:
         """
         return UpdateSnapshot(self, io=self._table.io, snapshot_properties=snapshot_properties)
 
+    def expire_snapshots(self) -> ExpireSnapshots:
+        """Create a new ExpireSnapshots to remove the old snapshots of the table.
+
+        Returns:
+            A new ExpireSnapshots.
+        """
+        return ExpireSnapshots(self)
+
+    def _rewrite_partially_deleted_files(self, delete_snapshot: DeleteFiles) -> None:
+        """Write the rows that are not deleted from the data files that only partially match the delete filter.
+
+        The data files are deleted in the snapshot, and replaced by the new files.
+
+        Args:
+            delete_snapshot: The snapshot producer that deletes the data files.
+        """
+        if not (files_to_rewrite := delete_snapshot.files_to_rewrite()):
+            return
+
+        from pyiceberg.io.pyarrow import expression_to_pyarrow, project_table
+
+        table = self._staged_table()
+        paths = {data_file.file_path for data_file in files_to_rewrite}
+        tasks = [
+            task
+            for task in table.scan(
+                row_filter=delete_snapshot.delete_filter, case_sensitive=delete_snapshot.case_sensitive
+            ).plan_files()
+            if task.file.file_path in paths
+        ]
+
+        # A row is only deleted when the filter is true, rows for which it is null are kept
+        delete_expression = expression_to_pyarrow(
+            bind(table.schema(), delete_snapshot.delete_filter, delete_snapshot.case_sensitive)
+        )
+
+        for data_file in files_to_rewrite:
+            delete_snapshot.delete_data_file(data_file)
+
+        # The files are rewritten one at a time, so only the rows of a single file are kept in memory
+        for task in tasks:
+            df = project_table([task], table, ALWAYS_TRUE, table.schema(), delete_snapshot.case_sensitive)
+            df = df.filter(~delete_expression | delete_expression.is_null())
+            if len(df) > 0:
+                for data_file in _dataframe_to_data_files(table_metadata=self.table_metadata, df=df, io=self._table.io):
+                    delete_snapshot.append_data_file(data_file)
+
+    def _write_positional_deletes(
+        self, row_delta: RowDelta, delete_filter: BooleanExpression, case_sensitive: bool = True
+    ) -> bool:
+        """Write positional delete files for the rows that match the delete filter, and add them to the row delta.
+
+        Only the data files that might contain matching rows, according to the scan planning, are read.
+
+        Args:
+            row_delta: The snapshot producer that adds the delete files.
+            delete_filter: The filter of the rows to delete.
+            case_sensitive: If the field names of the filter are case-sensitive.
+
+        Returns:
+            Whether any rows matched the filter.
+        """
+        from pyiceberg.io.pyarrow import matching_positions, write_positional_deletes
+
+        table = self._staged_table()
+        tasks = table.scan(row_filter=delete_filter, case_sensitive=case_sensitive).plan_files()
+        if not (positions := matching_positions(tasks, table, delete_filter, case_sensitive)):
+            return False
+
+        row_delta.validate_data_files_exist(data_file.file_path for data_file, _ in positions)
+        for delete_file in write_positional_deletes(
+            io=self._table.io, table_metadata=self.table_metadata, positions=positions, write_uuid=row_delta.commit_uuid
+        ):
+            row_delta.append_delete_file(delete_file)
+        return True
+
+    def _compact_data_files(
+        self,
+        rewrite_files: RewriteFiles,
+        row_filter: BooleanExpression,
+        target_file_size: int,
+        case_sensitive: bool = True,
+    ) -> bool:
+        """Rewrite the small data files that might match the filter, and the ones with deletes, into files of the target size.
+
+        The data files are grouped per partition spec and partition, and bin-packed by their size. A bin
+        is rewritten when it combines multiple data files, or when its data files have deletes, which are
+        applied while reading them. The bins are rewritten one after the other, so that only the rows of
+        a single bin are held in memory.
+
+        Args:
+            rewrite_files: The snapshot producer that replaces the data files.
+            row_filter: The filter of the data files to rewrite.
+            target_file_size: The target size of the rewritten data files, in bytes.
+            case_sensitive: If the field names of the filter are case-sensitive.
+
+        Returns:
+            Whether any data files are rewritten.
+        """
+        from pyiceberg.io.pyarrow import project_table
+
+        table = self._staged_table()
+        # Like the bin-pack strategy in Java, files of at least 75% of the target size are left alone
+        min_file_size = target_file_size * 3 // 4
+        tasks_per_partition: Dict[Tuple[int, Tuple[Any, ...]], List[FileScanTask]] = {}
+        for task in table.scan(row_filter=row_filter, case_sensitive=case_sensitive).plan_files():
+            if task.file.file_size_in_bytes < min_file_size or task.delete_files:
+                spec_id = task.file.spec_id if task.file.spec_id is not None else self.table_metadata.default_spec_id
+                tasks_per_partition.setdefault((spec_id, tuple(task.file.partition.record_fields())), []).append(task)
+
+        rewritten = False
+        for partition_tasks in tasks_per_partition.values():
+            for tasks in PackingIterator(
+                items=partition_tasks,
+                target_weight=target_file_size,
+                lookback=1,
+                weight_func=lambda task: task.file.file_size_in_bytes,
+            ):
+                if len(tasks) < 2 and not tasks[0].delete_files:
+                    continue
+
+                df = project_table(tasks, table, ALWAYS_TRUE, table.schema(), case_sensitive)
+                for task in tasks:
+                    rewrite_files.delete_data_file(task.file)
+                if len(df) > 0:
+                    # The bin is packed by the size of the files, while the rows are split by their size in memory
+                    input_size = sum(task.file.file_size_in_bytes for task in tasks)
+                    for data_file in _dataframe_to_data_files(
+                        table_metadata=self.table_metadata,
+                        df=df,
+                        io=self._table.io,
+                        target_file_size=max(target_file_size * df.nbytes // input_size, 1),
+                    ):
+                        rewrite_files.append_data_file(data_file)
+                rewritten = True
+
+        return rewritten
+
+    def _staged_table(self) -> Table:
+        """Return the table with the metadata of the transaction, to read the changes that are not committed yet."""
+        return Table(
+            identifier=self._table.identifier,
+            metadata=self.table_metadata,
+            metadata_location=self._table.metadata_location,
+            io=self._table.io,
+            catalog=self._table.catalog,
+        )
+
     def update_spec(self) -> UpdateSpec:
         """Create a new UpdateSpec to update the partitioning of the table.
 
@@ -388,14 +639,49 @@ class Transaction:
     def commit_transaction(self) -> Table:
         """Commit the changes to the catalog.
 
+        When the commit fails because the table was changed concurrently, the table is refreshed and
+        the changes are committed again, with an exponential backoff that is configured by the
+        `commit.retry.*` table properties.
+
         Returns:
             The table with the updates applied.
         """
         if len(self._updates) > 0:
-            self._table._do_commit(  # pylint: disable=W0212
-                updates=self._updates,
-                requirements=self._requirements,
+            properties = self._table.metadata.properties
+            num_retries = PropertyUtil.property_as_int(
+                properties, TableProperties.COMMIT_NUM_RETRIES, TableProperties.COMMIT_NUM_RETRIES_DEFAULT
+            )
+            min_wait_ms = PropertyUtil.property_as_int(
+                properties, TableProperties.COMMIT_MIN_RETRY_WAIT_MS, TableProperties.COMMIT_MIN_RETRY_WAIT_MS_DEFAULT
+            )
+            max_wait_ms = PropertyUtil.property_as_int(
+                properties, TableProperties.COMMIT_MAX_RETRY_WAIT_MS, TableProperties.COMMIT_MAX_RETRY_WAIT_MS_DEFAULT
             )
+            total_timeout_ms = PropertyUtil.property_as_int(
+                properties, TableProperties.COMMIT_TOTAL_RETRY_TIME_MS, TableProperties.COMMIT_TOTAL_RETRY_TIME_MS_DEFAULT
+            )
+
+            start = time.monotonic()
+            attempt = 0
+            while True:
+                try:
+                    self._table._do_commit(  # pylint: disable=W0212
+                        updates=self._updates,
+                        requirements=self._requirements,
+                    )
+                    break
+                except CommitFailedException:
+                    wait_ms = min(min_wait_ms * 2**attempt, max_wait_ms)
+                    elapsed_ms = (time.monotonic() - start) * 1000
+                    if attempt >= num_retries or elapsed_ms + wait_ms > total_timeout_ms:  # type: ignore
+                        raise
+                    attempt += 1
+                    time.sleep(wait_ms / 1000)
+                    self._rebase()
+
+            self._updates = ()
+            self._requirements = ()
+            self._changes = []
             return self._table
         else:
             return self._table
@@ -730,6 +1016,46 @@ def _(update: SetSnapshotRefUpdate, base_metadata: TableMetadata, context: _Tabl
     return base_metadata.model_copy(update=metadata_updates)
 
 
+@_apply_table_update.register(RemoveSnapshotsUpdate)
+def _(update: RemoveSnapshotsUpdate, base_metadata: TableMetadata, context: _TableMetadataUpdateContext) -> TableMetadata:
+    removed_snapshot_ids = set(update.snapshot_ids)
+    snapshots = [snapshot for snapshot in base_metadata.snapshots if snapshot.snapshot_id not in removed_snapshot_ids]
+    if len(snapshots) == len(base_metadata.snapshots):
+        return base_metadata
+
+    # The history before a removed snapshot is dropped, so the log only holds a contiguous range of snapshots
+    snapshot_log: List[SnapshotLogEntry] = []
+    for log_entry in base_metadata.snapshot_log:
+        if log_entry.snapshot_id in removed_snapshot_ids:
+            snapshot_log = []
+        else:
+            snapshot_log.append(log_entry)
+
+    # The branches and tags of the removed snapshots are removed as well
+    refs = {name: ref for name, ref in base_metadata.refs.items() if ref.snapshot_id not in removed_snapshot_ids}
+    metadata_updates: Dict[str, Any] = {"snapshots": snapshots, "snapshot_log": snapshot_log, "refs": refs}
+    if MAIN_BRANCH not in refs:
+        metadata_updates["current_snapshot_id"] = None
+
+    context.add_update(update)
+    return base_metadata.model_copy(update=metadata_updates)
+
+
+@_apply_table_update.register(RemoveSnapshotRefUpdate)
+def _(update: RemoveSnapshotRefUpdate, base_metadata: TableMetadata, context: _TableMetadataUpdateContext) -> TableMetadata:
+    if update.ref_name not in base_metadata.refs:
+        return base_metadata
+
+    metadata_updates: Dict[str, Any] = {
+        "refs": {name: ref for name, ref in base_metadata.refs.items() if name != update.ref_name}
+    }
+    if update.ref_name == MAIN_BRANCH:
+        metadata_updates["current_snapshot_id"] = None
+
+    context.add_update(update)
+    return base_metadata.model_copy(update=metadata_updates)
+
+
 @_apply_table_update.register(AddSortOrderUpdate)
 def _(update: AddSortOrderUpdate, base_metadata: TableMetadata, context: _TableMetadataUpdateContext) -> TableMetadata:
     context.add_update(update)
@@ -1131,17 +1457,20 @@ class Table:
         if not isinstance(df, pa.Table):
             raise ValueError(f"Expected PyArrow table, got: {df}")
 
-        if len(self.spec().fields) > 0:
-            raise ValueError("Cannot write to partitioned tables")
-
         _check_schema_compatible(self.schema(), other_schema=df.schema)
         # cast if the two schemas are compatible but not equal
         table_arrow_schema = self.schema().as_arrow()
         if table_arrow_schema != df.schema:
             df = df.cast(table_arrow_schema)
 
+        manifest_merge_enabled = PropertyUtil.property_as_bool(
+            self.metadata.properties, TableProperties.MANIFEST_MERGE_ENABLED, TableProperties.MANIFEST_MERGE_ENABLED_DEFAULT
+        )
+
         with self.transaction() as txn:
-            with txn.update_snapshot(snapshot_properties=snapshot_properties).fast_append() as update_snapshot:
+            snapshot_update = txn.update_snapshot(snapshot_properties=snapshot_properties)
+            append_method = snapshot_update.merge_append if manifest_merge_enabled else snapshot_update.fast_append
+            with append_method() as update_snapshot:
                 # skip writing data files if the dataframe is empty
                 if df.shape[0] > 0:
                     data_files = _dataframe_to_data_files(
@@ -1151,7 +1480,10 @@ class Table:
                         update_snapshot.append_data_file(data_file)
 
     def overwrite(
-        self, df: pa.Table, overwrite_filter: BooleanExpression = ALWAYS_TRUE, snapshot_properties: Dict[str, str] = EMPTY_DICT
+        self,
+        df: pa.Table,
+        overwrite_filter: Union[str, BooleanExpression] = ALWAYS_TRUE,
+        snapshot_properties: Dict[str, str] = EMPTY_DICT,
     ) -> None:
         """
         Shorthand for overwriting the table with a PyArrow table.
@@ -1170,11 +1502,7 @@ class Table:
         if not isinstance(df, pa.Table):
             raise ValueError(f"Expected PyArrow table, got: {df}")
 
-        if overwrite_filter != AlwaysTrue():
-            raise NotImplementedError("Cannot overwrite a subset of a table")
-
-        if len(self.spec().fields) > 0:
-            raise ValueError("Cannot write to partitioned tables")
+        overwrite_filter = _parse_row_filter(overwrite_filter)
 
         _check_schema_compatible(self.schema(), other_schema=df.schema)
         # cast if the two schemas are compatible but not equal
@@ -1183,7 +1511,10 @@ class Table:
             df = df.cast(table_arrow_schema)
 
         with self.transaction() as txn:
-            with txn.update_snapshot(snapshot_properties=snapshot_properties).overwrite() as update_snapshot:
+            update_snapshot = txn.update_snapshot(snapshot_properties=snapshot_properties).overwrite(overwrite_filter)
+            with update_snapshot:
+                # the rows of the data files that only partially match the filter are kept
+                txn._rewrite_partially_deleted_files(update_snapshot)  # pylint: disable=W0212
                 # skip writing data files if the dataframe is empty
                 if df.shape[0] > 0:
                     data_files = _dataframe_to_data_files(
@@ -1192,6 +1523,143 @@ class Table:
                     for data_file in data_files:
                         update_snapshot.append_data_file(data_file)
 
+    def delete(
+        self,
+        delete_filter: Union[str, BooleanExpression],
+        snapshot_properties: Dict[str, str] = EMPTY_DICT,
+        mode: Optional[str] = None,
+    ) -> None:
+        """
+        Shorthand for deleting the rows that match a filter from the table.
+
+        In copy-on-write mode, the data files of which all the rows match the filter are deleted,
+        based on their partition or their column metrics. The data files of which only some rows
+        match the filter are rewritten without those rows, which requires PyArrow.
+
+        In merge-on-read mode, the positions of the matching rows are written to positional delete
+        files, and the data files are kept as they are. This requires a v2 table and PyArrow.
+
+        Args:
+            delete_filter: A boolean expression, or a string that is parsed into one
+            snapshot_properties: Custom properties to be added to the snapshot summary
+            mode: copy-on-write or merge-on-read, defaults to the write.delete.mode table property
+        """
+        delete_filter = _parse_row_filter(delete_filter)
+        if mode is None:
+            mode = self.properties.get(TableProperties.DELETE_MODE, TableProperties.DELETE_MODE_DEFAULT)
+
+        if mode == TableProperties.DELETE_MODE_MERGE_ON_READ:
+            if self.format_version < 2:
+                raise ValueError(f"Merge-on-read deletes require a table with format version 2, got: {self.format_version}")
+
+            with self.transaction() as txn:
+                row_delta = txn.update_snapshot(snapshot_properties=snapshot_properties).row_delta()
+                if not txn._write_positional_deletes(row_delta, delete_filter):  # pylint: disable=W0212
+                    warnings.warn("Delete operation did not match any records")
+                    return
+                row_delta.commit()
+            return
+        elif mode != TableProperties.DELETE_MODE_COPY_ON_WRITE:
+            raise ValueError(
+                f"Unknown delete mode: {mode}, expected {TableProperties.DELETE_MODE_COPY_ON_WRITE} "
+                f"or {TableProperties.DELETE_MODE_MERGE_ON_READ}"
+            )
+
+        with self.transaction() as txn:
+            delete_snapshot = txn.update_snapshot(snapshot_properties=snapshot_properties).delete(delete_filter)
+            if not delete_snapshot.deletes_files():
+                warnings.warn("Delete operation did not match any records")
+                return
+
+            with delete_snapshot:
+                txn._rewrite_partially_deleted_files(delete_snapshot)  # pylint: disable=W0212
+
+    def expire_snapshots(
+        self,
+        older_than: Optional[datetime.datetime] = None,
+        retain_last: Optional[int] = None,
+        clean_expired_files: bool = True,
+    ) -> None:
+        """
+        Shorthand for removing the snapshots that are no longer needed, and the files that only they refer to.
+
+        The snapshots of a branch are kept when they are newer than the max snapshot age, or among the
+        last snapshots to keep of the branch. The snapshots of tags are kept, as long as the tag is not
+        older than its max ref age. The defaults come from the `history.expire.*` table properties, and
+        the retention settings of the branches and tags take precedence over them.
+
+        Args:
+            older_than: Expire the snapshots that are older than this, instead of the max snapshot age
+            retain_last: The minimum number of snapshots to keep of each branch, instead of the table property
+            clean_expired_files: Delete the manifest lists, manifests and data files that only the
+                                 expired snapshots refer to
+        """
+        with self.transaction() as txn:
+            expire_snapshots = txn.expire_snapshots()
+            if older_than is not None:
+                expire_snapshots.expire_older_than(datetime_to_millis(older_than))
+            if retain_last is not None:
+                expire_snapshots.retain_last(retain_last)
+            expire_snapshots.commit()
+
+        if clean_expired_files:
+            # The files are only deleted once the snapshots are removed from the table
+            expire_snapshots.clean_expired_files(self.metadata)
+
+    def rewrite_data_files(
+        self,
+        row_filter: Union[str, BooleanExpression] = ALWAYS_TRUE,
+        target_file_size: Optional[int] = None,
+        snapshot_properties: Dict[str, str] = EMPTY_DICT,
+        case_sensitive: bool = True,
+    ) -> None:
+        """
+        Shorthand for compacting the small data files of the table into larger ones.
+
+        The data files that are smaller than 75% of the target size, or that have delete files, are
+        bin-packed per partition and rewritten with the deletes applied. The files are replaced in a
+        `replace` snapshot, in which the new files keep the data sequence number of the snapshot that
+        the rewrite started from. This requires PyArrow.
+
+        Args:
+            row_filter: Only rewrite the data files that might contain rows that match this filter
+            target_file_size: The target size of the data files, defaults to the write.target-file-size-bytes table property
+            snapshot_properties: Custom properties to be added to the snapshot summary
+            case_sensitive: If the field names of the filter are case-sensitive
+        """
+        row_filter = _parse_row_filter(row_filter)
+        if target_file_size is None:
+            target_file_size = PropertyUtil.property_as_int(
+                self.properties,
+                TableProperties.WRITE_TARGET_FILE_SIZE_BYTES,
+                TableProperties.WRITE_TARGET_FILE_SIZE_BYTES_DEFAULT,
+            )
+        if target_file_size is None or target_file_size <= 0:
+            raise ValueError(f"Target file size should be positive, got: {target_file_size}")
+
+        with self.transaction() as txn:
+            rewrite_files = txn.update_snapshot(snapshot_properties=snapshot_properties).rewrite()
+            if not txn._compact_data_files(rewrite_files, row_filter, target_file_size, case_sensitive):  # pylint: disable=W0212
+                return
+            rewrite_files.commit()
+
+    def rewrite_manifests(self, snapshot_properties: Dict[str, str] = EMPTY_DICT) -> None:
+        """
+        Shorthand for rewriting the manifests of the table, with the data files clustered by partition.
+
+        The live entries of the manifests are sorted by partition, and written into manifests of about
+        `commit.manifest.target-size-bytes`. The partition summaries of the manifests are then narrow,
+        so that scans with a partition filter skip most manifests without opening them.
+
+        Args:
+            snapshot_properties: Custom properties to be added to the snapshot summary
+        """
+        if self.current_snapshot() is None:
+            return
+
+        with self.transaction() as txn:
+            txn.update_snapshot(snapshot_properties=snapshot_properties).rewrite_manifests().commit()
+
     def add_files(self, file_paths: List[str]) -> None:
         """
         Shorthand API for adding files as data files to the table.
@@ -1415,7 +1883,10 @@ def _open_manifest(
     manifest: ManifestFile,
     partition_filter: Callable[[DataFile], bool],
     metrics_evaluator: Callable[[DataFile], bool],
+    columnar_pruner: Optional[Callable[[Dict[str, List[Any]]], Iterable[int]]] = None,
 ) -> List[ManifestEntry]:
+    if columnar_pruner is not None:
+        return manifest.fetch_selected_manifest_entries(io, columnar_pruner, discard_deleted=True)
     return [
         manifest_entry
         for manifest_entry in manifest.fetch_manifest_entry(io, discard_deleted=True)
@@ -1460,6 +1931,33 @@ def _match_deletes_to_data_file(data_entry: ManifestEntry, positional_delete_ent
         return set()
 
 
+def _match_equality_deletes_to_data_file(
+    data_entry: ManifestEntry, equality_delete_entries: Dict[Optional[Tuple[int, Tuple[Any, ...]]], SortedList[ManifestEntry]]
+) -> Set[DataFile]:
+    """Return the equality delete files that apply to the data file.
+
+    Equality deletes apply to the data files with a lower data sequence number, that are in the same
+    partition of the same partition spec, or to all data files when the delete file is unpartitioned.
+
+    Args:
+        data_entry (ManifestEntry): The manifest entry of the data file.
+        equality_delete_entries: The equality delete entries by partition, see `_equality_delete_partition`,
+            sorted by their data sequence number.
+
+    Returns:
+        A set of the equality delete files that apply to the data file.
+    """
+    delete_files: Set[DataFile] = set()
+    for partition in (None, _equality_delete_partition(data_entry.data_file)):
+        if (entries := equality_delete_entries.get(partition)) is not None:
+            delete_files.update(entry.data_file for entry in entries[entries.bisect_right(data_entry) :])
+    return delete_files
+
+
+def _equality_delete_partition(data_file: DataFile) -> Tuple[int, Tuple[Any, ...]]:
+    return data_file.spec_id or INITIAL_PARTITION_SPEC_ID, tuple(data_file.partition.record_fields())
+
+
 class DataScan(TableScan):
     def __init__(
         self,
@@ -1496,6 +1994,35 @@ class DataScan(TableScan):
         # shared instance across multiple threads.
         return lambda data_file: expression_evaluator(partition_schema, partition_expr, self.case_sensitive)(data_file.partition)
 
+    def _build_columnar_pruner(self, spec_id: int) -> Optional[Callable[[Dict[str, List[Any]]], Iterable[int]]]:
+        try:
+            from pyiceberg.io.pyarrow import columnar_manifest_pruner
+        except ModuleNotFoundError:
+            return None
+
+        return columnar_manifest_pruner(
+            self.table.schema(),
+            self.table.specs()[spec_id],
+            self.partition_filters[spec_id],
+            self.row_filter,
+            self.case_sensitive,
+            self.options.get("include_empty_files") == "true",
+        )
+
+    def _use_columnar_pruning(self, manifest: ManifestFile, min_files: Optional[int]) -> bool:
+        """Whether to prune the data files of the manifest in bulk, see `columnar_manifest_pruner`.
+
+        This pays off for manifests with many data files, when there is a filter to prune them with.
+        """
+        if (
+            min_files is None
+            or self.row_filter == AlwaysTrue()
+            or manifest.added_files_count is None
+            or manifest.existing_files_count is None
+        ):
+            return False
+        return manifest.added_files_count + manifest.existing_files_count >= min_files
+
     def _check_sequence_number(self, min_data_sequence_number: int, manifest: ManifestFile) -> bool:
         """Ensure that no manifests are loaded that contain deletes that are older than the data.
 
@@ -1515,12 +2042,20 @@ class DataScan(TableScan):
     def plan_files(self) -> Iterable[FileScanTask]:
         """Plans the relevant files by filtering on the PartitionSpecs.
 
+        The delete manifests are read first to index the delete files. Afterwards the
+        data manifests are decoded lazily, and the tasks are returned as soon as the
+        manifest they originate from has been read. The number of manifests that are
+        read concurrently is capped by the `max-concurrent-manifest-reads` scan option.
+
+        The data files of manifests with at least `columnar-pruning-min-files` data files are
+        evaluated in bulk with Arrow, when it is installed, and only the matching ones are decoded.
+
         Returns:
-            List of FileScanTasks that contain both data and delete files.
+            Iterator of FileScanTasks that contain both data and delete files.
         """
         snapshot = self.snapshot()
         if not snapshot:
-            return iter([])
+            return
 
         io = self.table.io
 
@@ -1543,47 +2078,78 @@ class DataScan(TableScan):
             self.table.schema(), self.row_filter, self.case_sensitive, self.options.get("include_empty_files") == "true"
         ).eval
 
+        columnar_pruners: Dict[int, Optional[Callable[[Dict[str, List[Any]]], Iterable[int]]]] = KeyDefaultDict(
+            self._build_columnar_pruner
+        )
+        columnar_pruning_min_files = PropertyUtil.property_as_int(
+            self.options, SCAN_COLUMNAR_PRUNING_MIN_FILES, SCAN_COLUMNAR_PRUNING_MIN_FILES_DEFAULT
+        )
+
         min_data_sequence_number = _min_data_file_sequence_number(manifests)
+        max_concurrent_reads = PropertyUtil.property_as_int(self.options, SCAN_MAX_CONCURRENT_MANIFEST_READS)
 
-        data_entries: List[ManifestEntry] = []
-        positional_delete_entries = SortedList(key=lambda entry: entry.data_sequence_number or INITIAL_SEQUENCE_NUMBER)
+        executor = ExecutorFactory.get_or_create(IO_POOL)
 
-        executor = ExecutorFactory.get_or_create()
-        for manifest_entry in chain(
-            *executor.map(
-                lambda args: _open_manifest(*args),
-                [
+        def _open_manifests(content: ManifestContent) -> Iterator[ManifestEntry]:
+            return chain.from_iterable(
+                bounded_map(
+                    executor,
+                    lambda args: _open_manifest(*args),
                     (
-                        io,
-                        manifest,
-                        partition_evaluators[manifest.partition_spec_id],
-                        metrics_evaluator,
-                    )
-                    for manifest in manifests
-                    if self._check_sequence_number(min_data_sequence_number, manifest)
-                ],
+                        (
+                            io,
+                            manifest,
+                            partition_evaluators[manifest.partition_spec_id],
+                            metrics_evaluator,
+                            columnar_pruners[manifest.partition_spec_id]
+                            if self._use_columnar_pruning(manifest, columnar_pruning_min_files)
+                            else None,
+                        )
+                        for manifest in manifests
+                        if manifest.content == content and self._check_sequence_number(min_data_sequence_number, manifest)
+                    ),
+                    max_in_flight=max_concurrent_reads,
+                )
             )
-        ):
+
+        # step 3: index the delete files, so the data files can be streamed afterwards
+
+        positional_delete_entries = SortedList(key=lambda entry: entry.data_sequence_number or INITIAL_SEQUENCE_NUMBER)
+        # the equality deletes of unpartitioned specs are global, and kept under None
+        equality_delete_entries: Dict[Optional[Tuple[int, Tuple[Any, ...]]], SortedList[ManifestEntry]] = {}
+        specs = self.table.specs()
+
+        for manifest_entry in _open_manifests(ManifestContent.DELETES):
             data_file = manifest_entry.data_file
-            if data_file.content == DataFileContent.DATA:
-                data_entries.append(manifest_entry)
-            elif data_file.content == DataFileContent.POSITION_DELETES:
+            if data_file.content == DataFileContent.POSITION_DELETES:
                 positional_delete_entries.add(manifest_entry)
             elif data_file.content == DataFileContent.EQUALITY_DELETES:
-                raise ValueError("PyIceberg does not yet support equality deletes: https://github.com/apache/iceberg/issues/6568")
+                partition = (
+                    None
+                    if specs[data_file.spec_id or INITIAL_PARTITION_SPEC_ID].is_unpartitioned()
+                    else _equality_delete_partition(data_file)
+                )
+                equality_delete_entries.setdefault(
+                    partition, SortedList(key=lambda entry: entry.data_sequence_number or INITIAL_SEQUENCE_NUMBER)
+                ).add(manifest_entry)
             else:
                 raise ValueError(f"Unknown DataFileContent ({data_file.content}): {manifest_entry}")
 
-        return [
-            FileScanTask(
-                data_entry.data_file,
+        # step 4: match the data files against the delete files
+
+        for manifest_entry in _open_manifests(ManifestContent.DATA):
+            data_file = manifest_entry.data_file
+            if data_file.content != DataFileContent.DATA:
+                raise ValueError(f"Unknown DataFileContent ({data_file.content}): {manifest_entry}")
+
+            yield FileScanTask(
+                data_file,
                 delete_files=_match_deletes_to_data_file(
-                    data_entry,
+                    manifest_entry,
                     positional_delete_entries,
-                ),
+                )
+                | _match_equality_deletes_to_data_file(manifest_entry, equality_delete_entries),
             )
-            for data_entry in data_entries
-        ]
 
     def to_arrow(self) -> pa.Table:
         from pyiceberg.io.pyarrow import project_table
@@ -1597,8 +2163,33 @@ class DataScan(TableScan):
             limit=self.limit,
         )
 
+    def to_arrow_batch_reader(self) -> pa.RecordBatchReader:
+        """Stream the result of the scan as record batches.
+
+        In contrast to `to_arrow`, the files are read lazily while the reader
+        is consumed, so only a bounded number of files is held in memory.
+
+        Returns:
+            A RecordBatchReader with the projected schema of the scan.
+        """
+        import pyarrow as pa
+
+        from pyiceberg.io.pyarrow import project_batches, schema_to_pyarrow
+
+        return pa.RecordBatchReader.from_batches(
+            schema_to_pyarrow(self.projection()),
+            project_batches(
+                self.plan_files(),
+                self.table,
+                self.row_filter,
+                self.projection(),
+                case_sensitive=self.case_sensitive,
+                limit=self.limit,
+            ),
+        )
+
     def to_pandas(self, **kwargs: Any) -> pd.DataFrame:
-        return self.to_arrow().to_pandas(**kwargs)
+        return self.to_arrow_batch_reader().read_pandas(**kwargs)
 
     def to_duckdb(self, table_name: str, connection: Optional[DuckDBPyConnection] = None) -> DuckDBPyConnection:
         import duckdb
@@ -1641,7 +2232,7 @@ class UpdateTableMetadata(ABC, Generic[U]):
     def _commit(self) -> UpdatesAndRequirements: ...
 
     def commit(self) -> None:
-        self._transaction._apply(*self._commit())
+        self._transaction._apply(*self._commit(), change=self)
 
     def __exit__(self, _: Any, value: Any, traceback: Any) -> None:
         """Close and commit the change."""
@@ -2494,8 +3085,7 @@ class WriteTask:
     task_id: int
     record_batches: List[pa.RecordBatch]
     sort_order_id: Optional[int] = None
-
-    # Later to be extended with partition information
+    partition_key: Optional[PartitionKey] = None
 
     def generate_data_file_filename(self, extension: str) -> str:
         # Mimics the behavior in the Java API:
@@ -2509,6 +3099,33 @@ class AddFileTask:
     partition_field_value: Record
 
 
+# The Avro codecs by the name that is used in the write.avro.compression-codec property
+AVRO_CODECS_BY_ICEBERG_NAME = {
+    "uncompressed": "null",
+    "gzip": "deflate",
+    "zstd": "zstandard",
+    "snappy": "snappy",
+}
+
+
+def _avro_compression(table_properties: Properties) -> Dict[str, Any]:
+    """Return the Avro compression codec and level that are configured for the table."""
+    iceberg_codec = table_properties.get(TableProperties.WRITE_AVRO_COMPRESSION, TableProperties.WRITE_AVRO_COMPRESSION_DEFAULT)
+    if (compression_codec := AVRO_CODECS_BY_ICEBERG_NAME.get(iceberg_codec.lower())) is None:
+        raise ValueError(
+            f"Unsupported Avro compression codec: {iceberg_codec}, expected one of: {', '.join(AVRO_CODECS_BY_ICEBERG_NAME)}"
+        )
+
+    return {
+        "compression_codec": compression_codec,
+        "compression_level": PropertyUtil.property_as_int(
+            properties=table_properties,
+            property_name=TableProperties.WRITE_AVRO_COMPRESSION_LEVEL,
+            default=TableProperties.WRITE_AVRO_COMPRESSION_LEVEL_DEFAULT,
+        ),
+    }
+
+
 def _new_manifest_path(location: str, num: int, commit_uuid: uuid.UUID) -> str:
     return f'{location}/metadata/{commit_uuid}-m{num}.avro'
 
@@ -2520,34 +3137,45 @@ def _generate_manifest_list_path(location: str, snapshot_id: int, attempt: int,
 
 
 def _dataframe_to_data_files(
-    table_metadata: TableMetadata, df: pa.Table, io: FileIO, write_uuid: Optional[uuid.UUID] = None
+    table_metadata: TableMetadata,
+    df: pa.Table,
+    io: FileIO,
+    write_uuid: Optional[uuid.UUID] = None,
+    target_file_size: Optional[int] = None,
 ) -> Iterable[DataFile]:
     """Convert a PyArrow table into a DataFile.
 
+    The rows are split into files of about the target size in memory, which defaults to the
+    write.target-file-size-bytes table property.
+
     Returns:
         An iterable that supplies datafiles that represent the table.
     """
-    from pyiceberg.io.pyarrow import bin_pack_arrow_table, write_file
-
-    if len([spec for spec in table_metadata.partition_specs if spec.spec_id != 0]) > 0:
-        raise ValueError("Cannot write to partitioned tables")
+    from pyiceberg.io.pyarrow import bin_pack_arrow_table, determine_partitions, write_file
 
     counter = itertools.count(0)
     write_uuid = write_uuid or uuid.uuid4()
 
-    target_file_size = PropertyUtil.property_as_int(
-        properties=table_metadata.properties,
-        property_name=TableProperties.WRITE_TARGET_FILE_SIZE_BYTES,
-        default=TableProperties.WRITE_TARGET_FILE_SIZE_BYTES_DEFAULT,
-    )
+    if target_file_size is None:
+        target_file_size = PropertyUtil.property_as_int(
+            properties=table_metadata.properties,
+            property_name=TableProperties.WRITE_TARGET_FILE_SIZE_BYTES,
+            default=TableProperties.WRITE_TARGET_FILE_SIZE_BYTES_DEFAULT,
+        )
+
+    spec = table_metadata.spec()
+    if spec.is_unpartitioned():
+        tasks = [WriteTask(write_uuid, next(counter), batches) for batches in bin_pack_arrow_table(df, target_file_size)]  # type: ignore
+    else:
+        # Each partition is bin-packed on its own, so a file never spans multiple partitions
+        tasks = [
+            WriteTask(write_uuid, next(counter), batches, partition_key=partition.partition_key)
+            for partition in determine_partitions(spec=spec, schema=table_metadata.schema(), arrow_table=df)
+            for batches in bin_pack_arrow_table(partition.arrow_table_partition, target_file_size)  # type: ignore
+        ]
 
     # This is an iter, so we don't have to materialize everything every time
-    # This will be more relevant when we start doing partitioned writes
-    yield from write_file(
-        io=io,
-        table_metadata=table_metadata,
-        tasks=iter([WriteTask(write_uuid, next(counter), batches) for batches in bin_pack_arrow_table(df, target_file_size)]),  # type: ignore
-    )
+    yield from write_file(io=io, table_metadata=table_metadata, tasks=iter(tasks))
 
 
 def _parquet_files_to_data_files(table_metadata: TableMetadata, file_paths: List[str], io: FileIO) -> Iterable[DataFile]:
@@ -2567,6 +3195,11 @@ class _MergingSnapshotProducer(UpdateTableMetadata["_MergingSnapshotProducer"]):
     _snapshot_id: int
     _parent_snapshot_id: Optional[int]
     _added_data_files: List[DataFile]
+    _added_delete_files: List[DataFile]
+    _added_manifests: Optional[List[ManifestFile]]
+    _added_data_sequence_number: Optional[int]
+    _manifest_num_counter: itertools.count[int]
+    _attempt: int
 
     def __init__(
         self,
@@ -2586,75 +3219,152 @@ class _MergingSnapshotProducer(UpdateTableMetadata["_MergingSnapshotProducer"]):
             snapshot.snapshot_id if (snapshot := self._transaction.table_metadata.current_snapshot()) else None
         )
         self._added_data_files = []
+        self._added_delete_files = []
+        self._added_manifests = None
+        # When set, the added data files get this data sequence number instead of the one of the snapshot
+        self._added_data_sequence_number = None
+        self._manifest_num_counter = itertools.count(0)
+        self._attempt = 0
         self.snapshot_properties = snapshot_properties
 
     def append_data_file(self, data_file: DataFile) -> _MergingSnapshotProducer:
         self._added_data_files.append(data_file)
         return self
 
+    def append_delete_file(self, delete_file: DataFile) -> _MergingSnapshotProducer:
+        self._added_delete_files.append(delete_file)
+        return self
+
     @abstractmethod
     def _deleted_entries(self) -> List[ManifestEntry]: ...
 
     @abstractmethod
     def _existing_manifests(self) -> List[ManifestFile]: ...
 
+    def _removed_data_files(self) -> List[DataFile]:
+        """Return the data and delete files that are removed from the table by the snapshot."""
+        return [entry.data_file for entry in self._deleted_entries()]
+
+    def _validate_concurrent_snapshots(self, snapshots: List[Snapshot]) -> None:
+        """Check that the snapshot can still be produced, after the given snapshots were committed concurrently.
+
+        Raises:
+            CommitFailedException: When the snapshots conflict with this one.
+        """
+
+    def _rebase(self) -> None:
+        """Produce the snapshot again on top of the current snapshot of the refreshed table.
+
+        The added data files and the manifest that holds them are reused, the other manifests
+        and the manifest list are written again.
+        """
+        table_metadata = self._transaction.table_metadata
+        concurrent_snapshots = []
+        snapshot = table_metadata.current_snapshot()
+        while snapshot is not None and snapshot.snapshot_id != self._parent_snapshot_id:
+            concurrent_snapshots.append(snapshot)
+            snapshot = table_metadata.snapshot_by_id(snapshot.parent_snapshot_id) if snapshot.parent_snapshot_id else None
+        self._validate_concurrent_snapshots(concurrent_snapshots)
+
+        self._parent_snapshot_id = (
+            current_snapshot.snapshot_id if (current_snapshot := table_metadata.current_snapshot()) else None
+        )
+        if table_metadata.snapshot_by_id(self._snapshot_id) is not None:
+            # The snapshot-id is taken in the meantime, the added manifest is written again with a new one
+            self._snapshot_id = table_metadata.new_snapshot_id()
+            self._added_manifests = None
+        self._attempt += 1
+
     def _manifests(self) -> List[ManifestFile]:
         def _write_added_manifest() -> List[ManifestFile]:
+            if self._added_manifests is not None:
+                return self._added_manifests
+            self._added_manifests = []
             if self._added_data_files:
-                output_file_location = _new_manifest_path(
-                    location=self._transaction.table_metadata.location, num=0, commit_uuid=self.commit_uuid
+                with self._new_manifest_writer(self._transaction.table_metadata.spec()) as writer:
+                    for data_file in self._added_data_files:
+                        writer.add_entry(
+                            ManifestEntry(
+                                status=ManifestEntryStatus.ADDED,
+                                snapshot_id=self._snapshot_id,
+                                data_sequence_number=self._added_data_sequence_number,
+                                file_sequence_number=None,
+                                data_file=data_file,
+                            )
+                        )
+                self._added_manifests.append(writer.to_manifest_file())
+
+            # The delete files are written in the partition spec of the data files that they apply to
+            delete_files_per_spec: Dict[int, List[DataFile]] = {}
+            for delete_file in self._added_delete_files:
+                spec_id = (
+                    delete_file.spec_id if delete_file.spec_id is not None else self._transaction.table_metadata.default_spec_id
                 )
-                with write_manifest(
-                    format_version=self._transaction.table_metadata.format_version,
-                    spec=self._transaction.table_metadata.spec(),
-                    schema=self._transaction.table_metadata.schema(),
-                    output_file=self._io.new_output(output_file_location),
-                    snapshot_id=self._snapshot_id,
+                delete_files_per_spec.setdefault(spec_id, []).append(delete_file)
+            for spec_id, delete_files in delete_files_per_spec.items():
+                with self._new_manifest_writer(
+                    self._transaction.table_metadata.specs()[spec_id], content=ManifestContent.DELETES
                 ) as writer:
-                    for data_file in self._added_data_files:
+                    for delete_file in delete_files:
                         writer.add_entry(
                             ManifestEntry(
                                 status=ManifestEntryStatus.ADDED,
                                 snapshot_id=self._snapshot_id,
                                 data_sequence_number=None,
                                 file_sequence_number=None,
-                                data_file=data_file,
+                                data_file=delete_file,
                             )
                         )
-                return [writer.to_manifest_file()]
-            else:
-                return []
+                self._added_manifests.append(writer.to_manifest_file())
+            return self._added_manifests
 
         def _write_delete_manifest() -> List[ManifestFile]:
             # Check if we need to mark the files as deleted
             deleted_entries = self._deleted_entries()
             if len(deleted_entries) > 0:
-                output_file_location = _new_manifest_path(
-                    location=self._transaction.table_metadata.location, num=1, commit_uuid=self.commit_uuid
-                )
-
-                with write_manifest(
-                    format_version=self._transaction.table_metadata.format_version,
-                    spec=self._transaction.table_metadata.spec(),
-                    schema=self._transaction.table_metadata.schema(),
-                    output_file=self._io.new_output(output_file_location),
-                    snapshot_id=self._snapshot_id,
-                ) as writer:
+                with self._new_manifest_writer(self._transaction.table_metadata.spec()) as writer:
                     for delete_entry in deleted_entries:
                         writer.add_entry(delete_entry)
                 return [writer.to_manifest_file()]
             else:
                 return []
 
-        executor = ExecutorFactory.get_or_create()
+        executor = ExecutorFactory.get_or_create(COMMIT_POOL)
 
         added_manifests = executor.submit(_write_added_manifest)
         delete_manifests = executor.submit(_write_delete_manifest)
         existing_manifests = executor.submit(self._existing_manifests)
 
-        return added_manifests.result() + delete_manifests.result() + existing_manifests.result()
+        return self._process_manifests(added_manifests.result() + delete_manifests.result() + existing_manifests.result())
 
-    def _summary(self, snapshot_properties: Dict[str, str] = EMPTY_DICT) -> Summary:
+    def _process_manifests(self, manifests: List[ManifestFile]) -> List[ManifestFile]:
+        """Process the manifests of the new snapshot before they are written to the manifest list.
+
+        Args:
+            manifests: The manifests, starting with the ones that are written by this producer.
+
+        Returns:
+            The manifests of the new snapshot.
+        """
+        return manifests
+
+    def _new_manifest_writer(self, spec: PartitionSpec, content: ManifestContent = ManifestContent.DATA) -> ManifestWriter:
+        output_file_location = _new_manifest_path(
+            location=self._transaction.table_metadata.location,
+            num=next(self._manifest_num_counter),
+            commit_uuid=self.commit_uuid,
+        )
+        return write_manifest(
+            format_version=self._transaction.table_metadata.format_version,
+            spec=spec,
+            schema=self._transaction.table_metadata.schema(),
+            output_file=self._io.new_output(output_file_location),
+            snapshot_id=self._snapshot_id,
+            content=content,
+            **_avro_compression(self._transaction.table_metadata.properties),
+        )
+
+    def _summary(self, snapshot_properties: Dict[str, str] = EMPTY_DICT) -> Summary:
         ssc = SnapshotSummaryCollector()
         partition_summary_limit = int(
             self._transaction.table_metadata.properties.get(
@@ -2670,6 +3380,25 @@ class _MergingSnapshotProducer(UpdateTableMetadata["_MergingSnapshotProducer"]):
                 schema=self._transaction.table_metadata.schema(),
             )
 
+        specs = self._transaction.table_metadata.specs()
+        for delete_file in self._added_delete_files:
+            ssc.add_file(
+                data_file=delete_file,
+                partition_spec=specs[delete_file.spec_id]
+                if delete_file.spec_id is not None
+                else self._transaction.table_metadata.spec(),
+                schema=self._transaction.table_metadata.schema(),
+            )
+
+        for data_file in self._removed_data_files():
+            ssc.remove_file(
+                data_file=data_file,
+                partition_spec=specs[data_file.spec_id]
+                if data_file.spec_id is not None
+                else self._transaction.table_metadata.spec(),
+                schema=self._transaction.table_metadata.schema(),
+            )
+
         previous_snapshot = (
             self._transaction.table_metadata.snapshot_by_id(self._parent_snapshot_id)
             if self._parent_snapshot_id is not None
@@ -2679,7 +3408,6 @@ class _MergingSnapshotProducer(UpdateTableMetadata["_MergingSnapshotProducer"]):
         return update_snapshot_summaries(
             summary=Summary(operation=self._operation, **ssc.build(), **snapshot_properties),
             previous_summary=previous_snapshot.summary if previous_snapshot is not None else None,
-            truncate_full_table=self._operation == Operation.OVERWRITE,
         )
 
     def _commit(self) -> UpdatesAndRequirements:
@@ -2691,7 +3419,7 @@ class _MergingSnapshotProducer(UpdateTableMetadata["_MergingSnapshotProducer"]):
         manifest_list_file_path = _generate_manifest_list_path(
             location=self._transaction.table_metadata.location,
             snapshot_id=self._snapshot_id,
-            attempt=0,
+            attempt=self._attempt,
             commit_uuid=self.commit_uuid,
         )
         with write_manifest_list(
@@ -2700,6 +3428,7 @@ class _MergingSnapshotProducer(UpdateTableMetadata["_MergingSnapshotProducer"]):
             snapshot_id=self._snapshot_id,
             parent_snapshot_id=self._parent_snapshot_id,
             sequence_number=next_sequence_number,
+            **_avro_compression(self._transaction.table_metadata.properties),
         ) as writer:
             writer.add_manifests(new_manifests)
 
@@ -2755,47 +3484,596 @@ class FastAppendFiles(_MergingSnapshotProducer):
         return []
 
 
-class OverwriteFiles(_MergingSnapshotProducer):
+class MergeAppendFiles(FastAppendFiles):
+    """Append the data files, and merge the small manifests of the table into larger ones.
+
+    The manifests are merged per partition spec, into manifests of about `commit.manifest.target-size-bytes`.
+    The manifest with the new data files is only merged when it would be merged with at least
+    `commit.manifest.min-count-to-merge` manifests, so that the table is not rewritten on each commit.
+    The `commit.manifest-merge.enabled` table property only decides whether `Table.append` uses this
+    producer or a fast append.
+    """
+
+    _target_size_bytes: int
+    _min_count_to_merge: int
+
+    def __init__(
+        self,
+        operation: Operation,
+        transaction: Transaction,
+        io: FileIO,
+        commit_uuid: Optional[uuid.UUID] = None,
+        snapshot_properties: Dict[str, str] = EMPTY_DICT,
+    ) -> None:
+        super().__init__(operation, transaction, io, commit_uuid, snapshot_properties)
+        properties = self._transaction.table_metadata.properties
+        self._target_size_bytes = PropertyUtil.property_as_int(  # type: ignore
+            properties, TableProperties.MANIFEST_TARGET_SIZE_BYTES, TableProperties.MANIFEST_TARGET_SIZE_BYTES_DEFAULT
+        )
+        self._min_count_to_merge = PropertyUtil.property_as_int(  # type: ignore
+            properties, TableProperties.MANIFEST_MIN_MERGE_COUNT, TableProperties.MANIFEST_MIN_MERGE_COUNT_DEFAULT
+        )
+
+    def _process_manifests(self, manifests: List[ManifestFile]) -> List[ManifestFile]:
+        if not manifests:
+            return manifests
+
+        data_manifests = [manifest for manifest in manifests if manifest.content == ManifestContent.DATA]
+        delete_manifests = [manifest for manifest in manifests if manifest.content == ManifestContent.DELETES]
+
+        # The groups are kept in the order of their first manifest, so the new manifests stay in front
+        groups: Dict[int, List[ManifestFile]] = {}
+        for manifest in data_manifests:
+            groups.setdefault(manifest.partition_spec_id, []).append(manifest)
+
+        # The manifest with the new data files, when any are added
+        added_manifest = next(
+            (manifest for manifest in self._added_manifests or [] if manifest.content == ManifestContent.DATA), None
+        )
+        merged_manifests: List[ManifestFile] = []
+        for spec_id, group in groups.items():
+            merged_manifests.extend(self._merge_group(added_manifest, spec_id, group))
+
+        return merged_manifests + delete_manifests
+
+    def _merge_group(
+        self, added_manifest: Optional[ManifestFile], spec_id: int, manifests: List[ManifestFile]
+    ) -> List[ManifestFile]:
+        packer: ListPacker[ManifestFile] = ListPacker(target_weight=self._target_size_bytes, lookback=1, largest_bin_first=False)
+        # Packing from the end leaves the bin that is not full in front, with the new manifests
+        bins = packer.pack_end(manifests, lambda manifest: manifest.manifest_length)
+
+        def _merge_bin(manifest_bin: List[ManifestFile]) -> List[ManifestFile]:
+            if len(manifest_bin) == 1:
+                return manifest_bin
+            if added_manifest is not None and added_manifest in manifest_bin and len(manifest_bin) < self._min_count_to_merge:
+                # The bin with the new manifest is only merged once there are enough manifests, this
+                # only applies to that bin, so that large new manifests do not prevent merging older ones
+                return manifest_bin
+            return [self._merge_bin(spec_id, manifest_bin)]
+
+        executor = ExecutorFactory.get_or_create(COMMIT_POOL)
+        return list(chain.from_iterable(executor.map(_merge_bin, bins)))
+
+    def _merge_bin(self, spec_id: int, manifest_bin: List[ManifestFile]) -> ManifestFile:
+        with self._new_manifest_writer(self._transaction.table_metadata.specs()[spec_id]) as writer:
+            for manifest in manifest_bin:
+                for entry in manifest.fetch_manifest_entry(self._io, discard_deleted=False):
+                    if entry.snapshot_id == self._snapshot_id and entry.status == ManifestEntryStatus.ADDED:
+                        # The files that are added by this snapshot inherit the sequence number of the snapshot
+                        writer.add_entry(
+                            ManifestEntry(
+                                status=ManifestEntryStatus.ADDED,
+                                snapshot_id=self._snapshot_id,
+                                data_sequence_number=None,
+                                file_sequence_number=None,
+                                data_file=entry.data_file,
+                            )
+                        )
+                    elif entry.snapshot_id == self._snapshot_id and entry.status == ManifestEntryStatus.DELETED:
+                        writer.add_entry(entry)
+                    elif entry.status != ManifestEntryStatus.DELETED:
+                        # The entries are shared with the manifest cache, so they are copied instead of changed
+                        writer.add_entry(
+                            ManifestEntry(
+                                status=ManifestEntryStatus.EXISTING,
+                                snapshot_id=entry.snapshot_id,
+                                data_sequence_number=entry.data_sequence_number,
+                                file_sequence_number=entry.file_sequence_number,
+                                data_file=entry.data_file,
+                            )
+                        )
+        return writer.to_manifest_file()
+
+
+def _partition_sort_key(partition: Record) -> Tuple[Tuple[bool, Any], ...]:
+    """Return a key to sort partitions by their values, with the null values first."""
+    return tuple((value is not None, value) for value in partition.record_fields())
+
+
+class RewriteManifests(_MergingSnapshotProducer):
+    """Rewrite the manifests of the table, with the live entries clustered by partition.
+
+    The entries are sorted by their partition and written into manifests of about
+    `commit.manifest.target-size-bytes`, per partition spec and content. The data and delete files,
+    and their sequence numbers, stay the same. The manifests are planned from the current snapshot
+    on each attempt, so the files that are committed concurrently are not lost.
+    """
+
+    _target_size_bytes: int
+    _created_manifests_count: int
+    _replaced_manifests_count: int
+    _entries_count: int
+
+    def __init__(
+        self,
+        operation: Operation,
+        transaction: Transaction,
+        io: FileIO,
+        commit_uuid: Optional[uuid.UUID] = None,
+        snapshot_properties: Dict[str, str] = EMPTY_DICT,
+    ) -> None:
+        super().__init__(operation, transaction, io, commit_uuid, snapshot_properties)
+        self._target_size_bytes = PropertyUtil.property_as_int(  # type: ignore
+            self._transaction.table_metadata.properties,
+            TableProperties.MANIFEST_TARGET_SIZE_BYTES,
+            TableProperties.MANIFEST_TARGET_SIZE_BYTES_DEFAULT,
+        )
+        self._created_manifests_count = 0
+        self._replaced_manifests_count = 0
+        self._entries_count = 0
+
     def _existing_manifests(self) -> List[ManifestFile]:
-        """To determine if there are any existing manifest files.
+        if self._parent_snapshot_id is None:
+            return []
+        previous_snapshot = self._transaction.table_metadata.snapshot_by_id(self._parent_snapshot_id)
+        if previous_snapshot is None:
+            raise ValueError(f"Snapshot could not be found: {self._parent_snapshot_id}")
+        return previous_snapshot.manifests(io=self._io)
+
+    def _process_manifests(self, manifests: List[ManifestFile]) -> List[ManifestFile]:
+        groups: Dict[Tuple[ManifestContent, int], List[ManifestFile]] = {}
+        for manifest in manifests:
+            groups.setdefault((manifest.content, manifest.partition_spec_id), []).append(manifest)
+
+        self._replaced_manifests_count = len(manifests)
+        # The group rewrites are submitted from the caller's thread, after the commit pool has finished
+        # the futures of _manifests, so a single worker cannot wait on itself
+        executor = ExecutorFactory.get_or_create(COMMIT_POOL)
+        rewritten = list(executor.map(self._rewrite_group, groups.keys(), groups.values()))
+        rewritten_manifests = list(chain.from_iterable(manifests for manifests, _ in rewritten))
+        self._created_manifests_count = len(rewritten_manifests)
+        self._entries_count = sum(entries_count for _, entries_count in rewritten)
+        return rewritten_manifests
+
+    def _rewrite_group(self, group: Tuple[ManifestContent, int], manifests: List[ManifestFile]) -> Tuple[List[ManifestFile], int]:
+        """Rewrite the live entries of the manifests with the same content and partition spec, sorted by partition."""
+        content, spec_id = group
+        entries = [entry for manifest in manifests for entry in manifest.fetch_manifest_entry(self._io, discard_deleted=True)]
+        if not entries:
+            return [], 0
+
+        # The entries are split by their average size in the current manifests
+        entry_size = max(sum(manifest.manifest_length for manifest in manifests) // len(entries), 1)
+        entries_per_manifest = max(self._target_size_bytes // entry_size, 1)
+        entries.sort(key=lambda entry: _partition_sort_key(entry.data_file.partition))
+
+        spec = self._transaction.table_metadata.specs()[spec_id]
+        rewritten_manifests = []
+        for start in range(0, len(entries), entries_per_manifest):
+            with self._new_manifest_writer(spec, content=content) as writer:
+                # The entries are shared with the manifest cache, so they are copied instead of changed
+                for entry in entries[start : start + entries_per_manifest]:
+                    writer.add_entry(
+                        ManifestEntry(
+                            status=ManifestEntryStatus.EXISTING,
+                            snapshot_id=entry.snapshot_id,
+                            data_sequence_number=entry.data_sequence_number,
+                            file_sequence_number=entry.file_sequence_number,
+                            data_file=entry.data_file,
+                        )
+                    )
+            rewritten_manifests.append(writer.to_manifest_file())
+        return rewritten_manifests, len(entries)
 
-        In the of a full overwrite, all the previous manifests are
-        considered deleted.
-        """
+    def _deleted_entries(self) -> List[ManifestEntry]:
         return []
 
-    def _deleted_entries(self) -> List[ManifestEntry]:
-        """To determine if we need to record any deleted entries.
+    def _summary(self, snapshot_properties: Dict[str, str] = EMPTY_DICT) -> Summary:
+        summary = super()._summary(snapshot_properties)
+        summary[MANIFESTS_CREATED] = str(self._created_manifests_count)
+        summary[MANIFESTS_REPLACED] = str(self._replaced_manifests_count)
+        summary[ENTRIES_PROCESSED] = str(self._entries_count)
+        return summary
+
+
+class RowDelta(FastAppendFiles):
+    """Add delete files that remove rows from the data files of the table, and optionally new data files.
+
+    The delete files refer to data files that have to be part of the table when the snapshot is committed.
+    When a concurrent snapshot removed one of them, for example to rewrite it, the deleted rows would
+    come back, so the commit fails instead.
+    """
+
+    _referenced_data_files: Set[str]
+
+    def __init__(
+        self,
+        operation: Operation,
+        transaction: Transaction,
+        io: FileIO,
+        commit_uuid: Optional[uuid.UUID] = None,
+        snapshot_properties: Dict[str, str] = EMPTY_DICT,
+    ) -> None:
+        super().__init__(operation, transaction, io, commit_uuid, snapshot_properties)
+        self._referenced_data_files = set()
+
+    def append_data_file(self, data_file: DataFile) -> _MergingSnapshotProducer:
+        if self._operation == Operation.DELETE:
+            # The deleted rows are replaced by new data files
+            self._operation = Operation.OVERWRITE
+        return super().append_data_file(data_file)
+
+    def validate_data_files_exist(self, file_paths: Iterable[str]) -> RowDelta:
+        """Fail the commit when any of the data files is removed by a concurrent snapshot."""
+        self._referenced_data_files.update(file_paths)
+        return self
+
+    def _validate_concurrent_snapshots(self, snapshots: List[Snapshot]) -> None:
+        if not self._referenced_data_files:
+            return
+        for snapshot in snapshots:
+            for manifest in snapshot.manifests(self._io):
+                if (
+                    manifest.content != ManifestContent.DATA
+                    or manifest.added_snapshot_id != snapshot.snapshot_id
+                    or not manifest.has_deleted_files()
+                ):
+                    continue
+                for entry in manifest.fetch_manifest_entry(self._io, discard_deleted=False):
+                    if (
+                        entry.status == ManifestEntryStatus.DELETED
+                        and entry.snapshot_id == snapshot.snapshot_id
+                        and entry.data_file.file_path in self._referenced_data_files
+                    ):
+                        raise CommitFailedException(
+                            f"Cannot commit, snapshot {snapshot.snapshot_id} removed a data file concurrently "
+                            f"that the delete files refer to: {entry.data_file.file_path}"
+                        )
+
+
+@dataclass(frozen=True)
+class _ManifestDeletes:
+    """The entries of a manifest that are deleted, and the ones that are kept, by a delete filter.
+
+    When no entries are deleted, the manifest is kept as it is.
+    """
+
+    manifest: ManifestFile
+    deleted_entries: List[ManifestEntry]
+    kept_entries: List[ManifestEntry]
+    files_to_rewrite: List[DataFile]
 
-        With a full overwrite all the entries are considered deleted.
-        With partial overwrites we have to use the predicate to evaluate
-        which entries are affected.
+
+class DeleteFiles(_MergingSnapshotProducer):
+    """Delete the data files that match a filter, and the data files that are deleted explicitly.
+
+    A data file is deleted when all its rows match the filter, based on its partition or its column
+    metrics. The data files of which only some rows match the filter are returned by
+    `files_to_rewrite`, and have to be deleted explicitly, after their remaining rows are appended.
+
+    Only the manifests that contain deleted data files are rewritten, the others are kept as they are.
+    """
+
+    _delete_filter: BooleanExpression
+    _case_sensitive: bool
+    _deleted_file_paths: Set[str]
+    _deleted_partitions: Set[Tuple[int, Tuple[Any, ...]]]
+    _manifest_deletes: Optional[List[_ManifestDeletes]]
+
+    def __init__(
+        self,
+        operation: Operation,
+        transaction: Transaction,
+        io: FileIO,
+        commit_uuid: Optional[uuid.UUID] = None,
+        snapshot_properties: Dict[str, str] = EMPTY_DICT,
+        delete_filter: BooleanExpression = ALWAYS_FALSE,
+        case_sensitive: bool = True,
+    ) -> None:
+        super().__init__(operation, transaction, io, commit_uuid, snapshot_properties)
+        self._delete_filter = delete_filter
+        self._case_sensitive = case_sensitive
+        self._deleted_file_paths = set()
+        self._deleted_partitions = set()
+        self._manifest_deletes = None
+
+    @property
+    def delete_filter(self) -> BooleanExpression:
+        return self._delete_filter
+
+    @property
+    def case_sensitive(self) -> bool:
+        return self._case_sensitive
+
+    def append_data_file(self, data_file: DataFile) -> _MergingSnapshotProducer:
+        if self._operation == Operation.DELETE:
+            # The deleted rows are replaced by new data files
+            self._operation = Operation.OVERWRITE
+        return super().append_data_file(data_file)
+
+    def delete_data_file(self, data_file: DataFile) -> DeleteFiles:
+        self._deleted_file_paths.add(data_file.file_path)
+        self._deleted_partitions.add(_equality_delete_partition(data_file))
+        self._manifest_deletes = None
+        return self
+
+    def files_to_rewrite(self) -> List[DataFile]:
+        """Return the data files of which only some rows match the delete filter, and that are not deleted explicitly."""
+        return [data_file for manifest_deletes in self._plan_deletes() for data_file in manifest_deletes.files_to_rewrite]
+
+    def deletes_files(self) -> bool:
+        """Return whether the snapshot deletes any data files, or has data files to rewrite."""
+        return any(
+            manifest_deletes.deleted_entries or manifest_deletes.files_to_rewrite for manifest_deletes in self._plan_deletes()
+        )
+
+    def _missing_file_paths(self) -> Set[str]:
+        found = {
+            entry.data_file.file_path
+            for manifest_deletes in self._plan_deletes()
+            for entry in manifest_deletes.deleted_entries
+            if entry.data_file.content == DataFileContent.DATA
+        }
+        return self._deleted_file_paths - found
+
+    def _file_evaluators(self, spec_id: int) -> Tuple[Callable[[DataFile], bool], Callable[[DataFile], bool]]:
+        """Return functions that tell if all rows, and if any rows, of a data file of the spec might match the filter.
+
+        The evaluators keep state, so they are created for each manifest that is evaluated.
         """
-        if self._parent_snapshot_id is not None:
-            previous_snapshot = self._transaction.table_metadata.snapshot_by_id(self._parent_snapshot_id)
-            if previous_snapshot is None:
-                # This should never happen since you cannot overwrite an empty table
-                raise ValueError(f"Could not find the previous snapshot: {self._parent_snapshot_id}")
-
-            executor = ExecutorFactory.get_or_create()
-
-            def _get_entries(manifest: ManifestFile) -> List[ManifestEntry]:
-                return [
-                    ManifestEntry(
-                        status=ManifestEntryStatus.DELETED,
-                        snapshot_id=entry.snapshot_id,
-                        data_sequence_number=entry.data_sequence_number,
-                        file_sequence_number=entry.file_sequence_number,
-                        data_file=entry.data_file,
+        if self._delete_filter == AlwaysFalse():
+            return (lambda _: False), (lambda _: False)
+
+        schema = self._transaction.table_metadata.schema()
+        spec = self._transaction.table_metadata.specs()[spec_id]
+        partition_schema = Schema(*spec.partition_type(schema).fields)
+        strict_partition = expression_evaluator(
+            partition_schema, strict_projection(schema, spec, self._case_sensitive)(self._delete_filter), self._case_sensitive
+        )
+        inclusive_partition = expression_evaluator(
+            partition_schema, inclusive_projection(schema, spec, self._case_sensitive)(self._delete_filter), self._case_sensitive
+        )
+        strict_metrics = _StrictMetricsEvaluator(schema, self._delete_filter, self._case_sensitive).eval
+        inclusive_metrics = _InclusiveMetricsEvaluator(schema, self._delete_filter, self._case_sensitive).eval
+
+        def _all_rows_match(data_file: DataFile) -> bool:
+            return strict_partition(data_file.partition) or strict_metrics(data_file)
+
+        def _rows_might_match(data_file: DataFile) -> bool:
+            return inclusive_partition(data_file.partition) and inclusive_metrics(data_file)
+
+        return _all_rows_match, _rows_might_match
+
+    def _plan_manifest(self, manifest: ManifestFile) -> _ManifestDeletes:
+        table_metadata = self._transaction.table_metadata
+        schema = table_metadata.schema()
+        spec = table_metadata.specs()[manifest.partition_spec_id]
+
+        if manifest.content == ManifestContent.DELETES:
+            # The delete files can only be dropped when all the data of the partition spec is deleted
+            if strict_projection(schema, spec, self._case_sensitive)(self._delete_filter) == AlwaysTrue():
+                return _ManifestDeletes(manifest, manifest.fetch_manifest_entry(self._io, discard_deleted=True), [], [])
+            return _ManifestDeletes(manifest, [], [], [])
+
+        partition_filter = inclusive_projection(schema, spec, self._case_sensitive)(self._delete_filter)
+        if not self._deleted_file_paths and not manifest_evaluator(spec, schema, partition_filter, self._case_sensitive)(
+            manifest
+        ):
+            return _ManifestDeletes(manifest, [], [], [])
+
+        all_rows_match, rows_might_match = self._file_evaluators(manifest.partition_spec_id)
+        deleted_entries = []
+        kept_entries = []
+        files_to_rewrite = []
+        for entry in manifest.fetch_manifest_entry(self._io, discard_deleted=True):
+            if entry.data_file.file_path in self._deleted_file_paths or all_rows_match(entry.data_file):
+                deleted_entries.append(entry)
+            else:
+                kept_entries.append(entry)
+                if rows_might_match(entry.data_file):
+                    files_to_rewrite.append(entry.data_file)
+
+        return _ManifestDeletes(manifest, deleted_entries, kept_entries, files_to_rewrite)
+
+    def _plan_deletes(self) -> List[_ManifestDeletes]:
+        if self._manifest_deletes is None:
+            manifests = []
+            if self._parent_snapshot_id is not None:
+                previous_snapshot = self._transaction.table_metadata.snapshot_by_id(self._parent_snapshot_id)
+                if previous_snapshot is None:
+                    raise ValueError(f"Could not find the previous snapshot: {self._parent_snapshot_id}")
+                manifests = previous_snapshot.manifests(io=self._io)
+
+            executor = ExecutorFactory.get_or_create(IO_POOL)
+            self._manifest_deletes = list(executor.map(self._plan_manifest, manifests))
+
+        return self._manifest_deletes
+
+    def _validate_concurrent_snapshots(self, snapshots: List[Snapshot]) -> None:
+        """Check that no data files that match the filter were added concurrently, since those would be deleted without being seen."""
+        for snapshot in snapshots:
+            for manifest in snapshot.manifests(self._io):
+                if (
+                    manifest.content != ManifestContent.DATA
+                    or manifest.added_snapshot_id != snapshot.snapshot_id
+                    or not manifest.has_added_files()
+                ):
+                    continue
+                _, rows_might_match = self._file_evaluators(manifest.partition_spec_id)
+                for entry in manifest.fetch_manifest_entry(self._io, discard_deleted=True):
+                    if (
+                        entry.status == ManifestEntryStatus.ADDED
+                        and entry.snapshot_id == snapshot.snapshot_id
+                        and rows_might_match(entry.data_file)
+                    ):
+                        raise CommitFailedException(
+                            f"Cannot commit, snapshot {snapshot.snapshot_id} added data files concurrently "
+                            f"that match the filter: {self._delete_filter}"
+                        )
+        self._validate_no_concurrent_deletes(snapshots, equality_deletes=True)
+
+    def _validate_no_concurrent_deletes(self, snapshots: List[Snapshot], equality_deletes: bool) -> None:
+        """Check that no delete files were added concurrently that might apply to the explicitly deleted data files.
+
+        The deleted data files are read before they are replaced, so the rows that the concurrent delete files
+        remove would come back. Positional deletes are matched on the metrics of their file_path column, and
+        equality deletes on the partition of the data files, or all of them when the delete file is unpartitioned.
+
+        Args:
+            snapshots: The snapshots that were committed concurrently.
+            equality_deletes: Whether equality deletes are checked as well, which do not apply to the replacing
+                data files when those get a newer data sequence number.
+        """
+        if not self._deleted_file_paths:
+            return
+        evaluator = _InclusiveMetricsEvaluator(POSITIONAL_DELETE_SCHEMA, In("file_path", self._deleted_file_paths))
+        specs = self._transaction.table_metadata.specs()
+        for snapshot in snapshots:
+            for manifest in snapshot.manifests(self._io):
+                if (
+                    manifest.content != ManifestContent.DELETES
+                    or manifest.added_snapshot_id != snapshot.snapshot_id
+                    or not manifest.has_added_files()
+                ):
+                    continue
+                for entry in manifest.fetch_manifest_entry(self._io, discard_deleted=True):
+                    if entry.status != ManifestEntryStatus.ADDED or entry.snapshot_id != snapshot.snapshot_id:
+                        continue
+                    delete_file = entry.data_file
+                    if delete_file.content == DataFileContent.POSITION_DELETES and evaluator.eval(delete_file):
+                        raise CommitFailedException(
+                            f"Cannot commit, snapshot {snapshot.snapshot_id} added positional deletes concurrently "
+                            f"that might refer to the deleted data files: {delete_file.file_path}"
+                        )
+                    if (
+                        equality_deletes
+                        and delete_file.content == DataFileContent.EQUALITY_DELETES
+                        and (
+                            specs[delete_file.spec_id or INITIAL_PARTITION_SPEC_ID].is_unpartitioned()
+                            or _equality_delete_partition(delete_file) in self._deleted_partitions
+                        )
+                    ):
+                        raise CommitFailedException(
+                            f"Cannot commit, snapshot {snapshot.snapshot_id} added equality deletes concurrently "
+                            f"that might apply to the deleted data files: {delete_file.file_path}"
+                        )
+
+    def _rebase(self) -> None:
+        super()._rebase()
+        self._manifest_deletes = None
+        if missing_file_paths := self._missing_file_paths():
+            raise CommitFailedException(
+                f"Cannot commit, data files were deleted concurrently: {', '.join(sorted(missing_file_paths))}"
+            )
+        if files_to_rewrite := self.files_to_rewrite():
+            raise CommitFailedException(
+                f"Cannot commit, data files that partially match the filter were added concurrently: "
+                f"{', '.join(data_file.file_path for data_file in files_to_rewrite)}"
+            )
+
+    def _existing_manifests(self) -> List[ManifestFile]:
+        """Rewrite the manifests that contain deleted data files, and keep the other ones.
+
+        In the rewritten manifests, the deleted data files are marked as deleted, and the other ones as existing.
+        """
+        if missing_file_paths := self._missing_file_paths():
+            raise ValueError(f"Cannot delete data files that are not in the table: {', '.join(sorted(missing_file_paths))}")
+        if files_to_rewrite := self.files_to_rewrite():
+            raise ValueError(
+                f"Cannot delete data files where some, but not all, rows match the filter {self._delete_filter}: "
+                f"{', '.join(data_file.file_path for data_file in files_to_rewrite)}"
+            )
+
+        def _write_manifest(manifest_deletes: _ManifestDeletes) -> List[ManifestFile]:
+            manifest = manifest_deletes.manifest
+            if not manifest_deletes.deleted_entries:
+                if manifest.has_added_files() or manifest.has_existing_files() or manifest.added_snapshot_id == self._snapshot_id:
+                    return [manifest]
+                return []
+            if manifest.content == ManifestContent.DELETES:
+                # All the data of the partition spec is deleted, so the delete files do not apply anymore
+                return []
+
+            with self._new_manifest_writer(self._transaction.table_metadata.specs()[manifest.partition_spec_id]) as writer:
+                # The entries are shared with the manifest cache, so they are copied instead of changed
+                for entry in manifest_deletes.deleted_entries:
+                    writer.add_entry(
+                        ManifestEntry(
+                            status=ManifestEntryStatus.DELETED,
+                            snapshot_id=self._snapshot_id,
+                            data_sequence_number=entry.data_sequence_number,
+                            file_sequence_number=entry.file_sequence_number,
+                            data_file=entry.data_file,
+                        )
                     )
-                    for entry in manifest.fetch_manifest_entry(self._io, discard_deleted=True)
-                    if entry.data_file.content == DataFileContent.DATA
-                ]
+                for entry in manifest_deletes.kept_entries:
+                    writer.add_entry(
+                        ManifestEntry(
+                            status=ManifestEntryStatus.EXISTING,
+                            snapshot_id=entry.snapshot_id,
+                            data_sequence_number=entry.data_sequence_number,
+                            file_sequence_number=entry.file_sequence_number,
+                            data_file=entry.data_file,
+                        )
+                    )
+            return [writer.to_manifest_file()]
 
-            list_of_entries = executor.map(_get_entries, previous_snapshot.manifests(self._io))
-            return list(chain(*list_of_entries))
-        else:
-            return []
+        executor = ExecutorFactory.get_or_create(IO_POOL)
+        return list(chain.from_iterable(executor.map(_write_manifest, self._plan_deletes())))
+
+    def _deleted_entries(self) -> List[ManifestEntry]:
+        """The deleted entries are written to the rewritten manifests, see `_existing_manifests`."""
+        return []
+
+    def _removed_data_files(self) -> List[DataFile]:
+        return [entry.data_file for manifest_deletes in self._plan_deletes() for entry in manifest_deletes.deleted_entries]
+
+
+class OverwriteFiles(DeleteFiles):
+    """Delete the data files that match the overwrite filter, which is the full table by default, and append new ones."""
+
+
+class RewriteFiles(DeleteFiles):
+    """Replace data files by new data files with the same rows, for example to compact small files.
+
+    The new data files keep the data sequence number of the snapshot that the rewrite started from,
+    so that the equality deletes that are committed concurrently still apply to their rows. The commit
+    fails when a concurrent snapshot removed one of the replaced data files, or added positional deletes
+    that might refer to one of them, since those rows would come back.
+    """
+
+    def __init__(
+        self,
+        operation: Operation,
+        transaction: Transaction,
+        io: FileIO,
+        commit_uuid: Optional[uuid.UUID] = None,
+        snapshot_properties: Dict[str, str] = EMPTY_DICT,
+    ) -> None:
+        super().__init__(operation, transaction, io, commit_uuid, snapshot_properties)
+        if self._transaction.table_metadata.format_version >= 2 and self._parent_snapshot_id is not None:
+            if (parent_snapshot := self._transaction.table_metadata.snapshot_by_id(self._parent_snapshot_id)) is not None:
+                self._added_data_sequence_number = parent_snapshot.sequence_number
+
+    def append_data_file(self, data_file: DataFile) -> _MergingSnapshotProducer:
+        # The rows are the same, so the operation stays a replace
+        self._added_data_files.append(data_file)
+        return self
+
+    def _validate_concurrent_snapshots(self, snapshots: List[Snapshot]) -> None:
+        # The replacing data files keep the data sequence number, so the equality deletes still apply to them
+        self._validate_no_concurrent_deletes(snapshots, equality_deletes=False)
 
 
 class UpdateSnapshot:
@@ -2813,7 +4091,12 @@ class UpdateSnapshot:
             operation=Operation.APPEND, transaction=self._transaction, io=self._io, snapshot_properties=self._snapshot_properties
         )
 
-    def overwrite(self) -> OverwriteFiles:
+    def merge_append(self) -> MergeAppendFiles:
+        return MergeAppendFiles(
+            operation=Operation.APPEND, transaction=self._transaction, io=self._io, snapshot_properties=self._snapshot_properties
+        )
+
+    def overwrite(self, overwrite_filter: BooleanExpression = ALWAYS_TRUE, case_sensitive: bool = True) -> OverwriteFiles:
         return OverwriteFiles(
             operation=Operation.OVERWRITE
             if self._transaction.table_metadata.current_snapshot() is not None
@@ -2821,6 +4104,216 @@ class UpdateSnapshot:
             transaction=self._transaction,
             io=self._io,
             snapshot_properties=self._snapshot_properties,
+            delete_filter=overwrite_filter,
+            case_sensitive=case_sensitive,
+        )
+
+    def rewrite(self) -> RewriteFiles:
+        return RewriteFiles(
+            operation=Operation.REPLACE, transaction=self._transaction, io=self._io, snapshot_properties=self._snapshot_properties
+        )
+
+    def rewrite_manifests(self) -> RewriteManifests:
+        return RewriteManifests(
+            operation=Operation.REPLACE, transaction=self._transaction, io=self._io, snapshot_properties=self._snapshot_properties
+        )
+
+    def row_delta(self) -> RowDelta:
+        return RowDelta(
+            operation=Operation.DELETE, transaction=self._transaction, io=self._io, snapshot_properties=self._snapshot_properties
+        )
+
+    def delete(self, delete_filter: BooleanExpression, case_sensitive: bool = True) -> DeleteFiles:
+        return DeleteFiles(
+            operation=Operation.DELETE,
+            transaction=self._transaction,
+            io=self._io,
+            snapshot_properties=self._snapshot_properties,
+            delete_filter=delete_filter,
+            case_sensitive=case_sensitive,
+        )
+
+
+def _ancestors_of(snapshot: Optional[Snapshot], table_metadata: TableMetadata) -> Iterator[Snapshot]:
+    """Return the snapshot and its ancestors, newest first, until an ancestor is no longer in the table."""
+    while snapshot is not None:
+        yield snapshot
+        snapshot = table_metadata.snapshot_by_id(snapshot.parent_snapshot_id) if snapshot.parent_snapshot_id is not None else None
+
+
+class ExpireSnapshots(UpdateTableMetadata["ExpireSnapshots"]):
+    """Remove the snapshots that are no longer retained by the branches and tags of the table.
+
+    Mirrors the retention rules of the Java implementation:
+
+    - Branches and tags are removed when their snapshot is older than their max ref age, except for main.
+    - A branch keeps its last `min-snapshots-to-keep` snapshots, and the snapshots that are newer than its max snapshot age.
+    - A tag keeps its snapshot.
+    - Snapshots that are not part of a branch or tag are kept when they are newer than the max snapshot age.
+
+    The files are not deleted on commit, since the transaction might still fail, see `clean_expired_files`.
+    """
+
+    _expire_older_than_ms: Optional[int]
+    _min_snapshots_to_keep: Optional[int]
+    _snapshot_ids_to_expire: Set[int]
+    _base_metadata: Optional[TableMetadata]
+
+    def __init__(self, transaction: Transaction) -> None:
+        super().__init__(transaction)
+        self._expire_older_than_ms = None
+        self._min_snapshots_to_keep = None
+        self._snapshot_ids_to_expire = set()
+        self._base_metadata = None
+
+    def expire_older_than(self, timestamp_ms: int) -> ExpireSnapshots:
+        """Expire the snapshots that are older than the timestamp, for the branches without a max snapshot age."""
+        self._expire_older_than_ms = timestamp_ms
+        return self
+
+    def retain_last(self, num_snapshots: int) -> ExpireSnapshots:
+        """Keep at least this number of snapshots of each branch without a min snapshots to keep."""
+        if num_snapshots < 1:
+            raise ValueError(f"Number of snapshots to retain must be at least 1, cannot be: {num_snapshots}")
+        self._min_snapshots_to_keep = num_snapshots
+        return self
+
+    def expire_snapshot_id(self, snapshot_id: int) -> ExpireSnapshots:
+        """Expire the snapshot, regardless of its age."""
+        self._snapshot_ids_to_expire.add(snapshot_id)
+        return self
+
+    def _retained_snapshot_ids(self, table_metadata: TableMetadata, refs: Dict[str, SnapshotRef], now_ms: int) -> Set[int]:
+        properties = table_metadata.properties
+        max_snapshot_age_ms = PropertyUtil.property_as_int(
+            properties, TableProperties.MAX_SNAPSHOT_AGE_MS, TableProperties.MAX_SNAPSHOT_AGE_MS_DEFAULT
+        )
+        default_expire_older_than_ms = (
+            self._expire_older_than_ms if self._expire_older_than_ms is not None else now_ms - max_snapshot_age_ms  # type: ignore
+        )
+        default_min_snapshots_to_keep = (
+            self._min_snapshots_to_keep
+            if self._min_snapshots_to_keep is not None
+            else PropertyUtil.property_as_int(
+                properties, TableProperties.MIN_SNAPSHOTS_TO_KEEP, TableProperties.MIN_SNAPSHOTS_TO_KEEP_DEFAULT
+            )
+        )
+
+        retained_snapshot_ids = set()
+        for ref in refs.values():
+            if ref.snapshot_ref_type == SnapshotRefType.TAG:
+                retained_snapshot_ids.add(ref.snapshot_id)
+                continue
+
+            expire_older_than_ms = (
+                now_ms - ref.max_snapshot_age_ms if ref.max_snapshot_age_ms is not None else default_expire_older_than_ms
+            )
+            min_snapshots_to_keep = ref.min_snapshots_to_keep or default_min_snapshots_to_keep
+            branch_snapshot_ids: List[int] = []
+            for ancestor in _ancestors_of(table_metadata.snapshot_by_id(ref.snapshot_id), table_metadata):
+                if len(branch_snapshot_ids) < min_snapshots_to_keep or ancestor.timestamp_ms >= expire_older_than_ms:  # type: ignore
+                    branch_snapshot_ids.append(ancestor.snapshot_id)
+                else:
+                    break
+            retained_snapshot_ids.update(branch_snapshot_ids)
+
+        # The snapshots that are not part of any branch or tag, such as staged snapshots, are kept until they expire
+        referenced_snapshot_ids = {
+            ancestor.snapshot_id
+            for ref in refs.values()
+            for ancestor in _ancestors_of(table_metadata.snapshot_by_id(ref.snapshot_id), table_metadata)
+        }
+        retained_snapshot_ids.update(
+            snapshot.snapshot_id
+            for snapshot in table_metadata.snapshots
+            if snapshot.snapshot_id not in referenced_snapshot_ids and snapshot.timestamp_ms >= default_expire_older_than_ms
+        )
+        return retained_snapshot_ids
+
+    def _commit(self) -> UpdatesAndRequirements:
+        table_metadata = self._transaction.table_metadata
+        self._base_metadata = table_metadata
+        now_ms = datetime_to_millis(datetime.datetime.now().astimezone())
+
+        default_max_ref_age_ms = PropertyUtil.property_as_int(
+            table_metadata.properties, TableProperties.MAX_REF_AGE_MS, TableProperties.MAX_REF_AGE_MS_DEFAULT
+        )
+        retained_refs = {}
+        removed_refs = []
+        for name, ref in table_metadata.refs.items():
+            snapshot = table_metadata.snapshot_by_id(ref.snapshot_id)
+            max_ref_age_ms = ref.max_ref_age_ms if ref.max_ref_age_ms is not None else default_max_ref_age_ms
+            if name != MAIN_BRANCH and (
+                snapshot is None or (max_ref_age_ms is not None and now_ms - snapshot.timestamp_ms > max_ref_age_ms)
+            ):
+                removed_refs.append(name)
+            else:
+                retained_refs[name] = ref
+
+        for name, ref in retained_refs.items():
+            if ref.snapshot_id in self._snapshot_ids_to_expire:
+                raise ValueError(f"Cannot expire snapshot {ref.snapshot_id}, it is the current snapshot of {name}")
+
+        retained_snapshot_ids = self._retained_snapshot_ids(table_metadata, retained_refs, now_ms)
+        expired_snapshot_ids = [
+            snapshot.snapshot_id
+            for snapshot in table_metadata.snapshots
+            if snapshot.snapshot_id not in retained_snapshot_ids or snapshot.snapshot_id in self._snapshot_ids_to_expire
+        ]
+
+        updates: Tuple[TableUpdate, ...] = tuple(RemoveSnapshotRefUpdate(ref_name=name) for name in removed_refs)
+        if expired_snapshot_ids:
+            updates += (RemoveSnapshotsUpdate(snapshot_ids=expired_snapshot_ids),)
+        if not updates:
+            return (), ()
+
+        # The retained snapshots depend on the branches and tags, so they should not change concurrently
+        requirements: List[TableRequirement] = [AssertTableUUID(uuid=table_metadata.table_uuid)]
+        requirements.extend(
+            AssertRefSnapshotId(snapshot_id=ref.snapshot_id, ref=name) for name, ref in table_metadata.refs.items()
+        )
+        return updates, tuple(requirements)
+
+    def clean_expired_files(self, table_metadata: TableMetadata) -> None:
+        """Delete the files that only the expired snapshots refer to.
+
+        The manifest lists of the expired snapshots are deleted, together with their manifests and data
+        files that are not referenced by the snapshots that are left in the table. Failures to delete a
+        file are logged, and do not stop the cleanup.
+
+        Args:
+            table_metadata: The metadata of the table, after the snapshots were expired.
+        """
+        from pyiceberg.catalog import MANIFEST, MANIFEST_LIST, delete_data_files, delete_files
+
+        if self._base_metadata is None:
+            return
+
+        retained_snapshot_ids = {snapshot.snapshot_id for snapshot in table_metadata.snapshots}
+        expired_snapshots = [
+            snapshot for snapshot in self._base_metadata.snapshots if snapshot.snapshot_id not in retained_snapshot_ids
+        ]
+        if not expired_snapshots:
+            return
+
+        io = self._transaction._table.io  # pylint: disable=W0212
+        executor = ExecutorFactory.get_or_create(IO_POOL)
+        retained_manifests = {
+            manifest.manifest_path: manifest
+            for manifests in executor.map(lambda snapshot: snapshot.manifests(io), table_metadata.snapshots)
+            for manifest in manifests
+        }
+        manifests_to_delete = {
+            manifest.manifest_path: manifest
+            for manifests in executor.map(lambda snapshot: snapshot.manifests(io), expired_snapshots)
+            for manifest in manifests
+            if manifest.manifest_path not in retained_manifests
+        }
+
+        delete_data_files(io, list(manifests_to_delete.values()), retained_manifests=list(retained_manifests.values()))
+        delete_files(io, set(manifests_to_delete), MANIFEST)
+        delete_files(
+            io, {snapshot.manifest_list for snapshot in expired_snapshots if snapshot.manifest_list is not None}, MANIFEST_LIST
         )
 
 
@@ -22,7 +22,7 @@ from typing import Any, DefaultDict, Dict, List, Mapping, Optional
 from pydantic import Field, PrivateAttr, model_serializer
 
 from pyiceberg.io import FileIO
-from pyiceberg.manifest import DataFile, DataFileContent, ManifestFile, read_manifest_list
+from pyiceberg.manifest import DataFile, DataFileContent, ManifestFile, fetch_manifest_list
 from pyiceberg.partitioning import UNPARTITIONED_PARTITION_SPEC, PartitionSpec
 from pyiceberg.schema import Schema
 from pyiceberg.typedef import IcebergBaseModel
@@ -50,6 +50,9 @@ TOTAL_DELETE_FILES = 'total-delete-files'
 TOTAL_RECORDS = 'total-records'
 TOTAL_FILE_SIZE = 'total-files-size'
 CHANGED_PARTITION_COUNT_PROP = 'changed-partition-count'
+MANIFESTS_CREATED = 'manifests-created'
+MANIFESTS_REPLACED = 'manifests-replaced'
+ENTRIES_PROCESSED = 'entries-processed'
 CHANGED_PARTITION_PREFIX = "partitions."
 OPERATION = "operation"
 
@@ -244,8 +247,7 @@ class Snapshot(IcebergBaseModel):
 
     def manifests(self, io: FileIO) -> List[ManifestFile]:
         if self.manifest_list is not None:
-            file = io.new_input(self.manifest_list)
-            return list(read_manifest_list(file))
+            return fetch_manifest_list(io, self.manifest_list)
         return []
 
 
@@ -345,7 +347,7 @@ def _truncate_table_summary(summary: Summary, previous_summary: Mapping[str, str
 def update_snapshot_summaries(
     summary: Summary, previous_summary: Optional[Mapping[str, str]] = None, truncate_full_table: bool = False
 ) -> Summary:
-    if summary.operation not in {Operation.APPEND, Operation.OVERWRITE}:
+    if summary.operation not in {Operation.APPEND, Operation.REPLACE, Operation.OVERWRITE, Operation.DELETE}:
         raise ValueError(f"Operation not implemented: {summary.operation}")
 
     if truncate_full_table and summary.operation == Operation.OVERWRITE and previous_summary is not None:
@@ -20,7 +20,7 @@ import struct
 from abc import ABC, abstractmethod
 from enum import IntEnum
 from functools import singledispatch
-from typing import Any, Callable, Generic, Optional, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Generic, Optional, Tuple, TypeVar
 from typing import Literal as LiteralType
 from uuid import UUID
 
@@ -82,6 +82,10 @@ from pyiceberg.utils.decimal import decimal_to_bytes, truncate_decimal
 from pyiceberg.utils.parsing import ParseNumberFromBrackets
 from pyiceberg.utils.singleton import Singleton
 
+if TYPE_CHECKING:
+    import numpy.typing as npt
+    import pyarrow as pa
+
 S = TypeVar("S")
 T = TypeVar("T")
 
@@ -138,6 +142,18 @@ class Transform(IcebergRootModel[str], ABC, Generic[S, T]):
     @abstractmethod
     def transform(self, source: IcebergType) -> Callable[[Optional[S]], Optional[T]]: ...
 
+    def pyarrow_transform(self, source: IcebergType) -> "Callable[[pa.Array], pa.Array]":
+        """Return a function that applies the transform to a whole PyArrow array at once.
+
+        The function accepts a pa.Array or pa.ChunkedArray with the Arrow representation of the
+        source type, and returns an array of the same kind with, for each element, the same
+        value as the function returned by `transform` gives for it.
+
+        Args:
+            source (IcebergType): The type of the values to transform.
+        """
+        raise NotImplementedError(f"Cannot apply {self} to PyArrow arrays")
+
     @abstractmethod
     def can_transform(self, source: IcebergType) -> bool:
         return False
@@ -277,6 +293,8 @@ class BucketTransform(Transform[S, int]):
             def hash_func(v: Any) -> int:
                 if isinstance(v, UUID):
                     return mmh3.hash(v.bytes)
+                elif isinstance(v, str):
+                    return mmh3.hash(UUID(v).bytes)
                 return mmh3.hash(v)
 
         else:
@@ -286,6 +304,36 @@ class BucketTransform(Transform[S, int]):
             return lambda v: (hash_func(v) & IntegerType.max) % self._num_buckets if v is not None else None
         return hash_func
 
+    def pyarrow_transform(self, source: IcebergType) -> "Callable[[pa.Array], pa.Array]":
+        import pyarrow as pa
+
+        if isinstance(source, (IntegerType, LongType, DateType, TimeType, TimestampType, TimestamptzType)):
+
+            def hash_func(arr: pa.Array) -> "npt.NDArray[Any]":
+                values = _pyarrow_to_int64(arr).fill_null(0).to_numpy(zero_copy_only=False)
+                return _murmur3_32(values.astype("<i8").view("uint8"), _fixed_width_offsets(len(arr), 8))
+
+        elif isinstance(source, DecimalType):
+
+            def hash_func(arr: pa.Array) -> "npt.NDArray[Any]":
+                return _murmur3_32(*_pyarrow_decimal_to_bytes(arr))
+
+        elif isinstance(source, (StringType, FixedType, BinaryType, UUIDType)):
+
+            def hash_func(arr: pa.Array) -> "npt.NDArray[Any]":
+                return _murmur3_32(*_pyarrow_binary_buffers(arr))
+
+        else:
+            raise ValueError(f"Unknown type {source}")
+
+        num_buckets = self._num_buckets
+
+        def bucket_func(arr: pa.Array) -> pa.Array:
+            buckets = (hash_func(arr) & IntegerType.max) % num_buckets
+            return _numpy_to_pyarrow(buckets.astype("int32"), pa.int32(), arr)
+
+        return _pyarrow_chunked(bucket_func)
+
     def __repr__(self) -> str:
         """Return the string representation of the BucketTransform class."""
         return f"BucketTransform(num_buckets={self._num_buckets})"
@@ -377,6 +425,18 @@ class YearTransform(TimeTransform[S]):
 
         return lambda v: year_func(v) if v is not None else None
 
+    def pyarrow_transform(self, source: IcebergType) -> "Callable[[pa.Array], pa.Array]":
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        if not isinstance(source, (DateType, TimestampType, TimestamptzType)):
+            raise ValueError(f"Cannot apply year transform for type: {source}")
+
+        def year_func(arr: pa.Array) -> pa.Array:
+            return pc.subtract(pc.year(_pyarrow_to_datetime(arr)), _EPOCH_YEAR).cast(pa.int32())
+
+        return _pyarrow_chunked(year_func)
+
     def can_transform(self, source: IcebergType) -> bool:
         return isinstance(source, (DateType, TimestampType, TimestamptzType))
 
@@ -419,6 +479,20 @@ class MonthTransform(TimeTransform[S]):
 
         return lambda v: month_func(v) if v is not None else None
 
+    def pyarrow_transform(self, source: IcebergType) -> "Callable[[pa.Array], pa.Array]":
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        if not isinstance(source, (DateType, TimestampType, TimestamptzType)):
+            raise ValueError(f"Cannot apply month transform for type: {source}")
+
+        def month_func(arr: pa.Array) -> pa.Array:
+            values = _pyarrow_to_datetime(arr)
+            years = pc.subtract(pc.year(values), _EPOCH_YEAR)
+            return pc.add(pc.multiply(years, 12), pc.subtract(pc.month(values), 1)).cast(pa.int32())
+
+        return _pyarrow_chunked(month_func)
+
     def can_transform(self, source: IcebergType) -> bool:
         return isinstance(source, (DateType, TimestampType, TimestamptzType))
 
@@ -461,6 +535,26 @@ class DayTransform(TimeTransform[S]):
 
         return lambda v: day_func(v) if v is not None else None
 
+    def pyarrow_transform(self, source: IcebergType) -> "Callable[[pa.Array], pa.Array]":
+        import numpy as np
+        import pyarrow as pa
+
+        if isinstance(source, DateType):
+
+            def day_func(arr: pa.Array) -> pa.Array:
+                return arr.cast(pa.int32())
+
+        elif isinstance(source, (TimestampType, TimestamptzType)):
+
+            def day_func(arr: pa.Array) -> pa.Array:
+                micros = _pyarrow_to_int64(arr).fill_null(0).to_numpy(zero_copy_only=False)
+                return _numpy_to_pyarrow(np.floor_divide(micros, _MICROS_PER_DAY).astype("int32"), pa.int32(), arr)
+
+        else:
+            raise ValueError(f"Cannot apply day transform for type: {source}")
+
+        return _pyarrow_chunked(day_func)
+
     def can_transform(self, source: IcebergType) -> bool:
         return isinstance(source, (DateType, TimestampType, TimestamptzType))
 
@@ -501,6 +595,19 @@ class HourTransform(TimeTransform[S]):
 
         return lambda v: hour_func(v) if v is not None else None
 
+    def pyarrow_transform(self, source: IcebergType) -> "Callable[[pa.Array], pa.Array]":
+        import numpy as np
+        import pyarrow as pa
+
+        if not isinstance(source, (TimestampType, TimestamptzType)):
+            raise ValueError(f"Cannot apply hour transform for type: {source}")
+
+        def hour_func(arr: pa.Array) -> pa.Array:
+            micros = _pyarrow_to_int64(arr).fill_null(0).to_numpy(zero_copy_only=False)
+            return _numpy_to_pyarrow(np.floor_divide(micros, _MICROS_PER_HOUR).astype("int32"), pa.int32(), arr)
+
+        return _pyarrow_chunked(hour_func)
+
     def can_transform(self, source: IcebergType) -> bool:
         return isinstance(source, (TimestampType, TimestamptzType))
 
@@ -538,6 +645,9 @@ class IdentityTransform(Transform[S, S]):
     def transform(self, source: IcebergType) -> Callable[[Optional[S]], Optional[S]]:
         return lambda v: v
 
+    def pyarrow_transform(self, source: IcebergType) -> "Callable[[pa.Array], pa.Array]":
+        return lambda arr: arr
+
     def can_transform(self, source: IcebergType) -> bool:
         return source.is_primitive
 
@@ -701,6 +811,51 @@ class TruncateTransform(Transform[S, S]):
 
         return lambda v: truncate_func(v) if v is not None else None
 
+    def pyarrow_transform(self, source: IcebergType) -> "Callable[[pa.Array], pa.Array]":
+        import numpy as np
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        width = self._width
+        if isinstance(source, (IntegerType, LongType)):
+
+            def truncate_func(arr: pa.Array) -> pa.Array:
+                values = arr.fill_null(0).to_numpy(zero_copy_only=False)
+                return _numpy_to_pyarrow(values - np.mod(values, width), arr.type, arr)
+
+        elif isinstance(source, StringType):
+
+            def truncate_func(arr: pa.Array) -> pa.Array:
+                return pc.utf8_slice_codeunits(arr, start=0, stop=width)
+
+        elif isinstance(source, BinaryType):
+
+            def truncate_func(arr: pa.Array) -> pa.Array:
+                return pc.binary_slice(arr, start=0, stop=width)
+
+        elif isinstance(source, DecimalType) and source.precision <= _MAX_INT64_DECIMAL_PRECISION:
+
+            def truncate_func(arr: pa.Array) -> pa.Array:
+                # The unscaled values fit in the lower 64 bits of the 128 bits little-endian decimals
+                unscaled = np.frombuffer(arr.buffers()[1], dtype="<i8")[2 * arr.offset : 2 * (arr.offset + len(arr)) : 2]
+                truncated = np.empty((len(arr), 2), dtype="<i8")
+                truncated[:, 0] = unscaled - np.mod(unscaled, width)
+                truncated[:, 1] = truncated[:, 0] >> 63
+                result = pa.Array.from_buffers(arr.type, len(arr), [None, pa.py_buffer(truncated)])
+                return pc.if_else(arr.is_null(), pa.scalar(None, type=arr.type), result) if arr.null_count else result
+
+        elif isinstance(source, DecimalType):
+            # Wider decimals do not fit in NumPy integers, and are truncated one by one
+            scalar_func = self.transform(source)
+
+            def truncate_func(arr: pa.Array) -> pa.Array:
+                return pa.array([scalar_func(v) for v in arr.to_pylist()], type=arr.type)
+
+        else:
+            raise ValueError(f"Cannot truncate for type: {source}")
+
+        return _pyarrow_chunked(truncate_func)
+
     def satisfies_order_of(self, other: Transform[S, T]) -> bool:
         if self == other:
             return True
@@ -816,6 +971,11 @@ class VoidTransform(Transform[S, None], Singleton):
     def transform(self, source: IcebergType) -> Callable[[Optional[S]], Optional[T]]:
         return lambda v: None
 
+    def pyarrow_transform(self, source: IcebergType) -> "Callable[[pa.Array], pa.Array]":
+        import pyarrow as pa
+
+        return _pyarrow_chunked(lambda arr: pa.nulls(len(arr), type=arr.type))
+
     def can_transform(self, _: IcebergType) -> bool:
         return True
 
@@ -836,6 +996,149 @@ class VoidTransform(Transform[S, None], Singleton):
         return "VoidTransform()"
 
 
+_EPOCH_YEAR = 1970
+_MICROS_PER_HOUR = 3_600_000_000
+_MICROS_PER_DAY = 86_400_000_000
+_MAX_INT64_DECIMAL_PRECISION = 18
+
+_MURMUR3_C1 = 0xCC9E2D51
+_MURMUR3_C2 = 0x1B873593
+
+
+def _pyarrow_chunked(func: "Callable[[pa.Array], pa.Array]") -> "Callable[[pa.Array], pa.Array]":
+    """Lift a function on a pa.Array so that it also accepts a pa.ChunkedArray, chunk by chunk."""
+    import pyarrow as pa
+
+    def apply(arr: pa.Array) -> pa.Array:
+        if isinstance(arr, pa.ChunkedArray):
+            if arr.num_chunks == 0:
+                return pa.chunked_array([func(arr.combine_chunks())])
+            return pa.chunked_array([func(chunk) for chunk in arr.chunks])
+        return func(arr)
+
+    return apply
+
+
+def _numpy_to_pyarrow(values: "npt.NDArray[Any]", arrow_type: "pa.DataType", like: "pa.Array") -> "pa.Array":
+    """Convert the NumPy values to an Arrow array that is null where the like array is null."""
+    import pyarrow as pa
+
+    mask = like.is_null().to_numpy(zero_copy_only=False) if like.null_count else None
+    return pa.array(values, type=arrow_type, mask=mask)
+
+
+def _pyarrow_to_int64(arr: "pa.Array") -> "pa.Array":
+    """Return the internal representation of integers, dates (days), times and timestamps (micros) as int64."""
+    import pyarrow as pa
+
+    if pa.types.is_timestamp(arr.type) and arr.type.unit != "us":
+        arr = arr.cast(pa.timestamp("us", tz=arr.type.tz))
+    elif pa.types.is_time(arr.type) and arr.type.unit != "us":
+        arr = arr.cast(pa.time64("us"))
+    if pa.types.is_time32(arr.type) or pa.types.is_date(arr.type):
+        arr = arr.cast(pa.int32())
+    return arr.cast(pa.int64())
+
+
+def _pyarrow_to_datetime(arr: "pa.Array") -> "pa.Array":
+    """Return dates as is, and timestamps as UTC timestamps without a zone, for the calendar functions."""
+    import pyarrow as pa
+
+    if pa.types.is_date(arr.type):
+        return arr
+    return _pyarrow_to_int64(arr).cast(pa.timestamp("us"))
+
+
+def _fixed_width_offsets(length: int, width: int) -> "npt.NDArray[Any]":
+    import numpy as np
+
+    return np.arange(length + 1, dtype=np.int64) * width
+
+
+def _pyarrow_binary_buffers(arr: "pa.Array") -> "Tuple[npt.NDArray[Any], npt.NDArray[Any]]":
+    """Return the bytes and the offsets of the values of a (fixed size) binary or string array."""
+    import numpy as np
+    import pyarrow as pa
+
+    buffers = arr.buffers()
+    if pa.types.is_fixed_size_binary(arr.type):
+        width = arr.type.byte_width
+        data = np.frombuffer(buffers[1], dtype=np.uint8)[arr.offset * width : (arr.offset + len(arr)) * width]
+        return data, _fixed_width_offsets(len(arr), width)
+
+    offset_type = np.int64 if pa.types.is_large_binary(arr.type) or pa.types.is_large_string(arr.type) else np.int32
+    offsets = np.frombuffer(buffers[1], dtype=offset_type)[arr.offset : arr.offset + len(arr) + 1].astype(np.int64)
+    data = np.frombuffer(buffers[2], dtype=np.uint8) if buffers[2] is not None else np.zeros(0, dtype=np.uint8)
+    return data, offsets
+
+
+def _pyarrow_decimal_to_bytes(arr: "pa.Array") -> "Tuple[npt.NDArray[Any], npt.NDArray[Any]]":
+    """Return the minimal big-endian two's-complement bytes of the unscaled values, like decimal_to_bytes."""
+    import numpy as np
+
+    width = arr.type.byte_width
+    little_endian = np.frombuffer(arr.buffers()[1], dtype=np.uint8)[arr.offset * width : (arr.offset + len(arr)) * width]
+    big_endian = little_endian.reshape(-1, width)[:, ::-1]
+    # A leading byte can be left out when it only repeats the sign bit of the next byte
+    redundant = ((big_endian[:, :-1] == 0x00) & (big_endian[:, 1:] < 0x80)) | (
+        (big_endian[:, :-1] == 0xFF) & (big_endian[:, 1:] >= 0x80)
+    )
+    num_redundant = np.cumprod(redundant, axis=1).sum(axis=1)
+    data = big_endian[np.arange(width) >= num_redundant[:, None]]
+    offsets = np.concatenate([[0], np.cumsum(width - num_redundant)]).astype(np.int64)
+    return data, offsets
+
+
+def _murmur3_32(data: "npt.NDArray[Any]", offsets: "npt.NDArray[Any]") -> "npt.NDArray[Any]":
+    """Vectorized 32 bits murmur3 (x86, seed 0) of each of the values data[offsets[i]:offsets[i + 1]].
+
+    Returns the signed hashes, the same as mmh3.hash would for each of the values.
+    """
+    import numpy as np
+
+    def rotl(x: "npt.NDArray[Any]", r: int) -> "npt.NDArray[Any]":
+        return (x << np.uint32(r)) | (x >> np.uint32(32 - r))
+
+    def mix_k1(k1: "npt.NDArray[Any]") -> "npt.NDArray[Any]":
+        return rotl(k1 * np.uint32(_MURMUR3_C1), 15) * np.uint32(_MURMUR3_C2)
+
+    starts = offsets[:-1].astype(np.int64)
+    lengths = (offsets[1:] - offsets[:-1]).astype(np.int64)
+    num_blocks = lengths // 4
+
+    # Order the values by their number of 4 byte blocks, longest first, so that the values that still
+    # have a block to mix at each step are a prefix of the arrays; padding the data makes the tail reads safe
+    order = np.argsort(-num_blocks, kind="stable")
+    starts, lengths, num_blocks = starts[order], lengths[order], num_blocks[order]
+    data = np.concatenate([data, np.zeros(4, dtype=np.uint8)]).astype(np.uint32)
+
+    h1 = np.zeros(len(lengths), dtype=np.uint32)
+    for block in range(int(num_blocks[0]) if len(num_blocks) > 0 else 0):
+        active = int(np.searchsorted(-num_blocks, -block, side="left"))
+        pos = starts[:active] + 4 * block
+        k1 = data[pos] | (data[pos + 1] << np.uint32(8)) | (data[pos + 2] << np.uint32(16)) | (data[pos + 3] << np.uint32(24))
+        h1[:active] = rotl(h1[:active] ^ mix_k1(k1), 13) * np.uint32(5) + np.uint32(0xE6546B64)
+
+    tail = starts + 4 * num_blocks
+    tail_length = lengths % 4
+    k1 = np.zeros(len(lengths), dtype=np.uint32)
+    k1 ^= np.where(tail_length >= 3, data[tail + 2] << np.uint32(16), np.uint32(0))
+    k1 ^= np.where(tail_length >= 2, data[tail + 1] << np.uint32(8), np.uint32(0))
+    k1 ^= np.where(tail_length >= 1, data[tail], np.uint32(0))
+    h1 ^= mix_k1(k1)
+
+    h1 ^= lengths.astype(np.uint32)
+    h1 ^= h1 >> np.uint32(16)
+    h1 *= np.uint32(0x85EBCA6B)
+    h1 ^= h1 >> np.uint32(13)
+    h1 *= np.uint32(0xC2B2AE35)
+    h1 ^= h1 >> np.uint32(16)
+
+    hashes = np.empty_like(h1)
+    hashes[order] = h1
+    return hashes.view(np.int32)
+
+
 def _truncate_number(
     name: str, pred: BoundLiteralPredicate[L], transform: Callable[[Optional[L]], Optional[L]]
 ) -> Optional[UnboundPredicate[Any]]:
@@ -0,0 +1,223 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""A thread-safe least recently used cache that is bounded by the (estimated) memory of its values."""
+
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import Enum
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Generic,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
+
+from pyiceberg.utils.config import Config
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    weight: int
+
+
+def estimate_size(obj: Any) -> int:
+    """Estimate the memory that an object takes, including the objects it references.
+
+    The attributes of objects are followed both through their `__dict__` and their
+    `__slots__`, such as the fields of a Record. Objects that are referenced more than
+    once are counted each time, and enums are not counted at all, since they are shared.
+    This makes it an upper bound for the values that are kept in a cache.
+    """
+    size = 0
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if current is None or isinstance(current, (bool, Enum)):
+            continue
+        size += sys.getsizeof(current)
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        elif not isinstance(current, (str, bytes, int, float)):
+            if (attributes := getattr(current, "__dict__", None)) is not None:
+                stack.append(attributes)
+            stack.extend(getattr(current, name, None) for name in _slots(cast(Hashable, type(current))))
+    return size
+
+
+@lru_cache(maxsize=None)
+def _slots(cls: Type[Any]) -> Tuple[str, ...]:
+    """Return the names of the slots of a class and its base classes."""
+    names: List[str] = []
+    for klass in cls.__mro__:
+        slots = klass.__dict__.get("__slots__", ())
+        names.extend([slots] if isinstance(slots, str) else slots)
+    return tuple(name for name in names if name not in ("__dict__", "__weakref__"))
+
+
+class LRUCache(Generic[K, V]):
+    """A thread-safe least recently used cache, bounded by the total weight of its values.
+
+    The values are loaded outside the lock, so slow loads of different keys happen
+    concurrently. When two threads load the same key at the same time, the value
+    of the first one is kept.
+
+    Args:
+        max_weight (int): The maximum total weight of the values in the cache, a value
+            of 0 disables the cache.
+        weigher (Callable[[V], int]): The function that gives the weight of a value.
+    """
+
+    _max_weight: int
+    _weigher: Callable[[V], int]
+    _entries: "OrderedDict[K, Tuple[V, int]]"
+    _weight: int
+    _hits: int
+    _misses: int
+    _evictions: int
+
+    def __init__(self, max_weight: int, weigher: Callable[[V], int] = estimate_size) -> None:
+        self._max_weight = max_weight
+        self._weigher = weigher
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._weight = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def max_weight(self) -> int:
+        return self._max_weight
+
+    def get(self, key: K) -> Optional[V]:
+        """Return the cached value of the key, or None when it is not in the cache."""
+        with self._lock:
+            if (entry := self._entries.get(key)) is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[0]
+            self._misses += 1
+            return None
+
+    def put(self, key: K, value: V) -> V:
+        """Add the value to the cache, unless it is already there, and return the cached value.
+
+        Values that are heavier than the maximum weight are not cached.
+        """
+        if self._max_weight <= 0:
+            return value
+        weight = self._weigher(value)
+        if weight > self._max_weight:
+            return value
+
+        with self._lock:
+            if (entry := self._entries.get(key)) is not None:
+                self._entries.move_to_end(key)
+                return entry[0]
+
+            self._entries[key] = (value, weight)
+            self._weight += weight
+            while self._weight > self._max_weight:
+                _, (_, evicted_weight) = self._entries.popitem(last=False)
+                self._weight -= evicted_weight
+                self._evictions += 1
+
+        return value
+
+    def get_or_load(self, key: K, loader: Callable[[], V]) -> V:
+        """Return the cached value of the key, or load and cache it when it is not in the cache."""
+        if (value := self.get(key)) is not None:
+            return value
+        return self.put(key, loader())
+
+    def invalidate(self, key: K) -> None:
+        """Remove the key from the cache."""
+        with self._lock:
+            if (entry := self._entries.pop(key, None)) is not None:
+                self._weight -= entry[1]
+
+    def clear(self) -> None:
+        """Remove all values from the cache, and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._weight = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the counters of the cache."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                weight=self._weight,
+            )
+
+
+class SharedCache(Generic[K, V]):
+    """The base of the process-wide caches, that are created on first use with a configured maximum weight.
+
+    Subclasses set the configuration key of the maximum weight in bytes, its default, and
+    the weigher of the values. A maximum weight of 0 disables the cache.
+    """
+
+    config_key: ClassVar[str]
+    default_max_weight: ClassVar[int]
+    weigher: ClassVar[Callable[[Any], int]] = estimate_size
+
+    _instances: ClassVar[Dict[type, LRUCache[Any, Any]]] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_or_create(cls) -> LRUCache[K, V]:
+        """Return the same cache in each call."""
+        if (instance := SharedCache._instances.get(cls)) is not None:
+            return instance
+
+        with SharedCache._lock:
+            if (instance := SharedCache._instances.get(cls)) is None:
+                max_weight = Config().get_int(cls.config_key)
+                instance = LRUCache(
+                    max_weight=max_weight if max_weight is not None else cls.default_max_weight, weigher=cls.weigher
+                )
+                SharedCache._instances[cls] = instance
+
+        return instance
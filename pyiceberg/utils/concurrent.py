@@ -16,25 +16,184 @@
 # under the License.
 """Concurrency concepts that support efficient multi-threading."""
 
-from concurrent.futures import Executor, ThreadPoolExecutor
-from typing import Optional
+import os
+import threading
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Generator, Iterable, Optional, Set, TypeVar
 
 from pyiceberg.utils.config import Config
 
+T = TypeVar("T")
+R = TypeVar("R")
+
+# The pool for reading and writing files, such as manifests, data files and delete files
+IO_POOL = "io"
+# The pool for CPU-bound work, such as decoding manifests and computing Parquet statistics
+CPU_POOL = "cpu"
+# The pool for writing the manifests of a commit
+COMMIT_POOL = "commit"
+POOLS = (IO_POOL, CPU_POOL, COMMIT_POOL)
+
+THREAD_BACKEND = "thread"
+PROCESS_BACKEND = "process"
+
+
+@dataclass(frozen=True)
+class ExecutorStats:
+    max_workers: int
+    queued: int
+    active: int
+    completed: int
+
+
+class _InstrumentedExecutor(Executor):
+    """Keep track of the calls that are submitted to the executor, to expose its queue depth and active workers."""
+
+    def __init__(self, max_workers: int) -> None:
+        super().__init__(max_workers=max_workers)  # type: ignore
+        self._instrumented_max_workers = max_workers
+        self._stats_lock = threading.Lock()
+        self._pending: Set[Future[Any]] = set()
+        self._completed = 0
+
+    def submit(self, fn: Callable[..., R], /, *args: Any, **kwargs: Any) -> Future[R]:
+        future = super().submit(fn, *args, **kwargs)
+        with self._stats_lock:
+            self._pending.add(future)
+        future.add_done_callback(self._done)
+        return future
+
+    def _done(self, future: Future[Any]) -> None:
+        with self._stats_lock:
+            self._pending.discard(future)
+            self._completed += 1
+
+    def stats(self) -> ExecutorStats:
+        """Return a snapshot of the counters of the executor.
+
+        A call is active from the moment that a worker picks it up. For a process pool this is
+        when the call is sent to the worker processes, which can be slightly before it starts.
+        """
+        with self._stats_lock:
+            active = sum(1 for future in self._pending if future.running())
+            return ExecutorStats(
+                max_workers=self._instrumented_max_workers,
+                queued=len(self._pending) - active,
+                active=active,
+                completed=self._completed,
+            )
+
+
+class InstrumentedThreadPoolExecutor(_InstrumentedExecutor, ThreadPoolExecutor):
+    pass
+
+
+class InstrumentedProcessPoolExecutor(_InstrumentedExecutor, ProcessPoolExecutor):
+    pass
+
 
 class ExecutorFactory:
-    _instance: Optional[Executor] = None
+    """Create an executor per named pool, so that slow work in one pool does not starve the other ones.
+
+    Each pool is configured with `<pool>-max-workers`, which falls back to `max-workers`, and
+    `<pool>-executor`, which is either `thread` (the default) or `process`. The calls that are
+    submitted to a process pool, and their arguments and results, have to be picklable.
+    """
+
+    _instances: Dict[str, _InstrumentedExecutor] = {}
+    _lock = threading.Lock()
 
     @staticmethod
-    def get_or_create() -> Executor:
-        """Return the same executor in each call."""
-        if ExecutorFactory._instance is None:
-            max_workers = ExecutorFactory.max_workers()
-            ExecutorFactory._instance = ThreadPoolExecutor(max_workers=max_workers)
+    def get_or_create(pool: str = IO_POOL) -> Executor:
+        """Return the same executor in each call for the pool."""
+        if (executor := ExecutorFactory._instances.get(pool)) is not None:
+            return executor
 
-        return ExecutorFactory._instance
+        with ExecutorFactory._lock:
+            if (executor := ExecutorFactory._instances.get(pool)) is None:
+                executor = ExecutorFactory._create(pool)
+                ExecutorFactory._instances[pool] = executor
+
+        return executor
+
+    @staticmethod
+    def _create(pool: str) -> _InstrumentedExecutor:
+        if pool not in POOLS:
+            raise ValueError(f"Unknown executor pool: {pool}, expected one of: {', '.join(POOLS)}")
+
+        backend = ExecutorFactory.backend(pool)
+        max_workers = ExecutorFactory.max_workers(pool)
+        if max_workers is None:
+            cpu_count = os.cpu_count() or 1
+            # The defaults of ThreadPoolExecutor and ProcessPoolExecutor
+            max_workers = cpu_count if pool == CPU_POOL or backend == PROCESS_BACKEND else min(32, cpu_count + 4)
+
+        if backend == PROCESS_BACKEND:
+            return InstrumentedProcessPoolExecutor(max_workers=max_workers)
+        return InstrumentedThreadPoolExecutor(max_workers=max_workers)
+
+    @staticmethod
+    def max_workers(pool: Optional[str] = None) -> Optional[int]:
+        """Return the max number of workers configured, for the pool when given."""
+        config = Config()
+        if pool is not None and (max_workers := config.get_int(f"{pool}-max-workers")) is not None:
+            return max_workers
+        return config.get_int("max-workers")
+
+    @staticmethod
+    def backend(pool: str) -> str:
+        """Return the backend configured for the pool."""
+        backend = Config().config.get(f"{pool}-executor", THREAD_BACKEND)
+        if backend not in (THREAD_BACKEND, PROCESS_BACKEND):
+            raise ValueError(f"{pool}-executor should be {THREAD_BACKEND} or {PROCESS_BACKEND}. Current value: {backend}")
+        return str(backend)
 
     @staticmethod
-    def max_workers() -> Optional[int]:
-        """Return the max number of workers configured."""
-        return Config().get_int("max-workers")
+    def stats() -> Dict[str, ExecutorStats]:
+        """Return a snapshot of the counters of the pools that are created."""
+        return {pool: executor.stats() for pool, executor in list(ExecutorFactory._instances.items())}
+
+
+def bounded_map(
+    executor: Executor, fn: Callable[[T], R], iterable: Iterable[T], max_in_flight: Optional[int] = None
+) -> Generator[R, None, None]:
+    """Lazily map the function over the iterable, keeping at most max_in_flight calls ahead of the consumer.
+
+    In contrast to `Executor.map`, the iterable is consumed on demand, from the
+    thread that consumes the results. The results are returned in the order of
+    the iterable, and the pending calls are cancelled when the iterator is closed.
+
+    Args:
+        executor (Executor): The executor to run the calls on.
+        fn (Callable[[T], R]): The function to apply.
+        iterable (Iterable[T]): The arguments of the function.
+        max_in_flight (Optional[int]): The maximum number of submitted calls that
+            are not yet consumed, defaults to the number of workers.
+
+    Returns:
+        An iterator over the results.
+    """
+    if max_in_flight is None:
+        max_in_flight = ExecutorFactory.max_workers() or os.cpu_count() or 1
+    max_in_flight = max(max_in_flight, 1)
+
+    items = iter(iterable)
+    futures: Deque[Future[R]] = deque()
+    try:
+        while True:
+            while len(futures) < max_in_flight:
+                try:
+                    item = next(items)
+                except StopIteration:
+                    break
+                futures.append(executor.submit(fn, item))
+
+            if not futures:
+                return
+
+            yield futures.popleft().result()
+    finally:
+        for future in futures:
+            future.cancel()
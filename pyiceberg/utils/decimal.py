@@ -58,10 +58,11 @@ def bytes_required(value: Union[int, Decimal]) -> int:
     Returns:
         int: the minimum number of bytes needed to serialize the value.
     """
+    if isinstance(value, Decimal):
+        value = decimal_to_unscaled(value)
     if isinstance(value, int):
-        return (value.bit_length() + 7) // 8
-    elif isinstance(value, Decimal):
-        return (decimal_to_unscaled(value).bit_length() + 7) // 8
+        # Two's complement needs room for the sign bit, like Java's BigInteger.toByteArray
+        return ((value if value >= 0 else ~value).bit_length() // 8) + 1
 
     raise ValueError(f"Unsupported value: {value}")
 
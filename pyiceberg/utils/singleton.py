@@ -28,7 +28,7 @@ return it.
 More information on metaclasses: https://docs.python.org/3/reference/datamodel.html#metaclasses
 """
 
-from typing import Any, ClassVar, Dict
+from typing import Any, ClassVar, Dict, Tuple
 
 
 def _convert_to_hashable_type(element: Any) -> Any:
@@ -41,9 +41,16 @@ def _convert_to_hashable_type(element: Any) -> Any:
 
 class Singleton:
     _instances: ClassVar[Dict] = {}  # type: ignore
+    _instance_args: ClassVar[Dict[int, Tuple[Tuple[Any, ...], Dict[str, Any]]]] = {}
 
     def __new__(cls, *args, **kwargs):  # type: ignore
         key = (cls, tuple(args), _convert_to_hashable_type(kwargs))
         if key not in cls._instances:
-            cls._instances[key] = super().__new__(cls)
+            instance = super().__new__(cls)
+            cls._instances[key] = instance
+            Singleton._instance_args[id(instance)] = (args, kwargs)
         return cls._instances[key]
+
+    def __getnewargs_ex__(self) -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
+        """Return the arguments of the instance, so unpickling returns the cached instance instead of changing another one."""
+        return Singleton._instance_args.get(id(self), ((), {}))
@@ -19,8 +19,14 @@ from __future__ import annotations
 import io
 import struct
 import uuid
+from typing import Callable
 
-from pyiceberg.avro.encoder import BinaryEncoder
+import pytest
+
+from pyiceberg.avro.encoder import BinaryEncoder, InMemoryBinaryEncoder, new_encoder
+from pyiceberg.avro.encoder_fast import CythonBinaryEncoder
+
+AVAILABLE_IN_MEMORY_ENCODERS = [InMemoryBinaryEncoder, CythonBinaryEncoder]
 
 
 def test_write() -> None:
@@ -132,3 +138,48 @@ def test_write_uuid() -> None:
     buf = output.getbuffer()
     assert len(buf) == 16
     assert buf.tobytes() == b"\x124Vx\x124Vx\x124Vx\x124Vx"
+
+
+def _write_all(encoder: BinaryEncoder) -> None:
+    for integer in (0, 1, -1, 63, 64, -64, -65, 7466, -(2**31), 2**31, -(2**63), 2**63 - 1):
+        encoder.write_int(integer)
+    encoder.write_boolean(True)
+    encoder.write_boolean(False)
+    encoder.write_float(1.5)
+    encoder.write_double(-2.25)
+    encoder.write_bytes(b"")
+    encoder.write_bytes(bytearray(b"\x12\x34\x56") * 4096)
+    encoder.write_utf8("That, my liege, is how we know the Earth to be banana-shaped.")
+    encoder.write_uuid(uuid.UUID("12345678-1234-5678-1234-567812345678"))
+    encoder.write(b"\x12\x34\x56")
+
+
+@pytest.mark.parametrize("encoder_class", AVAILABLE_IN_MEMORY_ENCODERS)
+def test_in_memory_encoder(encoder_class: Callable[[], InMemoryBinaryEncoder]) -> None:
+    output = io.BytesIO()
+    _write_all(BinaryEncoder(output))
+
+    encoder = encoder_class()
+    assert encoder.tell() == 0
+    _write_all(encoder)
+
+    assert encoder.getvalue() == output.getvalue()
+    assert encoder.tell() == len(output.getvalue())
+
+
+@pytest.mark.parametrize("encoder_class", AVAILABLE_IN_MEMORY_ENCODERS)
+def test_write_int_int_dict(encoder_class: Callable[[], InMemoryBinaryEncoder]) -> None:
+    encoder = encoder_class()
+    encoder.write_int_int_dict({1: 2, -3: 2**40, 7466: 0})
+    assert encoder.getvalue() == b"\x02\x04\x05\x80\x80\x80\x80\x80\x40\xd4\x74\x00"
+
+
+@pytest.mark.parametrize("encoder_class", AVAILABLE_IN_MEMORY_ENCODERS)
+def test_write_int_bytes_dict(encoder_class: Callable[[], InMemoryBinaryEncoder]) -> None:
+    encoder = encoder_class()
+    encoder.write_int_bytes_dict({1: b"", 2: b"\x12\x34\x56"})
+    assert encoder.getvalue() == b"\x02\x00\x04\x06\x12\x34\x56"
+
+
+def test_new_encoder() -> None:
+    assert isinstance(new_encoder(), CythonBinaryEncoder)
@@ -15,11 +15,12 @@
 #  specific language governing permissions and limitations
 #  under the License.
 import inspect
+import io
 from copy import copy
 from datetime import date, datetime, time
 from enum import Enum
 from tempfile import TemporaryDirectory
-from typing import Any
+from typing import Any, Optional
 from uuid import UUID
 
 import pytest
@@ -29,6 +30,7 @@ from fastavro import reader, writer
 import pyiceberg.avro.file as avro
 from pyiceberg.avro.codecs.deflate import DeflateCodec
 from pyiceberg.avro.file import META_SCHEMA, AvroFileHeader
+from pyiceberg.io import InputFile, InputStream
 from pyiceberg.io.pyarrow import PyArrowFileIO
 from pyiceberg.manifest import (
     DEFAULT_BLOCK_SIZE,
@@ -394,3 +396,99 @@ def test_all_primitive_types(is_required: bool) -> None:
     for idx, field in enumerate(all_primitives_schema.as_struct()):
         assert record[idx] == avro_entry[idx], f"Invalid {field}"
         assert record[idx] == avro_entry_read_with_fastavro[idx], f"Invalid {field} read with fastavro"
+
+
+@pytest.mark.parametrize("compression_codec", ["null", "deflate", "snappy", "zstandard", "bzip2"])
+def test_write_compressed_blocks(compression_codec: str) -> None:
+    schema = Schema(
+        NestedField(field_id=1, name="field_int", field_type=IntegerType(), required=True),
+        NestedField(field_id=2, name="field_string", field_type=StringType(), required=True),
+    )
+
+    class SimpleRecord(Record):
+        field_int: int
+        field_string: str
+
+        def __init__(self, *data: Any, **named_data: Any) -> None:
+            super().__init__(*data, **{"struct": schema.as_struct(), **named_data})
+
+    records = [SimpleRecord(i, f"this is a sentence {i % 10}") for i in range(1000)]
+
+    with TemporaryDirectory() as tmpdir:
+        tmp_avro_file = tmpdir + "/compressed.avro"
+        with avro.AvroOutputFile[SimpleRecord](
+            PyArrowFileIO().new_output(tmp_avro_file), schema, "simple_schema", compression_codec=compression_codec
+        ) as out:
+            out.write_block(records[:500])
+            out.write_block(records[500:])
+
+        with avro.AvroFile[SimpleRecord](PyArrowFileIO().new_input(tmp_avro_file), schema, {-1: SimpleRecord}) as avro_reader:
+            assert avro_reader.header.meta["avro.codec"] == compression_codec
+            assert list(avro_reader) == records
+
+        if compression_codec == "zstandard":
+            # fastavro relies on a different zstandard library
+            return
+
+        # read with fastavro
+        with open(tmp_avro_file, "rb") as fo:
+            r = reader(fo=fo)
+            assert r.codec == compression_codec
+            assert [list(record.values()) for record in r] == [[record.field_int, record.field_string] for record in records]
+
+
+def test_write_unknown_codec() -> None:
+    schema = Schema(NestedField(field_id=1, name="field_int", field_type=IntegerType(), required=True))
+    with pytest.raises(ValueError, match="Unsupported codec: lz4"):
+        avro.AvroOutputFile[Record](PyArrowFileIO().new_output("/tmp/unused.avro"), schema, "schema", compression_codec="lz4")
+
+
+class _CountingInputFile(InputFile):
+    """An in-memory input file that keeps track of the bytes that are read from it."""
+
+    def __init__(self, content: bytes) -> None:
+        super().__init__("memory://counting.avro")
+        self.content = content
+        self.stream = _CountingStream(content)
+
+    def __len__(self) -> int:
+        """Return the length of the content."""
+        return len(self.content)
+
+    def exists(self) -> bool:
+        return True
+
+    def open(self, seekable: bool = True) -> InputStream:
+        return self.stream
+
+
+class _CountingStream(io.BytesIO):
+    bytes_read = 0
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        data = super().read(size)
+        self.bytes_read += len(data)
+        return data
+
+
+def test_read_blocks_while_iterating() -> None:
+    schema = Schema(NestedField(field_id=1, name="field_string", field_type=StringType(), required=True))
+    records = [Record(field_string=f"{i}" * 1000) for i in range(10)]
+
+    with TemporaryDirectory() as tmpdir:
+        tmp_avro_file = tmpdir + "/blocks.avro"
+        with avro.AvroOutputFile[Record](PyArrowFileIO().new_output(tmp_avro_file), schema, "blocks_schema") as out:
+            for record in records:
+                out.write_block([record])
+
+        with PyArrowFileIO().new_input(tmp_avro_file).open() as f:
+            input_file = _CountingInputFile(f.read())
+
+    with avro.AvroFile[Record](input_file, schema) as avro_reader:
+        assert next(avro_reader) == records[0]
+        # Only the header and the first block are read
+        assert input_file.stream.bytes_read < 2 * 1000 + avro.SYNC_SIZE + len(avro_reader.header.meta["avro.schema"]) + 100
+        assert list(avro_reader) == records[1:]
+        assert input_file.stream.bytes_read == len(input_file)
+
+    assert input_file.stream.closed
@@ -15,12 +15,15 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import io
 from tempfile import TemporaryDirectory
 from typing import Optional
 
 import pytest
 from pydantic import Field
 
+from pyiceberg.avro.decoder import new_decoder
+from pyiceberg.avro.encoder import BinaryEncoder
 from pyiceberg.avro.file import AvroFile
 from pyiceberg.avro.reader import (
     DecimalReader,
@@ -28,11 +31,12 @@ from pyiceberg.avro.reader import (
     DoubleReader,
     FloatReader,
     IntegerReader,
+    ListReader,
     MapReader,
     StringReader,
     StructReader,
 )
-from pyiceberg.avro.resolver import resolve_reader, resolve_writer
+from pyiceberg.avro.resolver import construct_writer, resolve_reader, resolve_writer
 from pyiceberg.avro.writer import (
     BinaryWriter,
     DefaultWriter,
@@ -46,7 +50,7 @@ from pyiceberg.avro.writer import (
 )
 from pyiceberg.exceptions import ResolveError
 from pyiceberg.io.pyarrow import PyArrowFileIO
-from pyiceberg.manifest import MANIFEST_ENTRY_SCHEMAS
+from pyiceberg.manifest import MANIFEST_ENTRY_SCHEMAS, FileFormat
 from pyiceberg.schema import Schema
 from pyiceberg.typedef import Record
 from pyiceberg.types import (
@@ -119,6 +123,44 @@ def test_resolver() -> None:
     )
 
 
+def test_resolver_skips_nested_fields() -> None:
+    write_schema = Schema(
+        NestedField(1, "id", LongType()),
+        NestedField(2, "location", StructType(NestedField(3, "lat", DoubleType()), NestedField(4, "long", DoubleType()))),
+        NestedField(5, "preferences", MapType(6, StringType(), 7, StringType())),
+        NestedField(8, "tags", ListType(9, StringType())),
+        schema_id=1,
+    )
+    read_schema = Schema(NestedField(1, "id", LongType()), schema_id=1)
+
+    assert resolve_reader(write_schema, read_schema) == StructReader(
+        (
+            (0, IntegerReader()),
+            (None, StructReader(((0, DoubleReader()), (1, DoubleReader())), Record, write_schema.find_type(2))),  # type: ignore
+            (None, MapReader(StringReader(), StringReader())),
+            (None, ListReader(StringReader())),
+        ),
+        Record,
+        read_schema.as_struct(),
+    )
+
+
+def test_resolver_skips_enum_fields() -> None:
+    write_schema = Schema(
+        NestedField(1, "id", LongType()),
+        NestedField(2, "format", StringType()),
+        NestedField(3, "data", StringType()),
+        schema_id=1,
+    )
+    read_schema = Schema(NestedField(1, "id", LongType()), NestedField(3, "data", StringType()), schema_id=1)
+
+    output = io.BytesIO()
+    construct_writer(write_schema).write(BinaryEncoder(output), Record(1, "PARQUET", "data"))
+
+    record = resolve_reader(write_schema, read_schema, read_enums={2: FileFormat}).read(new_decoder(output.getvalue()))
+    assert record.record_fields() == [1, "data"]  # type: ignore
+
+
 def test_resolver_new_required_field() -> None:
     write_schema = Schema(
         NestedField(1, "id", LongType()),
@@ -16,8 +16,11 @@
 # under the License.
 
 import os
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Generator, List
+from typing import Generator, Iterator, List
+from unittest import mock
+from urllib.parse import urlparse
 
 import pyarrow as pa
 import pytest
@@ -25,6 +28,7 @@ from pydantic_core import ValidationError
 from pytest_lazyfixture import lazy_fixture
 from sqlalchemy.exc import ArgumentError, IntegrityError
 
+from pyiceberg.avro.file import AvroFile
 from pyiceberg.catalog.sql import SqlCatalog
 from pyiceberg.exceptions import (
     CommitFailedException,
@@ -35,9 +39,11 @@ from pyiceberg.exceptions import (
     NoSuchTableError,
     TableAlreadyExistsError,
 )
+from pyiceberg.expressions import EqualTo, GreaterThanOrEqual
 from pyiceberg.io import FSSPEC_FILE_IO, PY_IO_IMPL
-from pyiceberg.io.pyarrow import schema_to_pyarrow
-from pyiceberg.partitioning import UNPARTITIONED_PARTITION_SPEC
+from pyiceberg.io.pyarrow import project_table, schema_to_pyarrow
+from pyiceberg.manifest import ManifestContent, ManifestEntryStatus
+from pyiceberg.partitioning import UNPARTITIONED_PARTITION_SPEC, PartitionField, PartitionSpec
 from pyiceberg.schema import Schema
 from pyiceberg.table import _dataframe_to_data_files
 from pyiceberg.table.snapshots import Operation
@@ -47,9 +53,10 @@ from pyiceberg.table.sorting import (
     SortField,
     SortOrder,
 )
-from pyiceberg.transforms import IdentityTransform
-from pyiceberg.typedef import Identifier
+from pyiceberg.transforms import BucketTransform, IdentityTransform
+from pyiceberg.typedef import Identifier, Properties, Record
 from pyiceberg.types import IntegerType
+from pyiceberg.utils.concurrent import COMMIT_POOL, ExecutorFactory
 
 
 @pytest.fixture(name="random_identifier")
@@ -874,6 +881,189 @@ def test_append_table(catalog: SqlCatalog, table_schema_simple: Schema, random_i
     assert df == table.scan().to_arrow()
 
 
+@pytest.mark.parametrize(
+    'catalog',
+    [
+        lazy_fixture('catalog_memory'),
+        lazy_fixture('catalog_sqlite'),
+    ],
+)
+def test_scan_to_arrow_batch_reader(catalog: SqlCatalog, table_schema_simple: Schema, random_identifier: Identifier) -> None:
+    database_name, _table_name = random_identifier
+    catalog.create_namespace(database_name)
+    table = catalog.create_table(random_identifier, table_schema_simple)
+
+    df = pa.Table.from_pydict(
+        {
+            "foo": ["a", "b", "c"],
+            "bar": [1, 2, 3],
+            "baz": [True, False, None],
+        },
+        schema=schema_to_pyarrow(table_schema_simple),
+    )
+
+    table.append(df)
+    table.append(df)
+
+    reader = table.scan(row_filter="bar >= 2").to_arrow_batch_reader()
+    assert isinstance(reader, pa.RecordBatchReader)
+    assert reader.schema == schema_to_pyarrow(table_schema_simple)
+    assert reader.read_all() == table.scan(row_filter="bar >= 2").to_arrow()
+
+    assert len(table.scan(limit=4).to_arrow_batch_reader().read_all()) == 4
+    assert table.scan().to_pandas().equals(table.scan().to_arrow().to_pandas())
+
+
+@pytest.mark.parametrize(
+    'catalog',
+    [
+        lazy_fixture('catalog_memory'),
+        lazy_fixture('catalog_sqlite'),
+    ],
+)
+@pytest.mark.parametrize(
+    "properties, expected_codec",
+    [
+        ({}, "deflate"),
+        ({"write.avro.compression-codec": "uncompressed"}, "null"),
+        ({"write.avro.compression-codec": "zstd", "write.avro.compression-level": "5"}, "zstandard"),
+        ({"write.avro.compression-codec": "snappy"}, "snappy"),
+    ],
+)
+def test_append_compressed_manifests(
+    catalog: SqlCatalog,
+    table_schema_simple: Schema,
+    random_identifier: Identifier,
+    properties: Properties,
+    expected_codec: str,
+) -> None:
+    database_name, _table_name = random_identifier
+    catalog.create_namespace(database_name)
+    table = catalog.create_table(random_identifier, table_schema_simple, properties=properties)
+
+    df = pa.Table.from_pydict(
+        {
+            "foo": ["a"],
+            "bar": [1],
+            "baz": [True],
+        },
+        schema=schema_to_pyarrow(table_schema_simple),
+    )
+    table.append(df)
+    table.append(df)
+
+    snapshot = table.current_snapshot()
+    assert snapshot is not None
+    avro_files = [snapshot.manifest_list] + [manifest.manifest_path for manifest in snapshot.manifests(table.io)]
+    for avro_file in avro_files:
+        with AvroFile[Record](table.io.new_input(avro_file)) as reader:
+            assert reader.header.meta["avro.codec"] == expected_codec
+
+    assert table.scan().to_arrow() == pa.concat_tables([df, df])
+
+
+@pytest.mark.parametrize(
+    'catalog',
+    [
+        lazy_fixture('catalog_memory'),
+    ],
+)
+def test_append_unknown_avro_codec(catalog: SqlCatalog, table_schema_simple: Schema, random_identifier: Identifier) -> None:
+    database_name, _table_name = random_identifier
+    catalog.create_namespace(database_name)
+    table = catalog.create_table(random_identifier, table_schema_simple, properties={"write.avro.compression-codec": "lz4"})
+
+    df = pa.Table.from_pydict(
+        {
+            "foo": ["a"],
+            "bar": [1],
+            "baz": [True],
+        },
+        schema=schema_to_pyarrow(table_schema_simple),
+    )
+    with pytest.raises(ValueError, match="Unsupported Avro compression codec: lz4"):
+        table.append(df)
+
+
+@pytest.mark.parametrize(
+    'catalog',
+    [
+        lazy_fixture('catalog_memory'),
+        lazy_fixture('catalog_sqlite'),
+    ],
+)
+def test_plan_files_is_lazy(catalog: SqlCatalog, table_schema_simple: Schema, random_identifier: Identifier) -> None:
+    database_name, _table_name = random_identifier
+    catalog.create_namespace(database_name)
+    table = catalog.create_table(random_identifier, table_schema_simple)
+
+    df = pa.Table.from_pydict(
+        {
+            "foo": ["a"],
+            "bar": [1],
+            "baz": [True],
+        },
+        schema=schema_to_pyarrow(table_schema_simple),
+    )
+    for _ in range(3):
+        table.append(df)
+
+    tasks = table.scan(options={"max-concurrent-manifest-reads": "1"}).plan_files()
+    assert isinstance(tasks, Iterator)
+
+    snapshot = table.current_snapshot()
+    assert snapshot is not None
+    data_files = {
+        entry.data_file.file_path
+        for manifest in snapshot.manifests(table.io)
+        for entry in manifest.fetch_manifest_entry(table.io)
+    }
+    assert {task.file.file_path for task in tasks} == data_files
+    assert len(data_files) == 3
+
+
+@pytest.mark.parametrize(
+    'catalog',
+    [
+        lazy_fixture('catalog_memory'),
+        lazy_fixture('catalog_sqlite'),
+    ],
+)
+def test_write_partitioned_table(catalog: SqlCatalog, table_schema_simple: Schema, random_identifier: Identifier) -> None:
+    database_name, _table_name = random_identifier
+    catalog.create_namespace(database_name)
+    spec = PartitionSpec(
+        PartitionField(source_id=3, field_id=1000, transform=IdentityTransform(), name="baz"),
+        PartitionField(source_id=2, field_id=1001, transform=BucketTransform(num_buckets=2), name="bar_bucket"),
+    )
+    table = catalog.create_table(random_identifier, table_schema_simple, partition_spec=spec)
+
+    df = pa.Table.from_pydict(
+        {
+            "foo": ["a", "b", "c", "d", "e"],
+            "bar": [1, 2, 3, 4, 5],
+            "baz": [True, False, None, True, True],
+        },
+        schema=schema_to_pyarrow(table_schema_simple),
+    )
+    table.append(df)
+
+    tasks = list(table.scan().plan_files())
+    bucket = BucketTransform(num_buckets=2).transform(IntegerType())
+    expected_partitions = {(baz, bucket(bar)) for baz, bar in zip(df["baz"].to_pylist(), df["bar"].to_pylist())}
+    assert {tuple(task.file.partition.record_fields()) for task in tasks} == expected_partitions
+    assert len(tasks) == len(expected_partitions)
+    for task in tasks:
+        assert f"/data/{spec.partition_to_path(task.file.partition, table.schema())}/" in task.file.file_path
+        assert task.file.spec_id == spec.spec_id
+
+    assert table.scan().to_arrow().sort_by("bar") == df
+    assert table.scan(row_filter=EqualTo("baz", True)).to_arrow()["bar"].to_pylist() == [1, 4, 5]
+
+    table.overwrite(df.slice(0, 2))
+    assert sorted(table.scan().to_arrow()["foo"].to_pylist()) == ["a", "b"]
+
+
 @pytest.mark.parametrize(
     'catalog',
     [
@@ -897,6 +1087,577 @@ def test_concurrent_commit_table(catalog: SqlCatalog, table_schema_simple: Schem
             update.add_column(path="c", field_type=IntegerType())
 
 
+@pytest.mark.parametrize(
+    'catalog',
+    [
+        lazy_fixture('catalog_memory'),
+        lazy_fixture('catalog_sqlite'),
+    ],
+)
+def test_concurrent_append_is_retried(catalog: SqlCatalog, table_schema_simple: Schema, random_identifier: Identifier) -> None:
+    database_name, _table_name = random_identifier
+    catalog.create_namespace(database_name)
+    table_a = catalog.create_table(random_identifier, table_schema_simple, properties={"commit.retry.min-wait-ms": "1"})
+    table_b = catalog.load_table(random_identifier)
+    df = pa.Table.from_pydict({"foo": ["a"], "bar": [1], "baz": [True]}, schema=schema_to_pyarrow(table_schema_simple))
+
+    table_a.append(df)
+    # The metadata of table_b is stale, so the first attempt fails
+    table_b.append(df)
+
+    assert table_b.metadata.current_snapshot_id == table_b.metadata.snapshots[1].snapshot_id
+    snapshot_a, snapshot_b = table_b.metadata.snapshots
+    assert snapshot_b.parent_snapshot_id == snapshot_a.snapshot_id
+    assert snapshot_b.sequence_number == 2
+    assert snapshot_b.summary is not None
+    assert snapshot_b.summary["total-data-files"] == "2"
+    assert snapshot_b.manifest_list is not None and f"snap-{snapshot_b.snapshot_id}-1-" in snapshot_b.manifest_list
+    assert len(table_b.scan().to_arrow()) == 2
+
+    # The data file of table_b is written only once
+    data_files = [task.file.file_path for task in table_b.scan().plan_files()]
+    assert len(data_files) == 2
+    assert len(os.listdir(os.path.dirname(data_files[0]).replace("file://", ""))) == 2
+
+
+@pytest.mark.parametrize(
+    'catalog',
+    [
+        lazy_fixture('catalog_memory'),
+        lazy_fixture('catalog_sqlite'),
+    ],
+)
+def test_concurrent_overwrite_conflicts_with_append(
+    catalog: SqlCatalog, table_schema_simple: Schema, random_identifier: Identifier
+) -> None:
+    database_name, _table_name = random_identifier
+    catalog.create_namespace(database_name)
+    table_a = catalog.create_table(random_identifier, table_schema_simple, properties={"commit.retry.min-wait-ms": "1"})
+    table_b = catalog.load_table(random_identifier)
+    df = pa.Table.from_pydict({"foo": ["a"], "bar": [1], "baz": [True]}, schema=schema_to_pyarrow(table_schema_simple))
+
+    table_a.append(df)
+
+    with pytest.raises(CommitFailedException, match="added data files concurrently"):
+        table_b.overwrite(df)
+
+
+@pytest.mark.parametrize(
+    'catalog',
+    [
+        lazy_fixture('catalog_memory'),
+        lazy_fixture('catalog_sqlite'),
+    ],
+)
+def test_concurrent_append_without_retries(
+    catalog: SqlCatalog, table_schema_simple: Schema, random_identifier: Identifier
+) -> None:
+    database_name, _table_name = random_identifier
+    catalog.create_namespace(database_name)
+    table_a = catalog.create_table(random_identifier, table_schema_simple, properties={"commit.retry.num-retries": "0"})
+    table_b = catalog.load_table(random_identifier)
+    df = pa.Table.from_pydict({"foo": ["a"], "bar": [1], "baz": [True]}, schema=schema_to_pyarrow(table_schema_simple))
+
+    table_a.append(df)
+
+    with pytest.raises(CommitFailedException):
+        table_b.append(df)
+
+
+@pytest.mark.parametrize(
+    'catalog',
+    [
+        lazy_fixture('catalog_memory'),
+        lazy_fixture('catalog_sqlite'),
+    ],
+)
+def test_append_merges_manifests(catalog: SqlCatalog, table_schema_simple: Schema, random_identifier: Identifier) -> None:
+    database_name, _table_name = random_identifier
+    catalog.create_namespace(database_name)
+    table = catalog.create_table(
+        random_identifier,
+        table_schema_simple,
+        properties={"commit.manifest-merge.enabled": "true", "commit.manifest.min-count-to-merge": "3"},
+    )
+    df = pa.Table.from_pydict({"foo": ["a"], "bar": [1], "baz": [True]}, schema=schema_to_pyarrow(table_schema_simple))
+
+    table.append(df)
+    table.append(df)
+    assert len(table.current_snapshot().manifests(table.io)) == 2  # type: ignore
+
+    table.append(df)
+    snapshot = table.current_snapshot()
+    manifests = snapshot.manifests(table.io)  # type: ignore
+    assert len(manifests) == 1
+    entries = manifests[0].fetch_manifest_entry(table.io, discard_deleted=False)
+    assert [entry.status for entry in entries] == [
+        ManifestEntryStatus.ADDED,
+        ManifestEntryStatus.EXISTING,
+        ManifestEntryStatus.EXISTING,
+    ]
+    assert entries[0].snapshot_id == snapshot.snapshot_id  # type: ignore
+    assert entries[0].data_sequence_number == snapshot.sequence_number  # type: ignore
+    assert manifests[0].added_files_count == 1
+    assert manifests[0].existing_files_count == 2
+    assert len(table.scan().to_arrow()) == 3
+
+
+@pytest.mark.parametrize(
+    'catalog',
+    [
+        lazy_fixture('catalog_memory'),
+        lazy_fixture('catalog_sqlite'),
+    ],
+)
+def test_merge_append_without_merge_enabled(
+    catalog: SqlCatalog, table_schema_simple: Schema, random_identifier: Identifier
+) -> None:
+    database_name, _table_name = random_identifier
+    catalog.create_namespace(database_name)
+    table = catalog.create_table(random_identifier, table_schema_simple, properties={"commit.manifest.min-count-to-merge": "3"})
+    df = pa.Table.from_pydict({"foo": ["a"], "bar": [1], "baz": [True]}, schema=schema_to_pyarrow(table_schema_simple))
+    table.append(df)
+    table.append(df)
+
+    # The table property only applies to Table.append, an explicit merge append always merges
+    with table.transaction() as txn:
+        with txn.update_snapshot().merge_append() as merge_append:
+            for data_file in _dataframe_to_data_files(table_metadata=txn.table_metadata, df=df, io=table.io):
+                merge_append.append_data_file(data_file)
+
+    assert len(table.current_snapshot().manifests(table.io)) == 1  # type: ignore
+    assert len(table.scan().to_arrow()) == 3
+
+
+@pytest.mark.parametrize(
+    'catalog',
+    [
+        lazy_fixture('catalog_memory'),
+        lazy_fixture('catalog_sqlite'),
+    ],
+)
+def test_merge_append_without_added_files(
+    catalog: SqlCatalog, table_schema_simple: Schema, random_identifier: Identifier
+) -> None:
+    database_name, _table_name = random_identifier
+    catalog.create_namespace(database_name)
+    table = catalog.create_table(random_identifier, table_schema_simple)
+    df = pa.Table.from_pydict({"foo": ["a"], "bar": [1], "baz": [True]}, schema=schema_to_pyarrow(table_schema_simple))
+    table.append(df)
+    table.append(df)
+
+    # Without a new manifest, the min count to merge does not hold back the existing manifests
+    with table.transaction() as txn:
+        txn.update_snapshot().merge_append().commit()
+
+    assert len(table.current_snapshot().manifests(table.io)) == 1  # type: ignore
+    assert len(table.scan().to_arrow()) == 2
+
+
+@pytest.mark.parametrize(
+    'catalog',
+    [
+        lazy_fixture('catalog_memory'),
+        lazy_fixture('catalog_sqlite'),
+    ],
+)
+def test_partial_overwrite(catalog: SqlCatalog, table_schema_simple: Schema, random_identifier: Identifier) -> None:
+    database_name, _table_name = random_identifier
+    catalog.create_namespace(database_name)
+    table = catalog.create_table(random_identifier, table_schema_simple)
+    arrow_schema = schema_to_pyarrow(table_schema_simple)
+
+    table.append(pa.Table.from_pydict({"foo": ["a", "b"], "bar": [1, 2], "baz": [True, False]}, schema=arrow_schema))
+    table.append(pa.Table.from_pydict({"foo": ["c"], "bar": [3], "baz": [True]}, schema=arrow_schema))
+    untouched_manifest = table.current_snapshot().manifests(table.io)[1]  # type: ignore
+
+    table.overwrite(pa.Table.from_pydict({"foo": ["d"], "bar": [3], "baz": [False]}, schema=arrow_schema), "bar = 3")
+
+    snapshot = table.current_snapshot()
+    assert snapshot.summary.operation == Operation.OVERWRITE  # type: ignore
+    assert snapshot.summary["deleted-data-files"] == "1"  # type: ignore
+    assert snapshot.summary["total-data-files"] == "2"  # type: ignore
+    assert snapshot.summary["total-records"] == "3"  # type: ignore
+    # The manifest without deleted data files is kept as it is
+    assert untouched_manifest.manifest_path in [manifest.manifest_path for manifest in snapshot.manifests(table.io)]  # type: ignore
+    assert sorted(table.scan().to_arrow()["foo"].to_pylist()) == ["a", "b", "d"]
+
+
+@pytest.mark.parametrize(
+    'catalog',
+    [
+        lazy_fixture('catalog_memory'),
+        lazy_fixture('catalog_sqlite'),
+    ],
+)
+def test_delete_rewrites_partially_matching_files(
+    catalog: SqlCatalog, table_schema_simple: Schema, random_identifier: Identifier
+) -> None:
+    database_name, _table_name = random_identifier
+    catalog.create_namespace(database_name)
+    table = catalog.create_table(random_identifier, table_schema_simple)
+    arrow_schema = schema_to_pyarrow(table_schema_simple)
+
+    table.append(
+        pa.Table.from_pydict({"foo": ["a", None, "b"], "bar": [1, 2, 3], "baz": [True, False, None]}, schema=arrow_schema)
+    )
+    table.append(pa.Table.from_pydict({"foo": ["a"], "bar": [4], "baz": [True]}, schema=arrow_schema))
+    table.append(pa.Table.from_pydict({"foo": ["a", "c"], "bar": [5, 6], "baz": [True, True]}, schema=arrow_schema))
+
+    with mock.patch("pyiceberg.io.pyarrow.project_table", wraps=project_table) as project:
+        table.delete("foo = 'a'")
+
+    # Each partially matching file is read and rewritten on its own
+    assert [len(call.args[0]) for call in project.call_args_list] == [1, 1]
+    snapshot = table.current_snapshot()
+    assert snapshot.summary.operation == Operation.OVERWRITE  # type: ignore
+    assert snapshot.summary["deleted-data-files"] == "3"  # type: ignore
+    assert snapshot.summary["added-data-files"] == "2"  # type: ignore
+    assert snapshot.summary["total-records"] == "3"  # type: ignore
+    # The rows for which the filter is null are kept
+    assert table.scan().to_arrow().sort_by("bar").to_pydict() == {
+        "foo": [None, "b", "c"],
+        "bar": [2, 3, 6],
+        "baz": [False, None, True],
+    }
+
+
+@pytest.mark.parametrize(
+    'catalog',
+    [
+        lazy_fixture('catalog_memory'),
+        lazy_fixture('catalog_sqlite'),
+    ],
+)
+def test_delete_whole_files(catalog: SqlCatalog, table_schema_simple: Schema, random_identifier: Identifier) -> None:
+    database_name, _table_name = random_identifier
+    catalog.create_namespace(database_name)
+    table = catalog.create_table(random_identifier, table_schema_simple)
+    arrow_schema = schema_to_pyarrow(table_schema_simple)
+
+    table.append(pa.Table.from_pydict({"foo": ["a", "b"], "bar": [1, 2], "baz": [True, False]}, schema=arrow_schema))
+    table.append(pa.Table.from_pydict({"foo": ["c", "d"], "bar": [3, 4], "baz": [True, False]}, schema=arrow_schema))
+
+    table.delete(GreaterThanOrEqual("bar", 3))
+
+    snapshot = table.current_snapshot()
+    assert snapshot.summary.operation == Operation.DELETE  # type: ignore
+    assert snapshot.summary["deleted-data-files"] == "1"  # type: ignore
+    assert snapshot.summary["deleted-records"] == "2"  # type: ignore
+    assert snapshot.summary["added-data-files"] is None  # type: ignore
+    assert sorted(table.scan().to_arrow()["foo"].to_pylist()) == ["a", "b"]
+
+    with pytest.warns(UserWarning, match="Delete operation did not match any records"):
+        table.delete(EqualTo("bar", 5))
+    assert table.current_snapshot() == snapshot
+
+
+@pytest.mark.parametrize(
+    'catalog',
+    [
+        lazy_fixture('catalog_memory'),
+        lazy_fixture('catalog_sqlite'),
+    ],
+)
+def test_concurrent_delete_conflicts_with_matching_append(
+    catalog: SqlCatalog, table_schema_simple: Schema, random_identifier: Identifier
+) -> None:
+    database_name, _table_name = random_identifier
+    catalog.create_namespace(database_name)
+    table_a = catalog.create_table(random_identifier, table_schema_simple, properties={"commit.retry.min-wait-ms": "1"})
+    arrow_schema = schema_to_pyarrow(table_schema_simple)
+    table_a.append(pa.Table.from_pydict({"foo": ["a"], "bar": [1], "baz": [True]}, schema=arrow_schema))
+    table_b = catalog.load_table(random_identifier)
+
+    # An append that does not match the filter does not conflict
+    table_a.append(pa.Table.from_pydict({"foo": ["b"], "bar": [2], "baz": [True]}, schema=arrow_schema))
+    table_b.delete("bar = 1")
+    assert sorted(table_b.scan().to_arrow()["foo"].to_pylist()) == ["b"]
+
+    table_a.refresh()
+    table_b.refresh()
+    table_a.append(pa.Table.from_pydict({"foo": ["c"], "bar": [2], "baz": [True]}, schema=arrow_schema))
+    with pytest.raises(CommitFailedException, match="added data files concurrently"):
+        table_b.delete("bar = 2")
+
+
+@pytest.mark.parametrize(
+    'catalog',
+    [
+        lazy_fixture('catalog_memory'),
+        lazy_fixture('catalog_sqlite'),
+    ],
+)
+def test_merge_on_read_delete(catalog: SqlCatalog, table_schema_simple: Schema, random_identifier: Identifier) -> None:
+    database_name, _table_name = random_identifier
+    catalog.create_namespace(database_name)
+    table = catalog.create_table(random_identifier, table_schema_simple, properties={"write.delete.mode": "merge-on-read"})
+    arrow_schema = schema_to_pyarrow(table_schema_simple)
+
+    table.append(
+        pa.Table.from_pydict(
+            {"foo": ["a", None, "b", "a"], "bar": [1, 2, 3, 4], "baz": [True, False, None, True]}, schema=arrow_schema
+        )
+    )
+    table.append(pa.Table.from_pydict({"foo": ["c"], "bar": [5], "baz": [True]}, schema=arrow_schema))
+    data_files = {task.file.file_path for task in table.scan().plan_files()}
+
+    table.delete("foo = 'a'")
+
+    snapshot = table.current_snapshot()
+    assert snapshot.summary.operation == Operation.DELETE  # type: ignore
+    assert snapshot.summary["added-position-delete-files"] == "1"  # type: ignore
+    assert snapshot.summary["added-position-deletes"] == "2"  # type: ignore
+    assert snapshot.summary["deleted-data-files"] is None  # type: ignore
+    assert {manifest.content for manifest in snapshot.manifests(table.io)} == {ManifestContent.DATA, ManifestContent.DELETES}  # type: ignore
+    # The data files are kept, and the rows for which the filter is null are not deleted
+    assert {task.file.file_path for task in table.scan().plan_files()} == data_files
+    assert table.scan().to_arrow().sort_by("bar").to_pydict() == {
+        "foo": [None, "b", "c"],
+        "bar": [2, 3, 5],
+        "baz": [False, None, True],
+    }
+
+    # The rows that are already deleted are not deleted again
+    table.delete("bar <= 2", mode="merge-on-read")
+    assert table.current_snapshot().summary["added-position-deletes"] == "1"  # type: ignore
+    assert sorted(table.scan().to_arrow()["bar"].to_pylist()) == [3, 5]
+
+    with pytest.warns(UserWarning, match="Delete operation did not match any records"):
+        table.delete("foo = 'a'")
+
+
+@pytest.mark.parametrize(
+    'catalog',
+    [
+        lazy_fixture('catalog_memory'),
+        lazy_fixture('catalog_sqlite'),
+    ],
+)
+def test_merge_on_read_delete_conflicts_with_removed_data_file(
+    catalog: SqlCatalog, table_schema_simple: Schema, random_identifier: Identifier
+) -> None:
+    database_name, _table_name = random_identifier
+    catalog.create_namespace(database_name)
+    table_a = catalog.create_table(random_identifier, table_schema_simple, properties={"commit.retry.min-wait-ms": "1"})
+    arrow_schema = schema_to_pyarrow(table_schema_simple)
+    table_a.append(pa.Table.from_pydict({"foo": ["a", "b"], "bar": [1, 2], "baz": [True, False]}, schema=arrow_schema))
+    table_b = catalog.load_table(random_identifier)
+
+    # The data file is rewritten concurrently, so the positions do not apply anymore
+    table_a.delete("bar = 2")
+    with pytest.raises(CommitFailedException, match="removed a data file concurrently"):
+        table_b.delete("bar = 1", mode="merge-on-read")
+
+
+@pytest.mark.parametrize(
+    'catalog',
+    [
+        lazy_fixture('catalog_memory'),
+        lazy_fixture('catalog_sqlite'),
+    ],
+)
+def test_copy_on_write_delete_conflicts_with_concurrent_positional_deletes(
+    catalog: SqlCatalog, table_schema_simple: Schema, random_identifier: Identifier
+) -> None:
+    database_name, _table_name = random_identifier
+    catalog.create_namespace(database_name)
+    table_a = catalog.create_table(random_identifier, table_schema_simple, properties={"commit.retry.min-wait-ms": "1"})
+    arrow_schema = schema_to_pyarrow(table_schema_simple)
+    table_a.append(
+        pa.Table.from_pydict({"foo": ["a"] * 10, "bar": list(range(10)), "baz": [True] * 10}, schema=arrow_schema)
+    )
+    table_b = catalog.load_table(random_identifier)
+
+    # The rewritten data file would bring back the row that is deleted concurrently
+    table_a.delete(EqualTo("bar", 1), mode="merge-on-read")
+    with pytest.raises(CommitFailedException, match="added positional deletes concurrently"):
+        table_b.delete(GreaterThanOrEqual("bar", 8))
+
+    assert sorted(catalog.load_table(random_identifier).scan().to_arrow()["bar"].to_pylist()) == [0, *range(2, 10)]
+
+
+def test_merge_on_read_delete_requires_v2(
+    catalog_memory: SqlCatalog, table_schema_simple: Schema, random_identifier: Identifier
+) -> None:
+    database_name, _table_name = random_identifier
+    catalog_memory.create_namespace(database_name)
+    table = catalog_memory.create_table(random_identifier, table_schema_simple, properties={"format-version": "1"})
+    with pytest.raises(ValueError, match="Merge-on-read deletes require a table with format version 2"):
+        table.delete("bar = 1", mode="merge-on-read")
+
+
+@pytest.mark.parametrize(
+    'catalog',
+    [
+        lazy_fixture('catalog_memory'),
+        lazy_fixture('catalog_sqlite'),
+    ],
+)
+def test_expire_snapshots(catalog: SqlCatalog, table_schema_simple: Schema, random_identifier: Identifier) -> None:
+    database_name, _table_name = random_identifier
+    catalog.create_namespace(database_name)
+    table = catalog.create_table(random_identifier, table_schema_simple)
+    arrow_schema = schema_to_pyarrow(table_schema_simple)
+
+    table.append(pa.Table.from_pydict({"foo": ["a"], "bar": [1], "baz": [True]}, schema=arrow_schema))
+    table.overwrite(pa.Table.from_pydict({"foo": ["b"], "bar": [2], "baz": [True]}, schema=arrow_schema))
+    table.append(pa.Table.from_pydict({"foo": ["c"], "bar": [3], "baz": [True]}, schema=arrow_schema))
+    expired_snapshots = table.metadata.snapshots[:-1]
+    expired_manifest_lists = [snapshot.manifest_list for snapshot in expired_snapshots]
+    overwritten_data_file = expired_snapshots[0].manifests(table.io)[0].fetch_manifest_entry(table.io)[0].data_file.file_path
+    live_data_files = [task.file.file_path for task in table.scan().plan_files()]
+
+    # Recent snapshots are kept
+    table.expire_snapshots()
+    assert len(table.metadata.snapshots) == 3
+
+    table.expire_snapshots(older_than=datetime.now() + timedelta(seconds=1), retain_last=1)
+
+    assert [snapshot.snapshot_id for snapshot in table.metadata.snapshots] == [table.current_snapshot().snapshot_id]  # type: ignore
+    assert [entry.snapshot_id for entry in table.history()] == [table.current_snapshot().snapshot_id]  # type: ignore
+    assert sorted(table.scan().to_arrow()["foo"].to_pylist()) == ["b", "c"]
+    # The files that only the expired snapshots refer to are deleted, the live data files are kept
+    assert not any(os.path.exists(urlparse(path).path) for path in expired_manifest_lists)
+    assert not os.path.exists(urlparse(overwritten_data_file).path)
+    assert all(os.path.exists(urlparse(path).path) for path in live_data_files)
+
+    # The table is reloaded with the expired snapshots removed
+    assert len(catalog.load_table(random_identifier).metadata.snapshots) == 1
+
+
+@pytest.mark.parametrize(
+    'catalog',
+    [
+        lazy_fixture('catalog_memory'),
+        lazy_fixture('catalog_sqlite'),
+    ],
+)
+def test_rewrite_data_files(catalog: SqlCatalog, table_schema_simple: Schema, random_identifier: Identifier) -> None:
+    database_name, _table_name = random_identifier
+    catalog.create_namespace(database_name)
+    table = catalog.create_table(random_identifier, table_schema_simple)
+    arrow_schema = schema_to_pyarrow(table_schema_simple)
+
+    for i in range(4):
+        table.append(pa.Table.from_pydict({"foo": [str(i)], "bar": [i], "baz": [True]}, schema=arrow_schema))
+    table.delete("bar = 1", mode="merge-on-read")
+    before = table.current_snapshot()
+    small_data_files = {task.file.file_path for task in table.scan().plan_files()}
+
+    table.rewrite_data_files(target_file_size=1024 * 1024)
+
+    snapshot = table.current_snapshot()
+    assert snapshot.summary.operation == Operation.REPLACE  # type: ignore
+    assert snapshot.summary["deleted-data-files"] == "4"  # type: ignore
+    assert snapshot.summary["added-data-files"] == "1"  # type: ignore
+    tasks = list(table.scan().plan_files())
+    assert len(tasks) == 1
+    assert tasks[0].file.file_path not in small_data_files
+    # The positional deletes are applied, so they no longer refer to the data file
+    assert not tasks[0].delete_files
+    assert sorted(table.scan().to_arrow()["bar"].to_pylist()) == [0, 2, 3]
+
+    # The rewritten data file keeps the sequence number of the snapshot that the rewrite started from
+    entries = [entry for manifest in snapshot.manifests(table.io) for entry in manifest.fetch_manifest_entry(table.io)]  # type: ignore
+    added_entry = next(entry for entry in entries if entry.data_file.file_path == tasks[0].file.file_path)
+    assert added_entry.data_sequence_number == before.sequence_number  # type: ignore
+    assert added_entry.file_sequence_number == snapshot.sequence_number  # type: ignore
+
+    # A single data file without deletes is not rewritten
+    table.rewrite_data_files(target_file_size=1024 * 1024)
+    assert table.current_snapshot() == snapshot
+
+
+@pytest.mark.parametrize(
+    'catalog',
+    [
+        lazy_fixture('catalog_memory'),
+        lazy_fixture('catalog_sqlite'),
+    ],
+)
+def test_rewrite_data_files_conflicts_with_concurrent_positional_deletes(
+    catalog: SqlCatalog, table_schema_simple: Schema, random_identifier: Identifier
+) -> None:
+    database_name, _table_name = random_identifier
+    catalog.create_namespace(database_name)
+    table_a = catalog.create_table(random_identifier, table_schema_simple, properties={"commit.retry.min-wait-ms": "1"})
+    arrow_schema = schema_to_pyarrow(table_schema_simple)
+    table_a.append(pa.Table.from_pydict({"foo": ["a"], "bar": [1], "baz": [True]}, schema=arrow_schema))
+    table_a.append(pa.Table.from_pydict({"foo": ["b"], "bar": [2], "baz": [True]}, schema=arrow_schema))
+    table_b = catalog.load_table(random_identifier)
+
+    # The deleted row would come back in the rewritten data file
+    table_a.delete("bar = 1", mode="merge-on-read")
+    with pytest.raises(CommitFailedException, match="added positional deletes concurrently"):
+        table_b.rewrite_data_files(target_file_size=1024 * 1024)
+
+
+@pytest.mark.parametrize(
+    'catalog',
+    [
+        lazy_fixture('catalog_memory'),
+        lazy_fixture('catalog_sqlite'),
+    ],
+)
+def test_rewrite_manifests(catalog: SqlCatalog, table_schema_simple: Schema, random_identifier: Identifier) -> None:
+    database_name, _table_name = random_identifier
+    catalog.create_namespace(database_name)
+    spec = PartitionSpec(PartitionField(source_id=1, field_id=1000, transform=IdentityTransform(), name="foo"))
+    table = catalog.create_table(
+        random_identifier, table_schema_simple, partition_spec=spec, properties={"commit.manifest.target-size-bytes": "1"}
+    )
+    arrow_schema = schema_to_pyarrow(table_schema_simple)
+    for i in range(3):
+        table.append(pa.Table.from_pydict({"foo": ["c", None, "a", "b"], "bar": [i] * 4, "baz": [True] * 4}, schema=arrow_schema))
+    before = table.current_snapshot()
+    data_files = {task.file.file_path for task in table.scan().plan_files()}
+
+    table.rewrite_manifests()
+
+    snapshot = table.current_snapshot()
+    assert snapshot.summary.operation == Operation.REPLACE  # type: ignore
+    assert snapshot.summary["manifests-replaced"] == "3"  # type: ignore
+    assert snapshot.summary["entries-processed"] == "12"  # type: ignore
+    assert snapshot.summary["total-data-files"] == before.summary["total-data-files"]  # type: ignore
+    assert {task.file.file_path for task in table.scan().plan_files()} == data_files
+    # Each manifest only covers a single partition, so the filter prunes the other ones
+    manifests = snapshot.manifests(table.io)  # type: ignore
+    assert snapshot.summary["manifests-created"] == str(len(manifests))  # type: ignore
+    assert all(manifest.partitions[0].lower_bound == manifest.partitions[0].upper_bound for manifest in manifests)  # type: ignore
+    assert len([manifest for manifest in manifests if manifest.partitions[0].lower_bound == b"a"]) == 3  # type: ignore
+    assert len(table.scan(row_filter="foo = 'a'").to_arrow()) == 3
+
+    # The entries are merged into a single manifest at the default target size
+    table.transaction().remove_properties("commit.manifest.target-size-bytes").commit_transaction()
+    table.rewrite_manifests()
+    assert len(table.current_snapshot().manifests(table.io)) == 1  # type: ignore
+    assert len(table.scan().to_arrow()) == 12
+
+
+@mock.patch.object(ExecutorFactory, "_instances", {})
+@mock.patch.dict(os.environ, {"PYICEBERG_COMMIT_MAX_WORKERS": "1"})
+def test_rewrite_manifests_single_commit_worker(
+    catalog_memory: SqlCatalog, table_schema_simple: Schema, random_identifier: Identifier
+) -> None:
+    database_name, _table_name = random_identifier
+    catalog_memory.create_namespace(database_name)
+    table = catalog_memory.create_table(random_identifier, table_schema_simple)
+    arrow_schema = schema_to_pyarrow(table_schema_simple)
+    for i in range(2):
+        table.append(pa.Table.from_pydict({"foo": ["a", "b"], "bar": [i] * 2, "baz": [True] * 2}, schema=arrow_schema))
+
+    # The group rewrites run on the commit pool, but are submitted from the caller's thread, so a single worker does not wait on itself
+    table.rewrite_manifests()
+
+    assert ExecutorFactory.stats()[COMMIT_POOL].max_workers == 1
+    assert table.current_snapshot().summary["manifests-replaced"] == "2"  # type: ignore
+    assert len(table.current_snapshot().manifests(table.io)) == 1  # type: ignore
+    assert len(table.scan().to_arrow()) == 4
+    for executor in ExecutorFactory._instances.values():
+        executor.shutdown()
+
+
 @pytest.mark.parametrize(
     'catalog',
     [
@@ -15,6 +15,7 @@
 # specific language governing permissions and limitations
 # under the License.
 # pylint:disable=redefined-outer-name
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import pytest
@@ -567,6 +568,9 @@ def test_integer_in(schema_data_file: Schema, data_file: DataFile) -> None:
     should_read = _InclusiveMetricsEvaluator(schema_data_file, In("id", {INT_MAX_VALUE + 6, INT_MAX_VALUE + 7})).eval(data_file)
     assert not should_read, "Should not read: id above upper bound (85 > 79, 86 > 79)"
 
+    should_read = _InclusiveMetricsEvaluator(schema_data_file, In("id", {INT_MIN_VALUE - 1, INT_MAX_VALUE + 1})).eval(data_file)
+    assert not should_read, "Should not read: id outside of the bounds on both sides (29 < 30, 80 > 79)"
+
     should_read = _InclusiveMetricsEvaluator(schema_data_file, In("all_nulls", {"abc", "def"})).eval(data_file)
     assert not should_read, "Should skip: in on all nulls column"
 
@@ -581,6 +585,31 @@ def test_integer_in(schema_data_file: Schema, data_file: DataFile) -> None:
     assert should_read, "Should read: large in expression"
 
 
+def test_inclusive_metrics_evaluator_concurrent_eval(schema_data_file: Schema) -> None:
+    files = [
+        DataFile(
+            file_path=f"file_{lower_bound}.parquet",
+            file_format=FileFormat.PARQUET,
+            partition={},
+            record_count=10,
+            file_size_in_bytes=3,
+            value_counts={1: 10},
+            null_value_counts={1: 0},
+            nan_value_counts={},
+            lower_bounds={1: to_bytes(IntegerType(), lower_bound)},
+            upper_bounds={1: to_bytes(IntegerType(), lower_bound + 9)},
+        )
+        for lower_bound in range(0, 1000, 10)
+    ]
+    evaluator = _InclusiveMetricsEvaluator(schema_data_file, Or(LessThan("id", 100), In("id", {505, 999})))
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(evaluator.eval, files * 20))
+
+    assert results == [evaluator.eval(file) for file in files] * 20
+    assert sum(results[: len(files)]) == 12
+
+
 def test_integer_not_in(schema_data_file: Schema, data_file: DataFile) -> None:
     should_read = _InclusiveMetricsEvaluator(schema_data_file, NotIn("id", {INT_MIN_VALUE - 25, INT_MIN_VALUE - 24})).eval(
         data_file
@@ -19,16 +19,20 @@
 import os
 import tempfile
 from datetime import date
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
+import numpy as np
 import pyarrow as pa
 import pyarrow.parquet as pq
 import pytest
-from pyarrow.fs import FileType, LocalFileSystem
+from pyarrow.fs import FileType, LocalFileSystem, SubTreeFileSystem
+from pytest_mock import MockerFixture
 
+import pyiceberg.io.pyarrow
 from pyiceberg.catalog.noop import NoopCatalog
+from pyiceberg.conversions import to_bytes
 from pyiceberg.exceptions import ResolveError
 from pyiceberg.expressions import (
     AlwaysFalse,
@@ -50,31 +54,58 @@ from pyiceberg.expressions import (
     BoundNotStartsWith,
     BoundReference,
     BoundStartsWith,
+    EqualTo,
     GreaterThan,
+    GreaterThanOrEqual,
+    In,
+    IsNaN,
+    IsNull,
+    LessThan,
+    LessThanOrEqual,
     Not,
+    NotEqualTo,
+    NotIn,
+    NotNaN,
+    NotNull,
+    NotStartsWith,
     Or,
+    StartsWith,
 )
 from pyiceberg.expressions.literals import literal
+from pyiceberg.expressions.visitors import _InclusiveMetricsEvaluator, bind, expression_evaluator, inclusive_projection
 from pyiceberg.io import InputStream, OutputStream, load_file_io
 from pyiceberg.io.pyarrow import (
     ICEBERG_SCHEMA,
+    ParquetFooterCache,
     PyArrowFile,
     PyArrowFileIO,
     StatsAggregator,
+    _apply_equality_deletes,
+    _apply_positional_deletes,
+    _combine_positional_deletes,
     _ConvertToArrowSchema,
+    _file_projection,
+    _FileProjection,
+    _parquet_fragment,
     _primitive_to_physical,
     _read_deletes,
+    _read_equality_deletes,
+    _rows_to_read,
     bin_pack_arrow_table,
+    columnar_manifest_pruner,
+    determine_partitions,
     expression_to_pyarrow,
+    project_batches,
     project_table,
     schema_to_pyarrow,
 )
-from pyiceberg.manifest import DataFile, DataFileContent, FileFormat
-from pyiceberg.partitioning import PartitionSpec
+from pyiceberg.manifest import DataFile, DataFileContent, FileFormat, _data_file_columns
+from pyiceberg.partitioning import PartitionField, PartitionSpec
 from pyiceberg.schema import Schema, make_compatible_name, visit
 from pyiceberg.table import FileScanTask, Table, TableProperties
 from pyiceberg.table.metadata import TableMetadataV2
-from pyiceberg.typedef import UTF8
+from pyiceberg.transforms import IdentityTransform, TruncateTransform
+from pyiceberg.typedef import UTF8, Record
 from pyiceberg.types import (
     BinaryType,
     BooleanType,
@@ -94,6 +125,7 @@ from pyiceberg.types import (
     TimestampType,
     TimestamptzType,
     TimeType,
+    UUIDType,
 )
 
 
@@ -1327,6 +1359,36 @@ def test_projection_filter_on_unprojected_field(schema_int_str: Schema, file_int
     assert repr(result_table.schema) == "id: int32 not null"
 
 
+def test_parquet_footer_is_cached(file_int: str) -> None:
+    cache = ParquetFooterCache.get_or_create()
+    cache.clear()
+    data_file = DataFile(file_path=file_int, file_format=FileFormat.PARQUET, file_size_in_bytes=os.path.getsize(file_int[5:]))
+
+    fragment = _parquet_fragment(LocalFileSystem(), data_file)
+    assert fragment.metadata.num_rows == 3
+    # An equal file system reuses the footer
+    assert _parquet_fragment(LocalFileSystem(), data_file) is fragment
+    assert cache.stats().hits == 1
+
+    # Another file system reads the footer again
+    other_fs = SubTreeFileSystem("/", LocalFileSystem())
+    assert _parquet_fragment(other_fs, data_file) is not fragment
+    assert _parquet_fragment(other_fs, data_file) is _parquet_fragment(other_fs, data_file)
+    assert cache.stats().entries == 1
+
+
+def test_file_projection_is_memoized(schema_int: Schema, file_int: str) -> None:
+    physical_schema = pq.read_schema(file_int[5:])
+    bound_row_filter = bind(schema_int, GreaterThan("id", 1), case_sensitive=True)
+    file_projections: Dict[Any, _FileProjection] = {}
+
+    projection = _file_projection(physical_schema, bound_row_filter, {1}, True, None, file_projections)
+    assert projection.file_schema == schema_int
+    assert str(projection.pyarrow_filter) == "(id > 1)"
+    assert _file_projection(physical_schema, bound_row_filter, {1}, True, None, file_projections) is projection
+    assert len(file_projections) == 1
+
+
 def test_projection_filter_on_unknown_field(schema_int_str: Schema, file_int_str: str) -> None:
     schema = Schema(NestedField(1, "id", IntegerType()))
 
@@ -1353,6 +1415,66 @@ def test_read_deletes(deletes_file: str, example_task: FileScanTask) -> None:
     assert list(deletes.values())[0] == pa.chunked_array([[1, 3, 5]])
 
 
+def test_read_deletes_groups_by_file(tmp_path: str) -> None:
+    # Delete files should be sorted on file_path and pos, but the grouping does not rely on it
+    table = pa.table({"file_path": ["b", "a", "c", "a", "b", "a"], "pos": [7, 1, 2, 3, 8, 5]})
+    deletes_file_path = f"{tmp_path}/deletes.parquet"
+    pq.write_table(table, deletes_file_path, row_group_size=2)
+
+    deletes = _read_deletes(LocalFileSystem(), DataFile(file_path=deletes_file_path, file_format=FileFormat.PARQUET))
+    assert {file: positions.to_pylist() for file, positions in deletes.items()} == {"a": [1, 3, 5], "b": [7, 8], "c": [2]}
+
+    # The grouped positions are reused by the next scans
+    with patch("pyiceberg.io.pyarrow._construct_fragment", side_effect=AssertionError("Should be read from the cache")):
+        assert _read_deletes(LocalFileSystem(), DataFile(file_path=deletes_file_path, file_format=FileFormat.PARQUET)) is deletes
+
+
+@pytest.mark.parametrize(
+    "deletes",
+    [
+        [[]],
+        [[0]],
+        [[4095, 0, 1]],
+        [[5000, 7]],
+        [[3, 2, 1], [2, 10, 4000]],
+        [list(range(0, 4096, 2))],
+        [list(range(4096))],
+    ],
+)
+def test_apply_positional_deletes(deletes: List[List[int]]) -> None:
+    rows = 4096
+    table = pa.table({"id": pa.array(range(rows), type=pa.int64())})
+    deleted_positions = _combine_positional_deletes([pa.chunked_array([positions], type=pa.int64()) for positions in deletes])
+
+    expected = np.setdiff1d(np.arange(rows), np.concatenate([np.array(positions, dtype=np.int64) for positions in deletes]))
+    assert _apply_positional_deletes(table, deleted_positions).column("id").to_pylist() == expected.tolist()
+
+    for limit in [1, 10, 2048]:
+        head = table.slice(0, _rows_to_read(deleted_positions, limit))
+        assert _apply_positional_deletes(head, deleted_positions).column("id").to_pylist() == expected[:limit].tolist()
+
+
+@pytest.mark.parametrize(
+    "deletes, max_chunks",
+    [
+        ([7], 2),
+        (list(range(0, 1_000_000, 1_000)), 1),
+    ],
+)
+def test_apply_positional_deletes_is_not_fragmented(deletes: List[int], max_chunks: int) -> None:
+    rows = 1_000_000
+    table = pa.table({"id": pa.array(range(rows), type=pa.int64())})
+    deleted_positions = np.array(deletes, dtype=np.int64)
+
+    result = _apply_positional_deletes(table, deleted_positions)
+
+    assert len(result) == rows - len(deletes)
+    assert np.array_equal(result.column("id").to_numpy(), np.setdiff1d(np.arange(rows), deleted_positions))
+    # Many sparse deletes are applied with a mask, instead of slicing the table into a chunk per deleted row
+    assert result.column("id").num_chunks <= max_chunks
+    assert len(result.to_batches()) <= max_chunks
+
+
 def test_delete(deletes_file: str, example_task: FileScanTask, table_schema_simple: Schema) -> None:
     metadata_location = "file://a/b/c.json"
     example_task_with_delete = FileScanTask(
@@ -1393,6 +1515,46 @@ baz: [[true,null]]"""
     )
 
 
+@pytest.mark.parametrize("limit", [None, 3])
+def test_delete_with_row_group_pruning(schema_long: Schema, tmpdir: str, limit: Optional[int], mocker: MockerFixture) -> None:
+    pyarrow_schema = schema_to_pyarrow(schema_long, metadata={ICEBERG_SCHEMA: bytes(schema_long.model_dump_json(), UTF8)})
+    data_file_path = f"{tmpdir}/row_groups.parquet"
+    pq.write_table(pa.Table.from_arrays([pa.array(range(100))], schema=pyarrow_schema), data_file_path, row_group_size=10)
+    deletes_file_path = f"{tmpdir}/deletes.parquet"
+    pq.write_table(pa.table({"file_path": [data_file_path] * 5, "pos": [5, 46, 52, 67, 95]}), deletes_file_path)
+
+    task = FileScanTask(
+        data_file=DataFile(file_path=data_file_path, file_format=FileFormat.PARQUET, file_size_in_bytes=1024),
+        delete_files={
+            DataFile(content=DataFileContent.POSITION_DELETES, file_path=deletes_file_path, file_format=FileFormat.PARQUET)
+        },
+    )
+    table = Table(
+        ("namespace", "table"),
+        metadata=TableMetadataV2(
+            location="file://a/b/",
+            last_column_id=3,
+            format_version=2,
+            schemas=[schema_long],
+            partition_specs=[PartitionSpec()],
+        ),
+        metadata_location="file://a/b/c.json",
+        io=PyArrowFileIO(),
+        catalog=NoopCatalog("NoopCatalog"),
+    )
+
+    prune_row_groups = mocker.spy(pyiceberg.io.pyarrow, "_prune_row_groups")
+    result = project_table([task], table, And(GreaterThan("id", 45), LessThan("id", 75)), schema_long, limit=limit)
+
+    # Only the row groups 4 to 7 are read, with the deleted positions moved to the start of the rows that are read
+    fragment, deleted_positions = prune_row_groups.spy_return
+    assert [row_group.id for row_group in fragment.row_groups] == [4, 5, 6, 7]
+    assert deleted_positions.tolist() == [6, 12, 27]
+
+    expected = [i for i in range(46, 75) if i not in (46, 52, 67)]
+    assert result.column("id").to_pylist() == expected[:limit]
+
+
 def test_delete_duplicates(deletes_file: str, example_task: FileScanTask, table_schema_simple: Schema) -> None:
     metadata_location = "file://a/b/c.json"
     example_task_with_delete = FileScanTask(
@@ -1436,6 +1598,231 @@ baz: [[true,null]]"""
     )
 
 
+def test_project_batches_with_deletes(deletes_file: str, example_task: FileScanTask, table_schema_simple: Schema) -> None:
+    metadata_location = "file://a/b/c.json"
+    example_task_with_delete = FileScanTask(
+        data_file=example_task.file,
+        delete_files={DataFile(content=DataFileContent.POSITION_DELETES, file_path=deletes_file, file_format=FileFormat.PARQUET)},
+    )
+
+    batches = project_batches(
+        tasks=[example_task, example_task_with_delete],
+        table=Table(
+            ("namespace", "table"),
+            metadata=TableMetadataV2(
+                location=metadata_location,
+                last_column_id=1,
+                format_version=2,
+                current_schema_id=1,
+                schemas=[table_schema_simple],
+                partition_specs=[PartitionSpec()],
+            ),
+            metadata_location=metadata_location,
+            io=load_file_io(),
+            catalog=NoopCatalog("noop"),
+        ),
+        row_filter=AlwaysTrue(),
+        projected_schema=table_schema_simple,
+        read_ahead=1,
+    )
+
+    reader = pa.RecordBatchReader.from_batches(schema_to_pyarrow(table_schema_simple), batches)
+    assert reader.read_all().to_pydict() == {
+        "foo": ["a", "b", "c", "a", "c"],
+        "bar": [1, 2, 3, 1, 3],
+        "baz": [True, False, None, True, None],
+    }
+
+
+@pytest.fixture
+def equality_deletes_file(tmp_path: str) -> str:
+    # Deletes the rows where baz is null, and the row where foo is "a"
+    schema = Schema(NestedField(1, "foo", StringType(), required=False), NestedField(3, "baz", BooleanType(), required=False))
+    table = pa.table(
+        {"foo": ["a", "x"], "baz": [True, None]},
+        metadata={"iceberg.schema": schema.model_dump_json()},
+    )
+
+    deletes_file_path = f"{tmp_path}/equality-deletes.parquet"
+    pq.write_table(table, deletes_file_path)
+
+    return deletes_file_path
+
+
+def test_read_equality_deletes(equality_deletes_file: str) -> None:
+    delete_file = DataFile(
+        content=DataFileContent.EQUALITY_DELETES,
+        file_path=equality_deletes_file,
+        file_format=FileFormat.PARQUET,
+        equality_ids=[3],
+    )
+    deletes = _read_equality_deletes(LocalFileSystem(), delete_file)
+    assert deletes.to_pydict() == {"3": [True, None]}
+
+    # The deletes are reused by the next scans
+    with patch("pyiceberg.io.pyarrow._construct_fragment", side_effect=AssertionError("Should be read from the cache")):
+        assert _read_equality_deletes(LocalFileSystem(), delete_file) is deletes
+
+
+def test_apply_equality_deletes() -> None:
+    file_schema = Schema(
+        NestedField(1, "id", LongType(), required=False),
+        NestedField(2, "name", StringType(), required=False),
+    )
+    table = pa.table({
+        "id": pa.array([1, 2, None, 4, 5, None], type=pa.int64()),
+        "name": ["a", "b", "c", None, "e", None],
+    })
+
+    # Nulls are equal to each other, the deleted values are cast to the type of the data
+    by_id = pa.table({"1": pa.array([2, None], type=pa.int32())})
+    assert _apply_equality_deletes(table, file_schema, [((1,), by_id)]).to_pydict() == {
+        "id": [1, 4, 5],
+        "name": ["a", None, "e"],
+    }
+
+    by_id_and_name = pa.table({"1": pa.array([5, None, 4], type=pa.int64()), "2": ["e", None, "d"]})
+    assert _apply_equality_deletes(table, file_schema, [((1, 2), by_id_and_name), ((1,), pa.table({"1": [1]}))]).to_pydict() == {
+        "id": [2, None, 4],
+        "name": ["b", "c", None],
+    }
+
+    # A column that is not in the data file is null
+    by_missing = pa.table({"7": pa.array([None], type=pa.string())})
+    assert len(_apply_equality_deletes(table, file_schema, [((7,), by_missing)])) == 0
+
+
+@pytest.mark.parametrize("limit", [None, 1])
+def test_project_table_with_equality_deletes(
+    deletes_file: str, equality_deletes_file: str, example_task: FileScanTask, table_schema_simple: Schema, limit: Optional[int]
+) -> None:
+    metadata_location = "file://a/b/c.json"
+    by_foo = DataFile(
+        content=DataFileContent.EQUALITY_DELETES,
+        file_path=equality_deletes_file,
+        file_format=FileFormat.PARQUET,
+        equality_ids=[1],
+    )
+    by_baz_path = equality_deletes_file.replace("equality-deletes", "equality-deletes-by-baz")
+    pq.write_table(pq.read_table(equality_deletes_file), by_baz_path)
+    by_baz = DataFile(
+        content=DataFileContent.EQUALITY_DELETES,
+        file_path=by_baz_path,
+        file_format=FileFormat.PARQUET,
+        equality_ids=[3],
+    )
+    positional = DataFile(content=DataFileContent.POSITION_DELETES, file_path=deletes_file, file_format=FileFormat.PARQUET)
+    table = Table(
+        ("namespace", "table"),
+        metadata=TableMetadataV2(
+            location=metadata_location,
+            last_column_id=1,
+            format_version=2,
+            current_schema_id=1,
+            schemas=[table_schema_simple],
+            partition_specs=[PartitionSpec()],
+        ),
+        metadata_location=metadata_location,
+        io=load_file_io(),
+        catalog=NoopCatalog("noop"),
+    )
+
+    # The equality columns are read to apply the deletes, but are not part of the result
+    with_deletes = project_table(
+        tasks=[FileScanTask(data_file=example_task.file, delete_files={by_foo})],
+        table=table,
+        row_filter=AlwaysTrue(),
+        projected_schema=table_schema_simple.select("bar"),
+        limit=limit,
+    )
+    assert with_deletes.to_pydict() == {"bar": [2, 3][:limit]}
+
+    with_deletes = project_table(
+        tasks=[FileScanTask(data_file=example_task.file, delete_files={by_baz})],
+        table=table,
+        row_filter=AlwaysTrue(),
+        projected_schema=table_schema_simple,
+        limit=limit,
+    )
+    assert with_deletes.to_pydict() == {"foo": ["b"], "bar": [2], "baz": [False]}
+
+    # Combined with positional deletes
+    with_deletes = project_table(
+        tasks=[FileScanTask(data_file=example_task.file, delete_files={by_foo, positional})],
+        table=table,
+        row_filter=AlwaysTrue(),
+        projected_schema=table_schema_simple,
+        limit=limit,
+    )
+    assert with_deletes.to_pydict() == {"foo": ["c"], "bar": [3], "baz": [None]}
+
+
+def test_project_batches_limit(schema_int: Schema, file_int: str) -> None:
+    table = Table(
+        ("namespace", "table"),
+        metadata=TableMetadataV2(
+            location="file://a/b/",
+            last_column_id=1,
+            format_version=2,
+            schemas=[schema_int],
+            partition_specs=[PartitionSpec()],
+        ),
+        metadata_location="file://a/b/c.json",
+        io=PyArrowFileIO(),
+        catalog=NoopCatalog("NoopCatalog"),
+    )
+    tasks = [
+        FileScanTask(
+            DataFile(
+                content=DataFileContent.DATA,
+                file_path=file_int,
+                file_format=FileFormat.PARQUET,
+                partition={},
+                record_count=3,
+                file_size_in_bytes=3,
+            )
+        )
+        for _ in range(3)
+    ]
+
+    batches = list(project_batches(tasks, table, AlwaysTrue(), schema_int, limit=4, read_ahead=2))
+
+    assert sum(len(batch) for batch in batches) == 4
+    assert pa.Table.from_batches(batches).column("id").to_pylist() == [0, 1, 2, 0]
+
+
+def test_project_batches_nested(schema_map: Schema, file_map: str) -> None:
+    table = Table(
+        ("namespace", "table"),
+        metadata=TableMetadataV2(
+            location="file://a/b/",
+            last_column_id=1,
+            format_version=2,
+            schemas=[schema_map],
+            partition_specs=[PartitionSpec()],
+        ),
+        metadata_location="file://a/b/c.json",
+        io=PyArrowFileIO(),
+        catalog=NoopCatalog("NoopCatalog"),
+    )
+    task = FileScanTask(
+        DataFile(
+            content=DataFileContent.DATA,
+            file_path=file_map,
+            file_format=FileFormat.PARQUET,
+            partition={},
+            record_count=3,
+            file_size_in_bytes=3,
+        )
+    )
+
+    reader = pa.RecordBatchReader.from_batches(
+        schema_to_pyarrow(schema_map), project_batches([task], table, AlwaysTrue(), schema_map)
+    )
+
+    assert reader.read_all().equals(project(schema_map, [file_map]).cast(schema_to_pyarrow(schema_map)))
+
+
 def test_pyarrow_wrap_fsspec(example_task: FileScanTask, table_schema_simple: Schema) -> None:
     metadata_location = "file://a/b/c.json"
     projection = project_table(
@@ -1733,3 +2120,152 @@ def test_bin_pack_arrow_table(arrow_table_with_null: pa.Table) -> None:
     # and will produce half the number of files if we double the target size
     bin_packed = bin_pack_arrow_table(bigger_arrow_tbl, target_file_size=arrow_table_with_null.nbytes * 2)
     assert len(list(bin_packed)) == 5
+
+
+def test_determine_partitions() -> None:
+    schema = Schema(
+        NestedField(1, "id", LongType(), required=False),
+        NestedField(2, "name", StringType(), required=False),
+        NestedField(3, "location", StructType(NestedField(4, "city", StringType(), required=False)), required=False),
+    )
+    spec = PartitionSpec(
+        PartitionField(source_id=2, field_id=1000, transform=TruncateTransform(width=1), name="name_trunc"),
+        PartitionField(source_id=4, field_id=1001, transform=IdentityTransform(), name="city"),
+    )
+    arrow_table = pa.Table.from_pylist(
+        [
+            {"id": 1, "name": "apple", "location": {"city": "Amsterdam"}},
+            {"id": 2, "name": "banana", "location": {"city": "Amsterdam"}},
+            {"id": 3, "name": "avocado", "location": {"city": "Amsterdam"}},
+            {"id": 4, "name": None, "location": {"city": "Berlin"}},
+            {"id": 5, "name": "blueberry", "location": {"city": None}},
+            {"id": 6, "name": "apricot", "location": {"city": "Amsterdam"}},
+        ],
+        schema=schema_to_pyarrow(schema),
+    )
+
+    partitions = determine_partitions(spec=spec, schema=schema, arrow_table=arrow_table)
+
+    assert {
+        str(partition.partition_key.partition): sorted(partition.arrow_table_partition["id"].to_pylist())
+        for partition in partitions
+    } == {
+        "Record[name_trunc='a', city='Amsterdam']": [1, 3, 6],
+        "Record[name_trunc='b', city='Amsterdam']": [2],
+        "Record[name_trunc=None, city='Berlin']": [4],
+        "Record[name_trunc='b', city=None]": [5],
+    }
+    assert {partition.partition_key.to_path() for partition in partitions} == {
+        "name_trunc=a/city=Amsterdam",
+        "name_trunc=b/city=Amsterdam",
+        "name_trunc=null/city=Berlin",
+        "name_trunc=b/city=null",
+    }
+
+
+PRUNING_SCHEMA = Schema(
+    NestedField(1, "id", LongType(), required=False),
+    NestedField(2, "data", StringType(), required=False),
+    NestedField(3, "price", DoubleType(), required=False),
+    NestedField(4, "uuid", UUIDType(), required=False),
+)
+PRUNING_SPEC = PartitionSpec(PartitionField(source_id=2, field_id=1000, transform=IdentityTransform(), name="data"))
+
+
+def _pruning_data_file(
+    data: Optional[str],
+    record_count: int,
+    lower_id: Optional[int] = None,
+    upper_id: Optional[int] = None,
+    null_ids: int = 0,
+    lower_price: Optional[float] = None,
+    upper_price: Optional[float] = None,
+    nan_prices: int = 0,
+) -> DataFile:
+    lower_bounds = {}
+    upper_bounds = {}
+    if lower_id is not None:
+        lower_bounds[1] = to_bytes(LongType(), lower_id)
+    if upper_id is not None:
+        upper_bounds[1] = to_bytes(LongType(), upper_id)
+    if data is not None:
+        lower_bounds[2] = upper_bounds[2] = to_bytes(StringType(), data)
+    if lower_price is not None:
+        lower_bounds[3] = to_bytes(DoubleType(), lower_price)
+    if upper_price is not None:
+        upper_bounds[3] = to_bytes(DoubleType(), upper_price)
+    return DataFile(
+        file_path=f"s3://bucket/{data}-{record_count}.parquet",
+        file_format=FileFormat.PARQUET,
+        partition=Record(data=data),
+        record_count=record_count,
+        file_size_in_bytes=1024,
+        value_counts={1: record_count, 2: record_count, 3: record_count},
+        null_value_counts={1: null_ids, 2: 0 if data is not None else record_count, 3: 0},
+        nan_value_counts={3: nan_prices},
+        lower_bounds=lower_bounds,
+        upper_bounds=upper_bounds,
+    )
+
+
+PRUNING_DATA_FILES = [
+    _pruning_data_file("a", 10, lower_id=1, upper_id=10, lower_price=1.0, upper_price=2.0),
+    _pruning_data_file("b", 10, lower_id=5, upper_id=20, null_ids=3, lower_price=1.5, upper_price=9.5, nan_prices=2),
+    _pruning_data_file("c", 10, null_ids=10, nan_prices=10),
+    _pruning_data_file(None, 5, lower_id=30, upper_id=40),
+    _pruning_data_file("d", 0),
+    _pruning_data_file("e", -1),
+    _pruning_data_file("abc", 20, lower_id=-5, upper_id=0, lower_price=-1.0, upper_price=-1.0),
+]
+
+
+@pytest.mark.parametrize(
+    "row_filter",
+    [
+        AlwaysTrue(),
+        AlwaysFalse(),
+        EqualTo("id", 7),
+        NotEqualTo("id", 7),
+        LessThan("id", 5),
+        LessThanOrEqual("id", 5),
+        GreaterThan("id", 20),
+        GreaterThanOrEqual("id", 20),
+        In("id", {0, 15, 100}),
+        NotIn("id", {1, 2}),
+        IsNull("id"),
+        NotNull("id"),
+        IsNaN("price"),
+        NotNaN("price"),
+        GreaterThan("price", 2.0),
+        EqualTo("data", "b"),
+        NotEqualTo("data", "b"),
+        StartsWith("data", "a"),
+        NotStartsWith("data", "a"),
+        IsNull("data"),
+        Or(EqualTo("data", "a"), GreaterThan("id", 35)),
+        And(NotNull("id"), Not(LessThan("price", 1.0))),
+    ],
+)
+@pytest.mark.parametrize("include_empty_files", [False, True])
+def test_columnar_manifest_pruner(row_filter: BooleanExpression, include_empty_files: bool) -> None:
+    partition_filter = inclusive_projection(PRUNING_SCHEMA, PRUNING_SPEC)(row_filter)
+    partition_evaluator = expression_evaluator(
+        Schema(*PRUNING_SPEC.partition_type(PRUNING_SCHEMA).fields), partition_filter, case_sensitive=True
+    )
+    metrics_evaluator = _InclusiveMetricsEvaluator(PRUNING_SCHEMA, row_filter, include_empty_files=include_empty_files).eval
+    expected = [
+        pos
+        for pos, data_file in enumerate(PRUNING_DATA_FILES)
+        if partition_evaluator(data_file.partition) and metrics_evaluator(data_file)
+    ]
+
+    pruner = columnar_manifest_pruner(
+        PRUNING_SCHEMA, PRUNING_SPEC, partition_filter, row_filter, include_empty_files=include_empty_files
+    )
+    assert pruner is not None
+    assert pruner(_data_file_columns(PRUNING_DATA_FILES)) == expected
+
+
+def test_columnar_manifest_pruner_unsupported_type() -> None:
+    row_filter = EqualTo("uuid", "f79c3e1a-7d9c-4e4e-9f3e-2f0c5b6a7d8e")
+    assert columnar_manifest_pruner(PRUNING_SCHEMA, PRUNING_SPEC, AlwaysTrue(), row_filter) is None
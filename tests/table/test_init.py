@@ -17,7 +17,7 @@
 # pylint:disable=redefined-outer-name
 import uuid
 from copy import copy
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
 import pyarrow as pa
 import pytest
@@ -55,6 +55,8 @@ from pyiceberg.table import (
     AssertTableUUID,
     CommitTableRequest,
     RemovePropertiesUpdate,
+    RemoveSnapshotRefUpdate,
+    RemoveSnapshotsUpdate,
     SetDefaultSortOrderUpdate,
     SetPropertiesUpdate,
     SetSnapshotRefUpdate,
@@ -64,7 +66,9 @@ from pyiceberg.table import (
     UpdateSchema,
     _apply_table_update,
     _check_schema_compatible,
+    _equality_delete_partition,
     _match_deletes_to_data_file,
+    _match_equality_deletes_to_data_file,
     _TableMetadataUpdateContext,
     update_table_metadata,
 )
@@ -83,6 +87,7 @@ from pyiceberg.table.sorting import (
     SortOrder,
 )
 from pyiceberg.transforms import BucketTransform, IdentityTransform
+from pyiceberg.typedef import Record
 from pyiceberg.types import (
     BinaryType,
     BooleanType,
@@ -433,6 +438,45 @@ def test_match_deletes_to_datafile_duplicate_number() -> None:
     }
 
 
+def test_match_equality_deletes_to_data_file() -> None:
+    def _entry(content: DataFileContent, path: str, sequence_number: int, spec_id: int, partition: Record) -> ManifestEntry:
+        return ManifestEntry(
+            status=ManifestEntryStatus.ADDED,
+            data_sequence_number=sequence_number,
+            file_sequence_number=sequence_number,
+            data_file=DataFile(
+                content=content,
+                file_path=path,
+                file_format=FileFormat.PARQUET,
+                partition=partition,
+                record_count=3,
+                file_size_in_bytes=3,
+                equality_ids=None if content == DataFileContent.DATA else [1],
+                spec_id=spec_id,
+            ),
+        )
+
+    data_entry = _entry(DataFileContent.DATA, "s3://bucket/0000.parquet", 2, 1, Record(1))
+    same_partition = _entry(DataFileContent.EQUALITY_DELETES, "s3://bucket/0001-delete.parquet", 3, 1, Record(1))
+    same_sequence_number = _entry(DataFileContent.EQUALITY_DELETES, "s3://bucket/0002-delete.parquet", 2, 1, Record(1))
+    other_partition = _entry(DataFileContent.EQUALITY_DELETES, "s3://bucket/0003-delete.parquet", 3, 1, Record(2))
+    other_spec = _entry(DataFileContent.EQUALITY_DELETES, "s3://bucket/0004-delete.parquet", 3, 2, Record(1))
+    unpartitioned = _entry(DataFileContent.EQUALITY_DELETES, "s3://bucket/0005-delete.parquet", 4, 0, Record())
+
+    equality_delete_entries: Dict[Optional[Tuple[int, Tuple[Any, ...]]], SortedList[ManifestEntry]] = {}
+    for entry in [same_partition, same_sequence_number, other_partition, other_spec]:
+        equality_delete_entries.setdefault(
+            _equality_delete_partition(entry.data_file), SortedList(key=lambda entry: entry.data_sequence_number)
+        ).add(entry)
+    equality_delete_entries[None] = SortedList(iterable=[unpartitioned], key=lambda entry: entry.data_sequence_number)
+
+    # Only the deletes that are newer than the data, in the same partition or unpartitioned, apply
+    assert _match_equality_deletes_to_data_file(data_entry, equality_delete_entries) == {
+        same_partition.data_file,
+        unpartitioned.data_file,
+    }
+
+
 def test_serialize_set_properties_updates() -> None:
     assert (
         SetPropertiesUpdate(updates={"abc": "🤪"}).model_dump_json() == """{"action":"set-properties","updates":{"abc":"🤪"}}"""
@@ -671,6 +715,49 @@ def test_update_metadata_set_snapshot_ref(table_v2: Table) -> None:
     )
 
 
+def test_update_metadata_remove_snapshots(table_v2: Table) -> None:
+    new_metadata = update_table_metadata(table_v2.metadata, (RemoveSnapshotsUpdate(snapshot_ids=[3051729675574597004]),))
+    assert [snapshot.snapshot_id for snapshot in new_metadata.snapshots] == [3055729675574597004]
+    # The history before the removed snapshot is dropped
+    assert [entry.snapshot_id for entry in new_metadata.snapshot_log] == [3055729675574597004]
+    # The tag of the removed snapshot is removed
+    assert set(new_metadata.refs) == {"main"}
+    assert new_metadata.current_snapshot_id == 3055729675574597004
+
+    new_metadata = update_table_metadata(table_v2.metadata, (RemoveSnapshotsUpdate(snapshot_ids=[3055729675574597004]),))
+    assert set(new_metadata.refs) == {"test"}
+    assert new_metadata.current_snapshot_id is None
+
+
+def test_update_metadata_remove_snapshot_ref(table_v2: Table) -> None:
+    new_metadata = update_table_metadata(table_v2.metadata, (RemoveSnapshotRefUpdate(ref_name="test"),))
+    assert set(new_metadata.refs) == {"main"}
+    assert len(new_metadata.snapshots) == 2
+    assert update_table_metadata(table_v2.metadata, (RemoveSnapshotRefUpdate(ref_name="unknown"),)) == table_v2.metadata
+
+
+def test_expire_snapshots_retention(table_v2: Table) -> None:
+    # The snapshots are years old, so only the current snapshot of main is kept, and the tag is past its max ref age
+    updates, _ = table_v2.transaction().expire_snapshots()._commit()  # pylint: disable=W0212
+    assert updates == (RemoveSnapshotRefUpdate(ref_name="test"), RemoveSnapshotsUpdate(snapshot_ids=[3051729675574597004]))
+
+    # The retention of the table properties applies to main
+    transaction = table_v2.transaction().set_properties(**{"history.expire.min-snapshots-to-keep": "2"})
+    updates, _ = transaction.expire_snapshots()._commit()  # pylint: disable=W0212
+    assert updates == (RemoveSnapshotRefUpdate(ref_name="test"),)
+
+    # A tag keeps its snapshot until it is older than its max ref age
+    transaction = table_v2.transaction().set_properties(**{"history.expire.max-ref-age-ms": str(2**62)})
+    transaction._apply((  # pylint: disable=W0212
+        SetSnapshotRefUpdate(ref_name="test", type="tag", snapshot_id=3051729675574597004, max_ref_age_ms=2**62),
+    ))
+    updates, _ = transaction.expire_snapshots()._commit()  # pylint: disable=W0212
+    assert updates == ()
+
+    with pytest.raises(ValueError, match="Cannot expire snapshot 3055729675574597004, it is the current snapshot of main"):
+        table_v2.transaction().expire_snapshots().expire_snapshot_id(3055729675574597004)._commit()  # pylint: disable=W0212
+
+
 def test_update_metadata_add_update_sort_order(table_v2: Table) -> None:
     new_sort_order = SortOrder(order_id=table_v2.sort_order().order_id + 1)
     new_metadata = update_table_metadata(
@@ -308,14 +308,34 @@ def test_merge_snapshot_summaries_overwrite_summary() -> None:
     assert actual.additional_properties == expected
 
 
-def test_invalid_operation() -> None:
-    with pytest.raises(ValueError) as e:
-        update_snapshot_summaries(summary=Summary(Operation.REPLACE))
-    assert "Operation not implemented: Operation.REPLACE" in str(e.value)
+def test_merge_snapshot_summaries_replace() -> None:
+    actual = update_snapshot_summaries(
+        summary=Summary(
+            operation=Operation.REPLACE,
+            **{
+                'added-data-files': '1',
+                'deleted-data-files': '4',
+                'added-records': '90',
+                'deleted-records': '100',
+                'added-files-size': '1000',
+                'removed-files-size': '1200',
+            },
+        ),
+        previous_summary={
+            'total-data-files': '10',
+            'total-delete-files': '1',
+            'total-records': '300',
+            'total-files-size': '5000',
+            'total-position-deletes': '10',
+            'total-equality-deletes': '0',
+        },
+    )
 
-    with pytest.raises(ValueError) as e:
-        update_snapshot_summaries(summary=Summary(Operation.DELETE))
-    assert "Operation not implemented: Operation.DELETE" in str(e.value)
+    assert actual.operation == Operation.REPLACE
+    assert actual['total-data-files'] == '7'
+    assert actual['total-delete-files'] == '1'
+    assert actual['total-records'] == '290'
+    assert actual['total-files-size'] == '4800'
 
 
 def test_invalid_type() -> None:
@@ -15,12 +15,13 @@
 # specific language governing permissions and limitations
 # under the License.
 # pylint: disable=eval-used,protected-access,redefined-outer-name
-from datetime import date
+from datetime import date, datetime, time, timedelta, timezone
 from decimal import Decimal
 from typing import Any, Callable, Optional
 from uuid import UUID
 
 import mmh3 as mmh3
+import pyarrow as pa
 import pytest
 from pydantic import (
     BeforeValidator,
@@ -106,6 +107,7 @@ from pyiceberg.types import (
 from pyiceberg.utils.datetime import (
     date_str_to_days,
     date_to_days,
+    datetime_to_micros,
     time_str_to_micros,
     timestamp_to_micros,
     timestamptz_to_micros,
@@ -1808,3 +1810,94 @@ def test_strict_binary(bound_reference_binary: BoundReference[str]) -> None:
     _test_projection(
         lhs=transform.strict_project(name="name", pred=BoundIn(term=bound_reference_binary, literals=set_of_literals)), rhs=None
     )
+
+
+_TIMESTAMPS = [
+    datetime(1969, 12, 31, 23, 59, 59, 999999),
+    datetime(1970, 1, 1),
+    datetime(2017, 11, 16, 22, 31, 8),
+    datetime(1900, 2, 28, 12, 30),
+]
+
+
+@pytest.mark.parametrize(
+    "transform,source_type,arrow_type,values,to_internal",
+    [
+        (BucketTransform(16), IntegerType(), pa.int32(), [0, 1, 34, -34, 2**31 - 1], None),
+        (BucketTransform(16), LongType(), pa.int64(), [0, 34, -(2**40), 2**62], None),
+        (BucketTransform(16), DateType(), pa.date32(), [date(2017, 11, 16), date(1969, 1, 1)], date_to_days),
+        (BucketTransform(16), TimeType(), pa.time64("us"), [time(22, 31, 8), time(0, 0)], lambda t: time_str_to_micros(str(t))),
+        (BucketTransform(16), TimestampType(), pa.timestamp("us"), _TIMESTAMPS, datetime_to_micros),
+        (
+            BucketTransform(16),
+            TimestamptzType(),
+            pa.timestamp("us", tz="UTC"),
+            [ts.replace(tzinfo=timezone.utc) for ts in _TIMESTAMPS],
+            datetime_to_micros,
+        ),
+        (
+            BucketTransform(16),
+            DecimalType(9, 2),
+            pa.decimal128(9, 2),
+            [Decimal("14.20"), Decimal("0.00"), Decimal("1.28"), Decimal("-1.28"), Decimal("-9999999.99")],
+            None,
+        ),
+        (BucketTransform(16), DecimalType(38, 0), pa.decimal128(38, 0), [Decimal(10**37), Decimal(-(10**37))], None),
+        (BucketTransform(16), StringType(), pa.string(), ["iceberg", "", "a", "abcde", "\u2603\U0001f600"], None),
+        (BucketTransform(16), StringType(), pa.large_string(), ["iceberg", "", "abcdefgh"], None),
+        (BucketTransform(16), BinaryType(), pa.binary(), [b"\x00\x01\x02\x03", b"", b"\xff" * 7], None),
+        (BucketTransform(16), FixedType(3), pa.binary(3), [b"foo", b"bar"], None),
+        (BucketTransform(16), UUIDType(), pa.binary(16), [UUID("f79c3e09-677c-4bbd-a479-3f349cb785e7").bytes], None),
+        (YearTransform(), DateType(), pa.date32(), [date(2017, 11, 16), date(1969, 12, 31), date(1970, 1, 1)], date_to_days),
+        (YearTransform(), TimestampType(), pa.timestamp("us"), _TIMESTAMPS, datetime_to_micros),
+        (MonthTransform(), DateType(), pa.date32(), [date(2017, 11, 16), date(1969, 12, 31), date(1970, 1, 1)], date_to_days),
+        (MonthTransform(), TimestampType(), pa.timestamp("us"), _TIMESTAMPS, datetime_to_micros),
+        (DayTransform(), DateType(), pa.date32(), [date(2017, 11, 16), date(1969, 12, 31)], date_to_days),
+        (DayTransform(), TimestampType(), pa.timestamp("us"), _TIMESTAMPS, datetime_to_micros),
+        (HourTransform(), TimestampType(), pa.timestamp("us"), _TIMESTAMPS, datetime_to_micros),
+        (
+            HourTransform(),
+            TimestamptzType(),
+            pa.timestamp("us", tz="-08:00"),
+            [ts.replace(tzinfo=timezone(timedelta(hours=-8))) for ts in _TIMESTAMPS],
+            datetime_to_micros,
+        ),
+        (TruncateTransform(10), IntegerType(), pa.int32(), [0, 1, -1, 9, 10, -10, -11], None),
+        (TruncateTransform(10), LongType(), pa.int64(), [0, 1, -1, 2**40 + 5], None),
+        (TruncateTransform(3), StringType(), pa.string(), ["iceberg", "ic", "\u2603\u2603\u2603\u2603"], None),
+        (TruncateTransform(3), BinaryType(), pa.binary(), [b"\x00\x01\x02\x03", b"\x00"], None),
+        (
+            TruncateTransform(10),
+            DecimalType(9, 2),
+            pa.decimal128(9, 2),
+            [Decimal("12.34"), Decimal("-0.05"), Decimal("0.10")],
+            None,
+        ),
+        (TruncateTransform(10), DecimalType(38, 2), pa.decimal128(38, 2), [Decimal("12.34"), Decimal("-0.05")], None),
+        (IdentityTransform(), StringType(), pa.string(), ["a", "b"], None),
+    ],
+)
+def test_pyarrow_transform_matches_transform(
+    transform: Transform[Any, Any], source_type: PrimitiveType, arrow_type: pa.DataType, values: Any, to_internal: Any
+) -> None:
+    values = values + [None]
+    arrow_values = pa.array(values, type=arrow_type)
+    scalar_transform = transform.transform(source_type)
+    expected = [scalar_transform(to_internal(value) if to_internal and value is not None else value) for value in values]
+
+    pyarrow_transform = transform.pyarrow_transform(source_type)
+    assert pyarrow_transform(arrow_values).to_pylist() == expected
+    assert pyarrow_transform(arrow_values.slice(1)).to_pylist() == expected[1:]
+
+    chunked = pyarrow_transform(pa.chunked_array([arrow_values.slice(0, 1), arrow_values.slice(1)]))
+    assert isinstance(chunked, pa.ChunkedArray)
+    assert chunked.to_pylist() == expected
+
+
+def test_void_pyarrow_transform() -> None:
+    assert VoidTransform().pyarrow_transform(StringType())(pa.array(["a", None])).to_pylist() == [None, None]
+
+
+def test_unknown_pyarrow_transform() -> None:
+    with pytest.raises(NotImplementedError, match="Cannot apply unknown to PyArrow arrays"):
+        UnknownTransform("unknown").pyarrow_transform(StringType())
@@ -20,7 +20,7 @@ from typing import List
 
 import pytest
 
-from pyiceberg.utils.bin_packing import PackingIterator
+from pyiceberg.utils.bin_packing import ListPacker, PackingIterator
 
 
 @pytest.mark.parametrize(
@@ -84,3 +84,20 @@ def test_bin_packing_lookback(
         return x
 
     assert list(PackingIterator(splits, target_weight, lookback, weight_func, largest_bin_first)) == expected_lists
+
+
+@pytest.mark.parametrize(
+    "splits, target_weight, expected_lists, expected_lists_end",
+    [
+        ([36, 36, 36, 36, 73, 110, 128], 128, [[36, 36, 36], [36, 73], [110], [128]], [[36, 36, 36], [36, 73], [110], [128]]),
+        ([10, 10, 10, 100], 128, [[10, 10, 10], [100]], [[10], [10, 10, 100]]),
+        ([100, 10, 10, 10], 100, [[100], [10, 10, 10]], [[100], [10, 10, 10]]),
+        ([50, 50, 50], 100, [[50, 50], [50]], [[50], [50, 50]]),
+    ],
+)
+def test_list_packer(
+    splits: List[int], target_weight: int, expected_lists: List[List[int]], expected_lists_end: List[List[int]]
+) -> None:
+    packer: ListPacker[int] = ListPacker(target_weight=target_weight, lookback=1, largest_bin_first=False)
+    assert packer.pack(splits, lambda x: x) == expected_lists
+    assert packer.pack_end(splits, lambda x: x) == expected_lists_end
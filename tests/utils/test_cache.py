@@ -0,0 +1,136 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from pyiceberg.io.pyarrow import PyArrowFileIO
+from pyiceberg.manifest import ManifestFile
+from pyiceberg.utils.cache import CacheStats, LRUCache, SharedCache, estimate_size
+
+
+def test_lru_cache_hits_and_misses() -> None:
+    cache: LRUCache[str, str] = LRUCache(max_weight=10, weigher=len)
+    assert cache.get_or_load("a", lambda: "aaa") == "aaa"
+    assert cache.get_or_load("a", lambda: "other") == "aaa"
+    assert cache.get("b") is None
+    assert cache.stats() == CacheStats(hits=1, misses=2, evictions=0, entries=1, weight=3)
+
+
+def test_lru_cache_evicts_least_recently_used() -> None:
+    cache: LRUCache[str, str] = LRUCache(max_weight=10, weigher=len)
+    cache.put("a", "aaaa")
+    cache.put("b", "bbbb")
+    # Touch a, so that b is the least recently used
+    assert cache.get("a") == "aaaa"
+    cache.put("c", "cccc")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "aaaa"
+    assert cache.get("c") == "cccc"
+    assert cache.stats().evictions == 1
+    assert cache.stats().weight == 8
+
+
+def test_lru_cache_skips_values_heavier_than_the_max() -> None:
+    cache: LRUCache[str, str] = LRUCache(max_weight=3, weigher=len)
+    assert cache.put("a", "aaaa") == "aaaa"
+    assert cache.get("a") is None
+    assert cache.stats().entries == 0
+
+
+def test_lru_cache_disabled() -> None:
+    cache: LRUCache[str, str] = LRUCache(max_weight=0, weigher=len)
+    cache.put("a", "")
+    assert cache.get("a") is None
+
+
+def test_lru_cache_invalidate_and_clear() -> None:
+    cache: LRUCache[str, str] = LRUCache(max_weight=10, weigher=len)
+    cache.put("a", "aa")
+    cache.put("b", "bb")
+    cache.invalidate("a")
+    assert cache.get("a") is None
+    assert cache.stats().weight == 2
+
+    cache.clear()
+    assert cache.stats() == CacheStats(hits=0, misses=0, evictions=0, entries=0, weight=0)
+
+
+def test_lru_cache_concurrent_access() -> None:
+    cache: LRUCache[int, str] = LRUCache(max_weight=100, weigher=len)
+
+    def load(i: int) -> str:
+        return cache.get_or_load(i % 20, lambda: "x" * 10)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert all(value == "x" * 10 for value in executor.map(load, range(1000)))
+
+    stats = cache.stats()
+    assert stats.hits + stats.misses == 1000
+    assert stats.entries == 10
+    assert stats.weight == 100
+
+
+def test_estimate_size(generated_manifest_entry_file: str) -> None:
+    manifest = ManifestFile(
+        manifest_path=generated_manifest_entry_file,
+        manifest_length=0,
+        partition_spec_id=0,
+        added_snapshot_id=0,
+        sequence_number=0,
+        partitions=[],
+    )
+    entries = manifest._read_manifest_entries(PyArrowFileIO())
+    entry = entries[0]
+    data_file = entry.data_file
+
+    # The fields of the entries and their data files are kept in slots, and are followed as well
+    assert estimate_size(entry) > estimate_size(data_file) > sum(
+        sys.getsizeof(value) for bounds in (data_file.lower_bounds, data_file.upper_bounds) for value in bounds.values()
+    )
+
+    size = estimate_size(entries)
+    data_file.lower_bounds[2] += b"a" * 1000
+    assert estimate_size(entries) - size == 1000
+
+
+def test_shared_cache_per_subclass() -> None:
+    class ConfiguredCache(SharedCache[str, str]):
+        config_key = "configured-cache-size-bytes"
+        default_max_weight = 10
+        weigher = len
+
+    class DefaultCache(SharedCache[str, str]):
+        config_key = "default-cache-size-bytes"
+        default_max_weight = 10
+        weigher = len
+
+    with mock.patch.dict(os.environ, {"PYICEBERG_CONFIGURED_CACHE_SIZE_BYTES": "3"}):
+        configured = ConfiguredCache.get_or_create()
+        default = DefaultCache.get_or_create()
+
+    assert ConfiguredCache.get_or_create() is configured
+    assert DefaultCache.get_or_create() is default
+    assert configured is not default
+
+    configured.put("a", "aaa")
+    configured.put("b", "bbbb")
+    assert configured.stats() == CacheStats(hits=0, misses=0, evictions=0, entries=1, weight=3)
+    default.put("b", "bbbb")
+    assert default.stats() == CacheStats(hits=0, misses=0, evictions=0, entries=1, weight=4)
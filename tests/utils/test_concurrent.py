@@ -16,13 +16,14 @@
 # under the License.
 
 import os
-from concurrent.futures import ThreadPoolExecutor
-from typing import Dict, Optional
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Iterator, Optional
 from unittest import mock
 
 import pytest
 
-from pyiceberg.utils.concurrent import ExecutorFactory
+from pyiceberg.utils.concurrent import COMMIT_POOL, CPU_POOL, IO_POOL, ExecutorFactory, ExecutorStats, bounded_map
 
 EMPTY_ENV: Dict[str, Optional[str]] = {}
 VALID_ENV = {"PYICEBERG_MAX_WORKERS": "5"}
@@ -36,6 +37,61 @@ def test_create_reused() -> None:
     assert first is second
 
 
+@mock.patch.object(ExecutorFactory, "_instances", {})
+def test_create_per_pool() -> None:
+    io_executor = ExecutorFactory.get_or_create(IO_POOL)
+    assert ExecutorFactory.get_or_create() is io_executor
+    assert ExecutorFactory.get_or_create(CPU_POOL) is not io_executor
+    assert ExecutorFactory.get_or_create(COMMIT_POOL) is not io_executor
+
+    with pytest.raises(ValueError, match="Unknown executor pool: unknown"):
+        ExecutorFactory.get_or_create("unknown")
+
+
+@mock.patch.object(ExecutorFactory, "_instances", {})
+@mock.patch.dict(
+    os.environ, {"PYICEBERG_MAX_WORKERS": "5", "PYICEBERG_CPU_MAX_WORKERS": "2", "PYICEBERG_CPU_EXECUTOR": "process"}
+)
+def test_create_configured_pool() -> None:
+    assert ExecutorFactory.max_workers(IO_POOL) == 5
+    assert ExecutorFactory.max_workers(CPU_POOL) == 2
+
+    executor = ExecutorFactory.get_or_create(CPU_POOL)
+    assert isinstance(executor, ProcessPoolExecutor)
+    assert list(executor.map(abs, [-1, -2, 3])) == [1, 2, 3]
+    executor.shutdown()
+    assert ExecutorFactory.stats()[CPU_POOL] == ExecutorStats(max_workers=2, queued=0, active=0, completed=3)
+
+
+@mock.patch.dict(os.environ, {"PYICEBERG_IO_EXECUTOR": "fibers"})
+def test_backend_invalid() -> None:
+    with pytest.raises(ValueError, match="io-executor should be thread or process. Current value: fibers"):
+        ExecutorFactory.backend(IO_POOL)
+
+
+@mock.patch.object(ExecutorFactory, "_instances", {})
+def test_executor_stats() -> None:
+    started = threading.Event()
+    release = threading.Event()
+
+    def _block() -> None:
+        started.set()
+        release.wait()
+
+    with mock.patch.dict(os.environ, {"PYICEBERG_COMMIT_MAX_WORKERS": "1"}):
+        executor = ExecutorFactory.get_or_create(COMMIT_POOL)
+
+    futures = [executor.submit(_block), executor.submit(lambda: None)]
+    started.wait()
+    assert ExecutorFactory.stats() == {COMMIT_POOL: ExecutorStats(max_workers=1, queued=1, active=1, completed=0)}
+
+    release.set()
+    for future in futures:
+        future.result()
+    executor.shutdown()
+    assert ExecutorFactory.stats() == {COMMIT_POOL: ExecutorStats(max_workers=1, queued=0, active=0, completed=2)}
+
+
 @mock.patch.dict(os.environ, EMPTY_ENV)
 def test_max_workers_none() -> None:
     assert ExecutorFactory.max_workers() is None
@@ -50,3 +106,40 @@ def test_max_workers() -> None:
 def test_max_workers_invalid() -> None:
     with pytest.raises(ValueError):
         ExecutorFactory.max_workers()
+
+
+def test_bounded_map() -> None:
+    consumed = []
+
+    def _items() -> Iterator[int]:
+        for i in range(10):
+            consumed.append(i)
+            yield i
+
+    results = bounded_map(ExecutorFactory.get_or_create(), lambda i: i * 2, _items(), max_in_flight=2)
+    assert consumed == []
+
+    assert next(results) == 0
+    assert consumed == [0, 1]
+
+    assert list(results) == [i * 2 for i in range(1, 10)]
+
+
+def test_bounded_map_close_cancels_pending() -> None:
+    calls = []
+    release = threading.Event()
+
+    def _fn(i: int) -> int:
+        calls.append(i)
+        if i == 1:
+            release.wait()
+        return i
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        results = bounded_map(executor, _fn, range(3), max_in_flight=3)
+        assert next(results) == 0
+        # the third call is queued behind the blocking second call
+        results.close()
+        release.set()
+
+    assert 2 not in calls
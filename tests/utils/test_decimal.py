@@ -14,9 +14,11 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+from decimal import Decimal
+
 import pytest
 
-from pyiceberg.utils.decimal import decimal_required_bytes
+from pyiceberg.utils.decimal import decimal_required_bytes, decimal_to_bytes
 
 
 def test_decimal_required_bytes() -> None:
@@ -38,3 +40,18 @@ def test_decimal_required_bytes() -> None:
     with pytest.raises(ValueError) as exc_info:
         decimal_required_bytes(precision=-1)
     assert "(0, 40]" in str(exc_info.value)
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        (Decimal("0"), b"\x00"),
+        (Decimal("1.27"), b"\x7f"),
+        (Decimal("1.28"), b"\x00\x80"),
+        (Decimal("-1.28"), b"\x80"),
+        (Decimal("-1.29"), b"\xff\x7f"),
+        (Decimal("123.45"), b"\x30\x39"),
+    ],
+)
+def test_decimal_to_bytes(value: Decimal, expected: bytes) -> None:
+    assert decimal_to_bytes(value) == expected
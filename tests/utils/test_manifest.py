@@ -15,22 +15,28 @@
 # specific language governing permissions and limitations
 # under the License.
 # pylint: disable=redefined-outer-name,arguments-renamed,fixme
+import os
+from copy import copy
 from tempfile import TemporaryDirectory
-from typing import Dict, Literal
+from typing import Any, Dict, List, Literal, Optional
+from unittest.mock import patch
 
 import fastavro
 import pytest
 
-from pyiceberg.io import load_file_io
+from pyiceberg.io import InputStream, load_file_io
 from pyiceberg.io.pyarrow import PyArrowFileIO
 from pyiceberg.manifest import (
     DataFile,
     DataFileContent,
     FileFormat,
+    ManifestCache,
     ManifestContent,
+    ManifestEntry,
     ManifestEntryStatus,
     ManifestFile,
     PartitionFieldSummary,
+    _data_file_columns,
     read_manifest_list,
     write_manifest,
     write_manifest_list,
@@ -256,6 +262,75 @@ def test_read_manifest_v1(generated_manifest_file_file_v1: str) -> None:
     assert entry.status == ManifestEntryStatus.ADDED
 
 
+def test_fetch_manifest_entry_is_cached(generated_manifest_file_file_v1: str) -> None:
+    io = load_file_io()
+    snapshot = Snapshot(
+        snapshot_id=25,
+        parent_snapshot_id=19,
+        timestamp_ms=1602638573590,
+        manifest_list=generated_manifest_file_file_v1,
+        summary=Summary(Operation.APPEND),
+        schema_id=3,
+    )
+    cache = ManifestCache.get_or_create()
+    cache.clear()
+
+    manifest = snapshot.manifests(io)[0]
+    entries = manifest.fetch_manifest_entry(io)
+    assert cache.stats().misses == 2
+
+    with patch.object(io, "new_input", side_effect=AssertionError("Should be read from the cache")):
+        assert snapshot.manifests(io)[0] == manifest
+        assert manifest.fetch_manifest_entry(io) == entries
+        assert manifest.fetch_manifest_entry(io, discard_deleted=False) == entries
+
+    stats = cache.stats()
+    assert stats.hits == 3
+    assert stats.entries == 2
+    assert 0 < stats.weight <= cache.max_weight
+
+
+def test_fetch_projected_manifest_entries(generated_manifest_entry_file: str) -> None:
+    manifest = ManifestFile(
+        manifest_path=generated_manifest_entry_file,
+        manifest_length=0,
+        partition_spec_id=0,
+        added_snapshot_id=0,
+        sequence_number=0,
+        partitions=[],
+    )
+    ManifestCache.get_or_create().clear()
+    io = PyArrowFileIO()
+    expected_entries = manifest._read_manifest_entries(io)
+
+    entries = manifest.fetch_projected_manifest_entries(io, ["record_count", "value_counts", "lower_bounds"])
+
+    assert len(entries) == len(expected_entries)
+    for entry, expected_entry in zip(entries, expected_entries):
+        assert entry.status == expected_entry.status
+        assert entry.snapshot_id == expected_entry.snapshot_id
+        assert entry.data_sequence_number == expected_entry.data_sequence_number
+        data_file, expected_data_file = entry.data_file, expected_entry.data_file
+        assert data_file.file_path == expected_data_file.file_path
+        assert data_file.record_count == expected_data_file.record_count
+        assert data_file.spec_id == 0
+        assert data_file.value_counts == expected_data_file.value_counts
+        assert data_file.lower_bounds == expected_data_file.lower_bounds
+        assert not hasattr(data_file, "partition")
+        assert not hasattr(data_file, "upper_bounds")
+
+    # The projected entries are not cached
+    assert ManifestCache.get_or_create().stats().entries == 0
+
+
+def test_fetch_projected_manifest_entries_unknown_field(generated_manifest_entry_file: str) -> None:
+    manifest = ManifestFile(
+        manifest_path=generated_manifest_entry_file, partition_spec_id=0, added_snapshot_id=0, sequence_number=0
+    )
+    with pytest.raises(ValueError, match="Unknown data file fields: bounds"):
+        manifest.fetch_projected_manifest_entries(PyArrowFileIO(), ["file_path", "bounds"])
+
+
 def test_read_manifest_v2(generated_manifest_file_file_v2: str) -> None:
     io = load_file_io()
 
@@ -476,6 +551,274 @@ def test_write_manifest(
         assert data_file.sort_order_id == 0
 
 
+@pytest.mark.parametrize(
+    "block_size_bytes, block_rows, expected_block_sizes",
+    [
+        (1024 * 1024, None, [10]),
+        (1024 * 1024, 4, [4, 4, 2]),
+        (1, None, [1] * 10),
+    ],
+)
+def test_write_manifest_in_blocks(
+    generated_manifest_file_file_v2: str, block_size_bytes: int, block_rows: Optional[int], expected_block_sizes: List[int]
+) -> None:
+    io = load_file_io()
+    snapshot = Snapshot(
+        snapshot_id=25,
+        parent_snapshot_id=19,
+        timestamp_ms=1602638573590,
+        manifest_list=generated_manifest_file_file_v2,
+        summary=Summary(Operation.APPEND),
+        schema_id=3,
+    )
+    demo_manifest_file = snapshot.manifests(io)[0]
+    entry = demo_manifest_file.fetch_manifest_entry(io)[0]
+    test_schema = Schema(
+        NestedField(1, "VendorID", IntegerType(), False), NestedField(2, "tpep_pickup_datetime", IntegerType(), False)
+    )
+    test_spec = PartitionSpec(
+        PartitionField(source_id=1, field_id=1, transform=IdentityTransform(), name="VendorID"),
+        PartitionField(source_id=2, field_id=2, transform=IdentityTransform(), name="tpep_pickup_datetime"),
+        spec_id=demo_manifest_file.partition_spec_id,
+    )
+    with TemporaryDirectory() as tmpdir:
+        tmp_avro_file = tmpdir + "/test_write_manifest_in_blocks.avro"
+        with write_manifest(
+            format_version=2,
+            spec=test_spec,
+            schema=test_schema,
+            output_file=io.new_output(tmp_avro_file),
+            snapshot_id=8744736658442914487,
+            block_size_bytes=block_size_bytes,
+            block_rows=block_rows,
+        ) as writer:
+            for _ in range(10):
+                writer.add_entry(entry)
+        new_manifest = writer.to_manifest_file()
+
+        with open(tmp_avro_file, "rb") as f:
+            assert [block.num_records for block in fastavro.block_reader(f)] == expected_block_sizes
+
+        assert new_manifest.added_files_count == 10
+        assert new_manifest.manifest_length == os.path.getsize(tmp_avro_file)
+        assert [entry.data_file.file_path for entry in new_manifest.fetch_manifest_entry(io)] == [entry.data_file.file_path] * 10
+
+
+@pytest.mark.parametrize("format_version", [1, 2])
+def test_write_delete_manifest(format_version: Literal[1, 2]) -> None:
+    io = load_file_io()
+    test_schema = Schema(NestedField(1, "VendorID", IntegerType(), False))
+    test_spec = PartitionSpec(PartitionField(source_id=1, field_id=1000, transform=IdentityTransform(), name="VendorID"))
+    delete_file = DataFile(
+        content=DataFileContent.POSITION_DELETES,
+        file_path="s3://bucket/00000-0-deletes.parquet",
+        file_format=FileFormat.PARQUET,
+        partition=Record(VendorID=1),
+        record_count=3,
+        file_size_in_bytes=100,
+        column_sizes=None,
+        value_counts=None,
+        null_value_counts=None,
+        nan_value_counts=None,
+        lower_bounds=None,
+        upper_bounds=None,
+        key_metadata=None,
+        split_offsets=None,
+        equality_ids=None,
+        sort_order_id=None,
+    )
+    with TemporaryDirectory() as tmpdir:
+        tmp_avro_file = tmpdir + "/test_write_delete_manifest.avro"
+        if format_version == 1:
+            with pytest.raises(ValueError, match="Cannot write delete manifests for a v1 table"):
+                write_manifest(
+                    format_version=format_version,
+                    spec=test_spec,
+                    schema=test_schema,
+                    output_file=io.new_output(tmp_avro_file),
+                    snapshot_id=1,
+                    content=ManifestContent.DELETES,
+                )
+            return
+
+        with write_manifest(
+            format_version=format_version,
+            spec=test_spec,
+            schema=test_schema,
+            output_file=io.new_output(tmp_avro_file),
+            snapshot_id=1,
+            content=ManifestContent.DELETES,
+        ) as writer:
+            writer.add_entry(
+                ManifestEntry(
+                    status=ManifestEntryStatus.ADDED,
+                    snapshot_id=1,
+                    data_sequence_number=None,
+                    file_sequence_number=None,
+                    data_file=delete_file,
+                )
+            )
+        new_manifest = writer.to_manifest_file()
+
+        with open(tmp_avro_file, "rb") as f:
+            assert fastavro.reader(f).metadata["content"] == "deletes"
+        assert new_manifest.content == ManifestContent.DELETES
+        assert new_manifest.added_rows_count == 3
+        entries = new_manifest.fetch_manifest_entry(io)
+        assert [entry.data_file.content for entry in entries] == [DataFileContent.POSITION_DELETES]
+
+
+def test_fetch_selected_manifest_entries(generated_manifest_file_file_v2: str) -> None:
+    io = load_file_io()
+    snapshot = Snapshot(
+        snapshot_id=25,
+        parent_snapshot_id=19,
+        timestamp_ms=1602638573590,
+        manifest_list=generated_manifest_file_file_v2,
+        summary=Summary(Operation.APPEND),
+        schema_id=3,
+    )
+    demo_manifest_file = snapshot.manifests(io)[0]
+    entry = demo_manifest_file.fetch_manifest_entry(io)[0]
+    test_schema = Schema(
+        NestedField(1, "VendorID", IntegerType(), False), NestedField(2, "tpep_pickup_datetime", IntegerType(), False)
+    )
+    test_spec = PartitionSpec(
+        PartitionField(source_id=1, field_id=1, transform=IdentityTransform(), name="VendorID"),
+        PartitionField(source_id=2, field_id=2, transform=IdentityTransform(), name="tpep_pickup_datetime"),
+        spec_id=demo_manifest_file.partition_spec_id,
+    )
+    cache = ManifestCache.get_or_create()
+    cache.clear()
+    with TemporaryDirectory() as tmpdir:
+        tmp_avro_file = tmpdir + "/test_fetch_selected_manifest_entries.avro"
+        with write_manifest(
+            format_version=2,
+            spec=test_spec,
+            schema=test_schema,
+            output_file=io.new_output(tmp_avro_file),
+            snapshot_id=8744736658442914487,
+            block_rows=4,
+        ) as writer:
+            for pos in range(10):
+                data_file = copy(entry.data_file)
+                data_file.file_path = f"s3://bucket/data-{pos}.parquet"
+                data_file.record_count = pos
+                writer.add_entry(
+                    ManifestEntry(
+                        status=ManifestEntryStatus.DELETED if pos % 3 == 0 else ManifestEntryStatus.ADDED,
+                        snapshot_id=8744736658442914487,
+                        data_sequence_number=1,
+                        file_sequence_number=1,
+                        data_file=data_file,
+                    )
+                )
+        new_manifest = writer.to_manifest_file()
+
+        def select(columns: Dict[str, List[Any]]) -> List[int]:
+            assert len(columns["partition"]) == len(test_spec.fields)
+            return [pos for pos, record_count in enumerate(columns["record_count"]) if record_count not in (5, 7)]
+
+        def file_paths(entries: List[ManifestEntry]) -> List[str]:
+            return [entry.data_file.file_path for entry in entries]
+
+        all_entries = new_manifest.fetch_manifest_entry(io, discard_deleted=False)
+        expected = [all_entries[pos] for pos in select(_data_file_columns([entry.data_file for entry in all_entries]))]
+        cache.clear()
+
+        selected = new_manifest.fetch_selected_manifest_entries(io, select)
+        assert file_paths(selected) == [f"s3://bucket/data-{pos}.parquet" for pos in [1, 2, 4, 8]]
+        assert selected == [entry for entry in expected if entry.status != ManifestEntryStatus.DELETED]
+        assert file_paths(new_manifest.fetch_selected_manifest_entries(io, select, discard_deleted=False)) == file_paths(expected)
+        assert cache.stats().entries == 0
+
+        # When the entries are cached, they are selected from the cache
+        new_manifest.fetch_manifest_entry(io)
+        with patch.object(io, "new_input", side_effect=AssertionError("Should be read from the cache")):
+            assert new_manifest.fetch_selected_manifest_entries(io, select) == selected
+            assert new_manifest.fetch_selected_manifest_entries(io, lambda _: []) == []
+
+
+class _TrackedInputStream:
+    """Keeps track of the number of bytes of each read from the stream."""
+
+    def __init__(self, stream: InputStream, read_sizes: List[int]) -> None:
+        self._stream = stream
+        self._read_sizes = read_sizes
+
+    def read(self, size: Optional[int] = None) -> bytes:
+        data = self._stream.read() if size is None else self._stream.read(size)
+        self._read_sizes.append(len(data))
+        return data
+
+    def close(self) -> None:
+        self._stream.close()
+
+
+def test_read_manifest_entries_a_block_at_a_time(generated_manifest_file_file_v2: str) -> None:
+    io = load_file_io()
+    snapshot = Snapshot(
+        snapshot_id=25,
+        parent_snapshot_id=19,
+        timestamp_ms=1602638573590,
+        manifest_list=generated_manifest_file_file_v2,
+        summary=Summary(Operation.APPEND),
+        schema_id=3,
+    )
+    demo_manifest_file = snapshot.manifests(io)[0]
+    entry = demo_manifest_file.fetch_manifest_entry(io)[0]
+    test_schema = Schema(
+        NestedField(1, "VendorID", IntegerType(), False), NestedField(2, "tpep_pickup_datetime", IntegerType(), False)
+    )
+    test_spec = PartitionSpec(
+        PartitionField(source_id=1, field_id=1, transform=IdentityTransform(), name="VendorID"),
+        PartitionField(source_id=2, field_id=2, transform=IdentityTransform(), name="tpep_pickup_datetime"),
+        spec_id=demo_manifest_file.partition_spec_id,
+    )
+    cache = ManifestCache.get_or_create()
+    with TemporaryDirectory() as tmpdir:
+        tmp_avro_file = tmpdir + "/test_read_manifest_entries_a_block_at_a_time.avro"
+        with write_manifest(
+            format_version=2,
+            spec=test_spec,
+            schema=test_schema,
+            output_file=io.new_output(tmp_avro_file),
+            snapshot_id=8744736658442914487,
+            block_rows=2,
+        ) as writer:
+            for pos in range(10):
+                data_file = copy(entry.data_file)
+                data_file.file_path = f"s3://bucket/data-{pos}.parquet"
+                writer.add_entry(
+                    ManifestEntry(
+                        status=ManifestEntryStatus.ADDED,
+                        snapshot_id=8744736658442914487,
+                        data_sequence_number=1,
+                        file_sequence_number=1,
+                        data_file=data_file,
+                    )
+                )
+        new_manifest = writer.to_manifest_file()
+
+        read_sizes: List[int] = []
+        input_file = io.new_input(tmp_avro_file)
+        open_input = input_file.open
+        with patch.object(input_file, "open", lambda seekable=True: _TrackedInputStream(open_input(seekable), read_sizes)):
+            with patch.object(io, "new_input", return_value=input_file):
+                cache.clear()
+                selected = new_manifest.fetch_selected_manifest_entries(io, lambda columns: [0])
+                assert [entry.data_file.file_path for entry in selected] == [
+                    f"s3://bucket/data-{pos}.parquet" for pos in range(0, 10, 2)
+                ]
+                entries = new_manifest.fetch_manifest_entry(io)
+                assert [entry.data_file.file_path for entry in entries] == [
+                    f"s3://bucket/data-{pos}.parquet" for pos in range(10)
+                ]
+
+        # The file is never read as a whole, but a block at a time
+        assert 0 < max(read_sizes) < len(input_file) / 2
+
+
 @pytest.mark.parametrize("format_version", [1, 2])
 def test_write_manifest_list(
     generated_manifest_file_file_v1: str, generated_manifest_file_file_v2: str, format_version: Literal[1, 2]
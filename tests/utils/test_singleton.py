@@ -14,6 +14,8 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import pickle
+
 from pyiceberg.avro.reader import BooleanReader, FixedReader
 from pyiceberg.transforms import VoidTransform
 
@@ -28,3 +30,10 @@ def test_singleton() -> None:
 def test_singleton_transform() -> None:
     """We want to reuse VoidTransform since it doesn't carry any state"""
     assert id(VoidTransform()) == id(VoidTransform())
+
+
+def test_singleton_pickle() -> None:
+    """Unpickling should return the cached instance, instead of changing the state of another one"""
+    assert pickle.loads(pickle.dumps(FixedReader(22))) is FixedReader(22)
+    assert pickle.loads(pickle.dumps(FixedReader(19))) is FixedReader(19)
+    assert FixedReader(22) != FixedReader(19)